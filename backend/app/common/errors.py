@@ -58,6 +58,17 @@ class ServiceUnavailableError(DomainError):
         )
 
 
+class PayloadTooLargeError(DomainError):
+    """Request body exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(
+            message=f"Upload exceeds the maximum size of {max_bytes} bytes",
+            code="PAYLOAD_TOO_LARGE",
+        )
+
+
 def domain_error_to_http(error: DomainError) -> HTTPException:
     """
     Convert a domain error to an HTTP exception.
@@ -87,6 +98,11 @@ def domain_error_to_http(error: DomainError) -> HTTPException:
             status_code=status.HTTP_409_CONFLICT,
             detail={"message": error.message, "code": error.code},
         )
+    elif isinstance(error, PayloadTooLargeError):
+        return HTTPException(
+            status_code=413,  # name differs between Starlette versions
+            detail={"message": error.message, "code": error.code},
+        )
     elif isinstance(error, ServiceUnavailableError):
         return HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
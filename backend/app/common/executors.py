@@ -0,0 +1,134 @@
+"""
+Executors - Run blocking work off the event loop.
+
+pandas parsing and NumPy scoring hold the CPU for the whole call; run
+inline in a route handler they stall every other request served by the
+same Uvicorn loop. Two lazily created pools take that work:
+
+- ``run_in_thread`` for parsing and other work that mostly waits on
+  I/O or releases the GIL (``pd.read_csv``, ``pd.read_excel``).
+- ``run_in_process`` for heavy CPU work (batch file parsing, geometry
+  simplification, boundary payload builds). Depending on
+  ``executor_cpu_mode`` it uses a process pool (``process``), the thread
+  pool (``thread``) or runs inline (``inline``, for debugging). Functions
+  and arguments sent to a process pool must be picklable.
+- ``run_scoring`` for small numeric jobs such as scoring one year
+  (a 38 x 9 matrix), where pickling and IPC cost more than the work.
+  ``executor_scoring_mode`` picks the executor the same way and
+  defaults to ``inline``.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from app.logging import get_logger
+from app.settings import get_settings
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CPU_MODES = ("process", "thread", "inline")
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """Get the shared thread pool, creating it on first use."""
+    global _thread_pool
+    if _thread_pool is None:
+        workers = max(1, get_settings().executor_thread_workers)
+        _thread_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blocking")
+    return _thread_pool
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        workers = max(1, get_settings().executor_process_workers)
+        # Forking a process with a running loop and driver threads is unsafe
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(f"Started process pool with {workers} workers")
+    return _process_pool
+
+
+def _get_cpu_executor(setting: str = "executor_cpu_mode") -> Optional[Executor]:
+    """Executor for numeric work, or None to run inline."""
+    mode = getattr(get_settings(), setting)
+    if mode == "process":
+        return get_process_pool()
+    if mode == "thread":
+        return get_thread_pool()
+    if mode == "inline":
+        return None
+    raise ValueError(f"Unknown {setting}: {mode}. Supported: {CPU_MODES}")
+
+
+async def run_in_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking call in the shared thread pool.
+
+    Args:
+        func: Function to call
+        *args, **kwargs: Arguments for ``func``
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_thread_pool(), partial(func, *args, **kwargs))
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run CPU-bound work on the executor selected by ``executor_cpu_mode``.
+
+    Args:
+        func: Module-level function to call (must be picklable)
+        *args, **kwargs: Picklable arguments for ``func``
+
+    Returns:
+        The function's return value
+    """
+    executor = _get_cpu_executor()
+    if executor is None:
+        return func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+async def run_scoring(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run small numeric work on the executor selected by ``executor_scoring_mode``.
+
+    Args:
+        func: Module-level function to call (picklable in ``process`` mode)
+        *args, **kwargs: Arguments for ``func``
+
+    Returns:
+        The function's return value
+    """
+    executor = _get_cpu_executor("executor_scoring_mode")
+    if executor is None:
+        return func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+def shutdown_executors() -> None:
+    """Stop both pools; they are recreated if used again."""
+    global _thread_pool, _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+        _process_pool = None
+    if _thread_pool is not None:
+        _thread_pool.shutdown(wait=True, cancel_futures=True)
+        _thread_pool = None
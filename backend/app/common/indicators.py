@@ -0,0 +1,87 @@
+"""
+Indicator codes used by the API.
+Mapping from indicator code to MongoDB collection name, and the
+per-collection scoring configuration.
+"""
+
+COLLECTION_MAPPING = {
+    "gini_ratio": "gini_ratio",
+    "ipm": "indeks_pembangunan_manusia",
+    "tpt": "tingkat_pengangguran_terbuka",
+    "kependudukan": "kependudukan",
+    "pdrb_per_kapita": "pdrb_per_kapita",
+    "ihk": "indeks_harga_konsumen",
+    "inflasi_tahunan": "inflasi_tahunan",
+    "persentase_penduduk_miskin": "persentase_penduduk_miskin",
+    "angkatan_kerja": "angkatan_kerja",
+    "rata_rata_upah_bersih": "rata_rata_upah_bersih",
+}
+
+# Collections scored per year: collection_name -> field to score,
+# direction and display name
+COLLECTION_CONFIGS = {
+    "gini_ratio": {
+        "field": "data_semester_2.total",  # Use semester 2 data (tahunan is null)
+        "lower_is_better": True,
+        "display_name": "Gini Ratio"
+    },
+    "indeks_pembangunan_manusia": {
+        "field": "data",  # Direct float field
+        "lower_is_better": False,
+        "display_name": "Indeks Pembangunan Manusia"
+    },
+    "tingkat_pengangguran_terbuka": {
+        "field": "data.agustus",  # Use August data (tahunan is null)
+        "lower_is_better": True,
+        "display_name": "Tingkat Pengangguran Terbuka"
+    },
+    "persentase_penduduk_miskin": {
+        "field": "data_semester_2.total",  # Use semester 2 data
+        "lower_is_better": True,
+        "display_name": "Persentase Penduduk Miskin"
+    },
+    "pdrb_per_kapita": {
+        "field": "data_ribu_rp",  # PDRB in thousands of rupiah
+        "lower_is_better": False,
+        "display_name": "PDRB Per Kapita"
+    },
+    "rata_rata_upah": {
+        "field": "sektor.total.agustus",  # Total sector, August data (tahunan is null)
+        "lower_is_better": False,
+        "display_name": "Rata-rata Upah Bersih"
+    },
+    "inflasi_tahunan": {
+        "field": "data_bulanan.desember",  # Use December data (tahunan is null)
+        "lower_is_better": True,
+        "display_name": "Inflasi Tahunan"
+    },
+    "indeks_harga_konsumen": {
+        "field": "data_bulanan.desember",  # Use December data (tahunan is null)
+        "lower_is_better": True,
+        "display_name": "Indeks Harga Konsumen"
+    },
+    "angkatan_kerja": {
+        "field": "data_agustus.persentase_bekerja_ak",  # Use August data for labor force participation
+        "lower_is_better": False,
+        "display_name": "Angkatan Kerja (% Bekerja)"
+    }
+}
+
+# data/raw folder -> indicator code, as laid out by the BPS downloads
+RAW_DATA_FOLDERS = {
+    "gini-ratio": "gini_ratio",
+    "indeks-pembangunan-manusia": "ipm",
+    "tingkat-pengangguran-terbuka": "tpt",
+    "angkatan-kerja": "angkatan_kerja",
+    "persentase-penduduk-miskin": "persentase_penduduk_miskin",
+    "indeks-harga-konsumen": "ihk",
+    "inflasi-tahunan": "inflasi_tahunan",
+    "penduduk": "kependudukan",
+    "rata-rata-upah": "rata_rata_upah_bersih",
+    "pdrb": "pdrb_per_kapita",
+}
+
+# Folders with price-basis subfolders; only this one is imported
+RAW_DATA_SUBFOLDERS = {
+    "pdrb": "adhb",
+}
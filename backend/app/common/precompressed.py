@@ -0,0 +1,139 @@
+"""
+Precompressed - Serve static JSON bodies encoded once.
+
+Responses whose content only changes with the data files behind them
+(province boundaries) are serialized and compressed once, then served
+as bytes: a repeat request costs a lookup and a memory copy instead of
+a JSON dump. Each payload carries a strong ETag per content coding so
+clients revalidate with ``If-None-Match`` and get a 304.
+
+brotli is optional; without it clients get gzip.
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Large payloads are built once, so spend the time on the best ratio
+BROTLI_QUALITY = 11
+# Many small payloads built together (one per province) on a cold request
+FAST_BROTLI_QUALITY = 5
+GZIP_LEVEL = 9
+
+
+@dataclass
+class PrecompressedPayload:
+    """A response body with its encodings and ETag."""
+
+    body: bytes
+    media_type: str
+    etag: str
+    encodings: Dict[str, bytes] = field(default_factory=dict)
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Strong ETag of one representation; encodings get their own tag."""
+        if encoding is None:
+            return f'"{self.etag}"'
+        return f'"{self.etag}-{encoding}"'
+
+
+def build_payload(
+    body: bytes,
+    media_type: str = "application/json",
+    brotli_quality: int = BROTLI_QUALITY,
+) -> PrecompressedPayload:
+    """
+    Compress a body with every available coding.
+
+    CPU-heavy for large bodies; run it on the CPU executor.
+
+    Args:
+        body: Encoded response body
+        media_type: Content type of the body
+        brotli_quality: Brotli quality, 0-11 (11 is several times slower than 9)
+
+    Returns:
+        PrecompressedPayload with gzip and, when installed, brotli bodies
+    """
+    encodings = {"gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        encodings["br"] = brotli.compress(body, quality=brotli_quality)
+    etag = hashlib.sha256(body).hexdigest()[:32]
+    return PrecompressedPayload(body=body, media_type=media_type, etag=etag, encodings=encodings)
+
+
+def build_json_payload(content: Any, brotli_quality: int = BROTLI_QUALITY) -> PrecompressedPayload:
+    """Serialize like ``JSONResponse`` and compress the result."""
+    body = json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return build_payload(body, brotli_quality=brotli_quality)
+
+
+def _accepted_encodings(request: Request) -> set:
+    """Codings from Accept-Encoding that the client did not refuse."""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def precompressed_response(
+    request: Request,
+    payload: PrecompressedPayload,
+    cache_control: str,
+    vary: str = "Accept-Encoding",
+) -> Response:
+    """
+    Answer with the best encoding the client accepts, or 304.
+
+    Args:
+        request: Incoming request (Accept-Encoding, If-None-Match)
+        payload: Prebuilt payload
+        cache_control: Cache-Control header value
+        vary: Vary header value, must include Accept-Encoding
+
+    Returns:
+        Response with ETag, Cache-Control and Vary set
+    """
+    accepted = _accepted_encodings(request)
+    encoding = next((e for e in ("br", "gzip") if e in payload.encodings and e in accepted), None)
+    headers = {
+        "ETag": payload.etag_for(encoding),
+        "Cache-Control": cache_control,
+        "Vary": vary,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        known = {payload.etag_for(None), *(payload.etag_for(e) for e in payload.encodings)}
+        if "*" in tags or tags & known:
+            return Response(status_code=304, headers=headers)
+
+    if encoding is None:
+        return Response(content=payload.body, media_type=payload.media_type, headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=payload.encodings[encoding], media_type=payload.media_type, headers=headers)
@@ -43,3 +43,15 @@ PROVINCE_NAMES = {
     "95": "Papua Pegunungan",
     "96": "Papua Barat Daya",
 }
+
+# indonesia-38.json predates the 2022 Papua split: the six Papua features
+# carry the old KODE_PROV (91/92) and are told apart by feature ID.
+# Feature ID -> BPS code used by the provinces collection.
+FEATURE_PROVINCE_CODES = {
+    "91-A": "94",  # Papua
+    "91-B": "95",  # Papua Pegunungan
+    "91-C": "92",  # Papua Selatan
+    "91-D": "93",  # Papua Tengah
+    "92-A": "91",  # Papua Barat
+    "92-B": "96",  # Papua Barat Daya
+}
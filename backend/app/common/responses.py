@@ -0,0 +1,113 @@
+"""
+Responses - orjson-backed JSON rendering and trusted-row shaping.
+
+``FastJSONResponse`` is the application's default response class. It
+renders with orjson and handles the types handlers get back from
+MongoDB, pandas and the scoring engine (ObjectId, datetime, numpy
+scalars and arrays); NaN and infinity become ``null`` instead of
+failing the request.
+
+Handlers returning large lists of rows that came from our own database
+can skip ``response_model`` validation: ``shape_trusted`` gives a row
+the field set and order the model would dump, and returning a
+``FastJSONResponse`` directly bypasses FastAPI's validate/serialize
+pass. The ``response_model`` stays on the route for the OpenAPI schema.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, Optional, Type, get_args
+
+import numpy as np
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# OPT_UTC_Z writes UTC datetimes with "Z" like pydantic does; naive
+# datetimes keep their offset-less form, so OPT_NAIVE_UTC is not set
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    """Convert values orjson does not serialize natively."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact JSON bytes.
+
+    Args:
+        content: JSON-like data, possibly holding ObjectId, datetime or numpy values
+
+    Returns:
+        UTF-8 JSON; non-finite floats are written as null
+    """
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The model type inside ``Model``, ``Optional[Model]`` or ``List[Model]``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        if isinstance(arg, type) and issubclass(arg, BaseModel):
+            return arg
+    return None
+
+
+def shape_trusted(model: Type[BaseModel], row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shape a trusted row like ``model.model_dump()`` without validating it.
+
+    Missing optional fields get their defaults, unknown keys are dropped
+    unless the model allows extras, and nested models are shaped the
+    same way. Values are not coerced; only use this for rows the
+    application wrote itself.
+
+    Args:
+        model: Response model the row would be validated against
+        row: Row as read from MongoDB or built by a service
+
+    Returns:
+        New dict ready for ``FastJSONResponse``
+    """
+    shaped: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+        if key not in row and not field.is_required():
+            shaped[key] = field.get_default(call_default_factory=True)
+            continue
+        value = row[key]
+        nested = _nested_model(field.annotation)
+        if nested is not None and isinstance(value, dict):
+            value = shape_trusted(nested, value)
+        elif nested is not None and isinstance(value, list):
+            value = [shape_trusted(nested, item) if isinstance(item, dict) else item for item in value]
+        shaped[key] = value
+
+    if model.model_config.get("extra") == "allow":
+        for key, value in row.items():
+            if key not in shaped:
+                shaped[key] = value
+    return shaped
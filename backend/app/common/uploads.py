@@ -0,0 +1,162 @@
+"""
+Uploads - Stream multipart uploads to temporary storage.
+
+Uploads are copied in fixed-size chunks instead of ``await file.read()``,
+so memory per upload stays constant regardless of file size. The size
+limit is enforced while chunks arrive and a SHA-256 of the content is
+computed on the way; disk writes run in the thread pool.
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, BinaryIO, Optional
+
+from fastapi import UploadFile
+
+from app.common.errors import PayloadTooLargeError
+from app.common.executors import run_in_thread
+from app.settings import get_settings
+
+# Bytes read from the upload per step
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ReceivedUpload:
+    """
+    An upload copied to temporary storage.
+
+    Uploads received with ``spooled_upload`` expose an open ``file``
+    positioned at the start; ``upload_to_temp_path`` sets ``path`` instead.
+    """
+
+    filename: str
+    size: int
+    sha256: str
+    file: Optional[BinaryIO] = None
+    path: Optional[str] = None
+
+
+def _write_chunk(sink: BinaryIO, digest: "hashlib._Hash", chunk: bytes) -> None:
+    digest.update(chunk)
+    sink.write(chunk)
+
+
+async def _copy_upload(upload: UploadFile, sink: BinaryIO, max_bytes: int) -> tuple[int, str]:
+    """
+    Copy an upload into ``sink`` chunk by chunk.
+
+    Returns:
+        Tuple of (size in bytes, SHA-256 hex digest)
+
+    Raises:
+        PayloadTooLargeError: If the upload exceeds ``max_bytes``
+    """
+    # Starlette knows the size of a parsed part, reject early when it can
+    if upload.size is not None and upload.size > max_bytes:
+        raise PayloadTooLargeError(max_bytes)
+
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise PayloadTooLargeError(max_bytes)
+        await run_in_thread(_write_chunk, sink, digest, chunk)
+
+    await run_in_thread(sink.flush)
+    sink.seek(0)
+    return size, digest.hexdigest()
+
+
+@asynccontextmanager
+async def spooled_upload(
+    upload: UploadFile,
+    max_bytes: Optional[int] = None,
+) -> AsyncIterator[ReceivedUpload]:
+    """
+    Receive an upload into a spooled temporary file.
+
+    Small uploads stay in memory (``upload_spool_bytes``), larger ones
+    spill to disk. The file is closed when the context exits.
+
+    Args:
+        upload: Uploaded file from the request
+        max_bytes: Size limit, ``upload_max_bytes`` if None
+
+    Yields:
+        ReceivedUpload with ``file`` readable from the start
+    """
+    settings = get_settings()
+    max_bytes = max_bytes or settings.upload_max_bytes
+    sink = tempfile.SpooledTemporaryFile(max_size=settings.upload_spool_bytes)
+    try:
+        size, sha256 = await _copy_upload(upload, sink, max_bytes)
+        yield ReceivedUpload(filename=upload.filename or "", size=size, sha256=sha256, file=sink)
+    finally:
+        sink.close()
+
+
+async def save_upload(
+    upload: UploadFile,
+    suffix: str = "",
+    max_bytes: Optional[int] = None,
+) -> ReceivedUpload:
+    """
+    Receive an upload into a named temporary file the caller owns.
+
+    Used when the file outlives the request (e.g. queued imports); the
+    caller deletes ``path`` when done. Nothing is left behind on failure.
+
+    Args:
+        upload: Uploaded file from the request
+        suffix: File name suffix, e.g. the original extension
+        max_bytes: Size limit, ``upload_max_bytes`` if None
+
+    Returns:
+        ReceivedUpload with ``path`` set
+    """
+    max_bytes = max_bytes or get_settings().upload_max_bytes
+    sink = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    try:
+        try:
+            size, sha256 = await _copy_upload(upload, sink, max_bytes)
+        finally:
+            # Closed before use so readers can reopen it on every platform
+            sink.close()
+    except BaseException:
+        os.unlink(sink.name)
+        raise
+    return ReceivedUpload(filename=upload.filename or "", size=size, sha256=sha256, path=sink.name)
+
+
+@asynccontextmanager
+async def upload_to_temp_path(
+    upload: UploadFile,
+    suffix: str = "",
+    max_bytes: Optional[int] = None,
+) -> AsyncIterator[ReceivedUpload]:
+    """
+    Receive an upload into a named temporary file for path-based readers.
+
+    The file is deleted when the context exits.
+
+    Args:
+        upload: Uploaded file from the request
+        suffix: File name suffix, e.g. the original extension
+        max_bytes: Size limit, ``upload_max_bytes`` if None
+
+    Yields:
+        ReceivedUpload with ``path`` set
+    """
+    received = await save_upload(upload, suffix, max_bytes)
+    try:
+        yield received
+    finally:
+        os.unlink(received.path)
@@ -1,5 +1,6 @@
 """Database module initialization."""
 
 from app.db.client import get_database, close_database, ping_database
+from app.db.fanout import fan_out
 
-__all__ = ["get_database", "close_database", "ping_database"]
+__all__ = ["get_database", "close_database", "ping_database", "fan_out"]
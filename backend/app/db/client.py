@@ -19,7 +19,10 @@ async def get_database() -> AsyncIOMotorDatabase:
 
     if _database is None:
         settings = get_settings()
-        _client = AsyncIOMotorClient(settings.mongo_uri)
+        _client = AsyncIOMotorClient(
+            settings.mongo_uri,
+            maxPoolSize=settings.mongo_max_pool_size,
+        )
         _database = _client[settings.mongo_db]
 
     return _database
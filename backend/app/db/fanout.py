@@ -0,0 +1,77 @@
+"""
+Bounded concurrent fan-out for independent MongoDB reads.
+
+Services that need several unrelated reads (one per collection, or the
+current and previous year) issue them together so latency approaches
+the slowest query instead of the sum. A process-wide semaphore keeps
+the number of in-flight fan-out queries below the Motor pool size.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Any, Awaitable, Dict, Mapping
+
+from app.logging import get_logger
+from app.settings import get_settings
+
+logger = get_logger(__name__)
+
+# Semaphores are bound to an event loop, keep one per loop
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_fanout_limit() -> int:
+    """Maximum number of concurrent fan-out queries."""
+    settings = get_settings()
+    return max(1, min(settings.mongo_fanout_limit, settings.mongo_max_pool_size))
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_fanout_limit())
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _timed(label: str, awaitable: Awaitable[Any]) -> Any:
+    """Await one query under the semaphore and log its duration."""
+    async with _get_semaphore():
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= get_settings().mongo_slow_query_ms:
+                logger.warning(f"Slow query {label}: {elapsed_ms:.1f} ms")
+            else:
+                logger.debug(f"Query {label}: {elapsed_ms:.1f} ms")
+
+
+async def fan_out(queries: Mapping[str, Awaitable[Any]]) -> Dict[str, Any]:
+    """
+    Run independent reads concurrently.
+
+    Each awaitable should be a single database read. Do not pass
+    coroutines that call ``fan_out`` themselves: the outer call would
+    hold semaphore slots the inner one waits for.
+
+    Args:
+        queries: Label -> awaitable (e.g. ``collection.distinct("tahun")``).
+                 Labels identify the query in timing logs.
+
+    Returns:
+        Dictionary mapping each label to its result
+
+    Raises:
+        The first exception raised by any query
+    """
+    labels = list(queries)
+    results = await asyncio.gather(
+        *(_timed(label, queries[label]) for label in labels)
+    )
+    return dict(zip(labels, results))
@@ -1,14 +1,77 @@
 """
 Database index definitions.
 Creates indexes at application startup.
+
+Index creation is idempotent, so the bootstrap runs on every start.
+Failures are recorded per index instead of aborting the whole run and
+are reported through ``get_index_status`` on ``/health/full``.
 """
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Union
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
 
+from app.db.client import get_database, ping_database
 from app.logging import get_logger
+from app.common.indicators import COLLECTION_CONFIGS, COLLECTION_MAPPING
 
 logger = get_logger(__name__)
 
+# Per-indicator collections queried by year and province
+INDICATOR_COLLECTIONS = sorted(
+    set(COLLECTION_MAPPING.values()) | set(COLLECTION_CONFIGS)
+)
+
+_index_status: Dict[str, Any] = {
+    "state": "pending",
+    "created": 0,
+    "failed": [],
+    "started_at": None,
+    "completed_at": None,
+}
+
+
+def get_index_status() -> Dict[str, Any]:
+    """
+    Get the result of the last index bootstrap.
+
+    ``state`` is one of pending, building, ok, degraded (some indexes
+    failed), failed (the run itself raised) or skipped (database was
+    unreachable at startup).
+    """
+    return {**_index_status, "failed": list(_index_status["failed"])}
+
+
+async def _ensure_index(
+    collection: AsyncIOMotorCollection,
+    keys: Union[str, List[tuple]],
+    **options: Any,
+) -> None:
+    """Create one index, recording instead of raising on failure."""
+    try:
+        await collection.create_index(keys, **options)
+        _index_status["created"] += 1
+    except PyMongoError as e:
+        logger.warning(f"Index {keys} on {collection.name} failed: {e}")
+        _index_status["failed"].append({
+            "collection": collection.name,
+            "keys": str(keys),
+            "error": str(e),
+        })
+
+
+async def _drop_unique_index(collection: AsyncIOMotorCollection, name: str) -> None:
+    """Drop an index that older releases created as unique."""
+    try:
+        info = await collection.index_information()
+        if info.get(name, {}).get("unique"):
+            await collection.drop_index(name)
+            logger.info(f"Dropped unique index {name} on {collection.name}")
+    except PyMongoError as e:
+        logger.warning(f"Could not drop index {name} on {collection.name}: {e}")
+
 
 async def create_indexes(db: AsyncIOMotorDatabase) -> None:
     """
@@ -18,50 +81,122 @@ async def create_indexes(db: AsyncIOMotorDatabase) -> None:
         db: MongoDB database instance
     """
     logger.info("Creating database indexes...")
+    _index_status.update(
+        state="building",
+        created=0,
+        failed=[],
+        started_at=datetime.now(timezone.utc).isoformat(),
+        completed_at=None,
+    )
+
+    try:
+        await _create_all(db)
+    except Exception as e:
+        _index_status["state"] = "failed"
+        _index_status["failed"].append({"collection": None, "keys": None, "error": str(e)})
+        logger.error(f"Index bootstrap failed: {e}")
+        raise
+    finally:
+        _index_status["completed_at"] = datetime.now(timezone.utc).isoformat()
+
+    _index_status["state"] = "degraded" if _index_status["failed"] else "ok"
+    logger.info(
+        f"Database indexes ready: {_index_status['created']} created, "
+        f"{len(_index_status['failed'])} failed"
+    )
+
+
+async def bootstrap_indexes() -> None:
+    """
+    Provision indexes at application startup.
+
+    Meant to run as a background task so a slow index build does not
+    delay serving requests. Skipped when MongoDB is unreachable.
+    """
+    if not await ping_database():
+        _index_status["state"] = "skipped"
+        logger.warning("Database unreachable, index bootstrap skipped")
+        return
+
+    db = await get_database()
+    try:
+        await create_indexes(db)
+    except Exception:
+        # Already recorded in the index status
+        pass
+
+
+async def _create_all(db: AsyncIOMotorDatabase) -> None:
+    """Create every index definition."""
+    # Per-indicator collections (filtered by year, province and indicator)
+    for name in INDICATOR_COLLECTIONS:
+        await _ensure_index(db[name], "tahun")
+        await _ensure_index(db[name], [("province_id", 1), ("tahun", 1)])
+        await _ensure_index(db[name], [
+            ("province_id", 1),
+            ("tahun", 1),
+            ("indikator", 1)
+        ])
+
+    # Provinces collection (GeoJSON features)
+    await _ensure_index(db.provinces, "properties.id")
+    await _ensure_index(db.provinces, "properties.PROVINSI")
+    await _ensure_index(db.provinces, "KODE_PROV")
 
     # Regions collection
-    await db.regions.create_index("code", unique=True)
-    await db.regions.create_index("bps_code")
-    await db.regions.create_index("name")
+    await _ensure_index(db.regions, "code", unique=True)
+    await _ensure_index(db.regions, "bps_code")
+    await _ensure_index(db.regions, "name")
 
     # Indicators collection
-    await db.indicators.create_index([
+    await _ensure_index(db.indicators, [
         ("region_code", 1),
         ("indicator_key", 1),
         ("year", -1)
     ])
-    await db.indicators.create_index("category")
-    await db.indicators.create_index("year")
-    await db.indicators.create_index("source_id")
+    await _ensure_index(db.indicators, "category")
+    await _ensure_index(db.indicators, "year")
+    await _ensure_index(db.indicators, "source_id")
 
     # Scores collection
-    await db.scores.create_index([
+    await _ensure_index(db.scores, [
         ("region_code", 1),
         ("year", -1)
     ], unique=True)
-    await db.scores.create_index("year")
-    await db.scores.create_index([("composite_score", -1)])
-    await db.scores.create_index("rank")
+    await _ensure_index(db.scores, "year")
+    await _ensure_index(db.scores, [("composite_score", -1)])
+    await _ensure_index(db.scores, "rank")
+
+    # Materialized year-based scores. Rows are upserted by province, so
+    # ranks are briefly duplicated while a year is rewritten.
+    await _drop_unique_index(db.year_scores, "year_1_rank_1")
+    await _ensure_index(db.year_scores, [
+        ("year", 1),
+        ("rank", 1)
+    ])
+    await _ensure_index(db.year_scores, [
+        ("year", 1),
+        ("province_id", 1)
+    ], unique=True)
+    await _ensure_index(db.year_score_status, "year", unique=True)
 
     # Alerts collection
-    await db.alerts.create_index("region_code")
-    await db.alerts.create_index("status")
-    await db.alerts.create_index("severity")
-    await db.alerts.create_index([("created_at", -1)])
-    await db.alerts.create_index([
+    await _ensure_index(db.alerts, "region_code")
+    await _ensure_index(db.alerts, "status")
+    await _ensure_index(db.alerts, "severity")
+    await _ensure_index(db.alerts, [("created_at", -1)])
+    await _ensure_index(db.alerts, [
         ("region_code", 1),
         ("status", 1)
     ])
 
     # Sources collection
-    await db.sources.create_index("name")
-    await db.sources.create_index("download_date")
+    await _ensure_index(db.sources, "name")
+    await _ensure_index(db.sources, "download_date")
 
     # Configs collection
-    await db.configs.create_index("key", unique=True)
+    await _ensure_index(db.configs, "key", unique=True)
 
     # Import batches collection
-    await db.import_batches.create_index([("created_at", -1)])
-    await db.import_batches.create_index("status")
-
-    logger.info("Database indexes created successfully")
+    await _ensure_index(db.import_batches, [("created_at", -1)])
+    await _ensure_index(db.import_batches, "status")
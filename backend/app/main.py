@@ -3,12 +3,19 @@ Regional Gap Analyzer API
 Main FastAPI application entry point.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.settings import get_settings
 from app.db import close_database
+from app.db.indexes import bootstrap_indexes
+from app.common.executors import shutdown_executors
+from app.common.responses import FastJSONResponse
+from app.services.province_resolver import province_resolver
+from app.services.geo_service import geo_service
+from app.services.import_jobs import import_job_queue
 from app.routers import (
     health_router, 
     regions_router,
@@ -39,6 +46,7 @@ from app.routers import (
 )
 from app.routers.imports import router as imports_router
 from app.routers.indicators import router as indicators_router
+from app.routers.geo import router as geo_router
 
 
 @asynccontextmanager
@@ -53,11 +61,33 @@ async def lifespan(app: FastAPI):
     print(f"Debug mode: {settings.debug}")
     print(f"MongoDB: {settings.mongo_db}")
 
+    # Idempotent; progress is reported on /health/full
+    index_task = asyncio.create_task(bootstrap_indexes())
+    # Encode and compress the default boundary payloads in the background
+    geo_task = asyncio.create_task(geo_service.warm())
+
+    try:
+        await province_resolver.warm()
+    except Exception as e:
+        # Lookups load the registry lazily if MongoDB is not reachable yet
+        print(f"Province registry warm-up skipped: {e}")
+
+    try:
+        await import_job_queue.start()
+    except Exception as e:
+        # Started on the first queued import instead
+        print(f"Import workers not started: {e}")
+
     yield
 
     # Shutdown
     print("Shutting down...")
+    for task in (index_task, geo_task):
+        if not task.done():
+            task.cancel()
+    await import_job_queue.stop()
     await close_database()
+    shutdown_executors()
 
 
 def create_app() -> FastAPI:
@@ -71,6 +101,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     # CORS middleware
@@ -115,6 +146,7 @@ def create_app() -> FastAPI:
     # Import router for CSV upload
     app.include_router(imports_router, prefix="/api")
     app.include_router(indicators_router, prefix="/api/v1")
+    app.include_router(geo_router, prefix="/api/v1")
 
     return app
 
@@ -51,7 +51,6 @@ from app.models.gini_ratio import (
     GiniRatioListResponse,
 )
 from app.models.indeks_harga_konsumen import (
-    MonthlyIndexData,
     IndeksHargaKonsumenRecord,
     IndeksHargaKonsumenResponse,
     IndeksHargaKonsumenListResponse,
@@ -62,7 +61,6 @@ from app.models.indeks_pembangunan_manusia import (
     IndeksPembangunanManusiaListResponse,
 )
 from app.models.inflasi_tahunan import (
-    MonthlyInflationData,
     InflasiTahunanRecord,
     InflasiTahunanResponse,
     InflasiTahunanListResponse,
@@ -74,7 +72,6 @@ from app.models.kependudukan import (
     KependudukanListResponse,
 )
 from app.models.pdrb_perkapita import (
-    PdrbPerkapitaData,
     PdrbPerkapitaRecord,
     PdrbPerkapitaResponse,
     PdrbPerkapitaListResponse,
@@ -87,7 +84,6 @@ from app.models.persentase_penduduk_miskin import (
 )
 from app.models.rata_rata_upah import (
     SectorWageData,
-    WageSektor,
     RataRataUpahBersihRecord,
     RataRataUpahBersihResponse,
     RataRataUpahBersihListResponse,
@@ -141,7 +137,6 @@ __all__ = [
     "GiniRatioResponse",
     "GiniRatioListResponse",
     # Indeks Harga Konsumen
-    "MonthlyIndexData",
     "IndeksHargaKonsumenRecord",
     "IndeksHargaKonsumenResponse",
     "IndeksHargaKonsumenListResponse",
@@ -150,7 +145,6 @@ __all__ = [
     "IndeksPembangunanManusiaResponse",
     "IndeksPembangunanManusiaListResponse",
     # Inflasi Tahunan
-    "MonthlyInflationData",
     "InflasiTahunanRecord",
     "InflasiTahunanResponse",
     "InflasiTahunanListResponse",
@@ -160,7 +154,6 @@ __all__ = [
     "KependudukanResponse",
     "KependudukanListResponse",
     # PDRB Per Kapita
-    "PdrbPerkapitaData",
     "PdrbPerkapitaRecord",
     "PdrbPerkapitaResponse",
     "PdrbPerkapitaListResponse",
@@ -171,7 +164,6 @@ __all__ = [
     "PersentasePendudukMiskinListResponse",
     # Rata-rata Upah Bersih
     "SectorWageData",
-    "WageSektor",
     "RataRataUpahBersihRecord",
     "RataRataUpahBersihResponse",
     "RataRataUpahBersihListResponse",
@@ -0,0 +1,24 @@
+"""
+Models for multi-file batch imports.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+
+class BatchImportFile(BaseModel):
+    """One file of a batch manifest, relative to the import data directory."""
+    path: str
+    indicator_code: str
+    year: int
+
+
+class BatchImportRequest(BaseModel):
+    """
+    Server-side batch import manifest.
+
+    Either a ``directory`` laid out like ``data/raw`` (indicator folders
+    with one file per year) or an explicit list of ``files``.
+    """
+    directory: Optional[str] = Field(None, description="Directory relative to the import data directory")
+    files: Optional[List[BatchImportFile]] = None
@@ -22,5 +22,7 @@ class CSVImportResponse(BaseModel):
     success_count: int
     failed_count: int
     failed_rows: List[ImportResult] = []
+    skipped_count: int = 0
+    skipped_rows: List[ImportResult] = []
     imported_at: datetime = Field(default_factory=datetime.utcnow)
     message: str
@@ -0,0 +1,288 @@
+"""
+Batch import - Import many BPS files in one run.
+
+Files are parsed in parallel on the CPU executor, their records are
+merged per target collection and every collection is written with a
+single unordered ``bulk_write``. Year scores are refreshed once per
+touched year at the end, instead of once per file.
+"""
+
+import asyncio
+import os
+import re
+import time
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from app.common import ValidationError
+from app.common.executors import run_in_process, run_in_thread
+from app.common.indicators import COLLECTION_MAPPING, RAW_DATA_FOLDERS, RAW_DATA_SUBFOLDERS
+from app.db import get_database
+from app.logging import get_logger
+from app.pipelines.ingest.bps import BPSIngester
+from app.services.province_resolver import province_resolver
+from app.services.year_based_scoring_service import year_based_scoring_service
+from app.settings import get_settings
+
+logger = get_logger(__name__)
+
+YEAR_PATTERN = re.compile(r"20\d{2}")
+
+SUPPORTED_SUFFIXES = {".csv"}
+
+
+@dataclass
+class BatchFile:
+    """A file to import with its target indicator and year."""
+
+    path: str
+    indicator_code: str
+    year: int
+    name: str
+
+
+def discover_raw_files(root: Path) -> Tuple[List[BatchFile], List[str]]:
+    """
+    Find importable files in a directory laid out like ``data/raw``.
+
+    Indicator folders map through ``RAW_DATA_FOLDERS``; folders with
+    subfolders (PDRB price bases) only use the one in
+    ``RAW_DATA_SUBFOLDERS``. The year is taken from the file name.
+
+    Args:
+        root: Directory to scan recursively
+
+    Returns:
+        Tuple of (files sorted by path, skipped file names with reasons)
+    """
+    files = []
+    skipped = []
+    for path in sorted(root.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in SUPPORTED_SUFFIXES:
+            continue
+        relative = str(path.relative_to(root))
+        parent = path.parent.name
+        grandparent = path.parent.parent.name
+
+        if grandparent in RAW_DATA_SUBFOLDERS:
+            if parent != RAW_DATA_SUBFOLDERS[grandparent]:
+                continue
+            indicator_code = RAW_DATA_FOLDERS.get(grandparent)
+        else:
+            indicator_code = RAW_DATA_FOLDERS.get(parent)
+        if indicator_code is None:
+            skipped.append(f"{relative}: unknown indicator folder")
+            continue
+
+        match = YEAR_PATTERN.search(path.name)
+        if not match:
+            skipped.append(f"{relative}: no year in file name")
+            continue
+
+        files.append(BatchFile(str(path), indicator_code, int(match.group()), relative))
+    return files, skipped
+
+
+def resolve_data_path(relative: str) -> Path:
+    """
+    Resolve a manifest path inside the import data directory.
+
+    Raises:
+        ValidationError: If the path escapes the data directory or is missing
+    """
+    root = Path(get_settings().import_data_dir).resolve()
+    path = (root / relative).resolve()
+    if path != root and root not in path.parents:
+        raise ValidationError(f"Path is outside the import data directory: {relative}", field="path")
+    if not path.exists():
+        raise ValidationError(f"Path not found: {relative}", field="path")
+    return path
+
+
+def extract_archive(archive_path: str, destination: str) -> None:
+    """
+    Extract a zip archive of raw files.
+
+    Raises:
+        ValidationError: If the archive is invalid, too large, or has
+            members that would be written outside ``destination``
+    """
+    max_bytes = get_settings().import_archive_max_bytes
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            members = archive.infolist()
+            if sum(member.file_size for member in members) > max_bytes:
+                raise ValidationError(f"Archive expands beyond {max_bytes} bytes", field="archive")
+            root = os.path.realpath(destination)
+            for member in members:
+                target = os.path.realpath(os.path.join(root, member.filename))
+                if not target.startswith(root + os.sep):
+                    raise ValidationError(f"Unsafe path in archive: {member.filename}", field="archive")
+            archive.extractall(root)
+    except zipfile.BadZipFile as e:
+        raise ValidationError(f"Invalid zip archive: {e}", field="archive")
+
+
+def parse_batch_file(
+    path: str,
+    indicator_code: str,
+    year: int,
+    region_index: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    """Parse one BPS CSV into indicator records (runs on the CPU executor)."""
+    return list(BPSIngester().iter_csv_records(path, indicator_code, year, region_index))
+
+
+async def _write_collection(collection_name: str, records: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Upsert all records of a collection with one unordered bulk_write."""
+    db = await get_database()
+    operations = [
+        UpdateOne(
+            {"province_id": record["province_id"], "tahun": record["tahun"]},
+            {"$set": record},
+            upsert=True,
+        )
+        for record in records
+    ]
+    result = await db[collection_name].bulk_write(operations, ordered=False)
+    return {
+        "records": len(records),
+        "upserted": result.upserted_count,
+        "modified": result.modified_count,
+    }
+
+
+async def run_batch_import(
+    files: List[BatchFile],
+    source_type: str = "file",
+    skipped: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Import many files and return one consolidated report.
+
+    Later files win when several files write the same province and year,
+    matching the outcome of importing them one by one in order.
+
+    Args:
+        files: Files to import, in priority order
+        source_type: Source type recorded in import_logs
+        skipped: Files left out during discovery, echoed in the report
+
+    Returns:
+        Report with per-file and per-collection results and timings
+    """
+    started = time.perf_counter()
+    region_index = await province_resolver.get_index()
+
+    # Stage 1: parse every file in parallel
+    parsed = await asyncio.gather(
+        *(
+            run_in_process(parse_batch_file, f.path, f.indicator_code, f.year, region_index)
+            for f in files
+        ),
+        return_exceptions=True,
+    )
+    parse_seconds = time.perf_counter() - started
+
+    # Stage 2: merge records per collection, last file wins per key
+    now = datetime.utcnow()
+    merged: Dict[str, Dict[Tuple[Any, Any], Dict[str, Any]]] = {}
+    file_reports = []
+    import_logs = []
+    touched_years = set()
+    for batch_file, records in zip(files, parsed):
+        collection_name = COLLECTION_MAPPING.get(batch_file.indicator_code, batch_file.indicator_code)
+        report = {
+            "file": batch_file.name,
+            "indicator_code": batch_file.indicator_code,
+            "year": batch_file.year,
+            "collection": collection_name,
+            "records": 0,
+            "error": None,
+        }
+        file_reports.append(report)
+        if isinstance(records, Exception):
+            report["error"] = str(records)
+            continue
+
+        report["records"] = len(records)
+        source_name = Path(batch_file.name).name
+        by_key = merged.setdefault(collection_name, {})
+        for record in records:
+            record["indikator"] = batch_file.indicator_code
+            record["created_at"] = now
+            record["source_name"] = source_name
+            by_key[(record["province_id"], record["tahun"])] = record
+            touched_years.add(record["tahun"])
+        if records:
+            touched_years.add(batch_file.year)
+            import_logs.append({
+                "name": source_name,
+                "indicator_code": batch_file.indicator_code,
+                "collection": collection_name,
+                "tahun": batch_file.year,
+                "records_count": len(records),
+                "records_processed": len(records),
+                "source_type": source_type,
+                "created_at": now,
+            })
+
+    # Stage 3: one bulk write per collection, collections in parallel
+    write_started = time.perf_counter()
+    names = [name for name, by_key in merged.items() if by_key]
+    written = await asyncio.gather(
+        *(_write_collection(name, list(merged[name].values())) for name in names),
+        return_exceptions=True,
+    )
+    collections = {}
+    errors = [f"{r['file']}: {r['error']}" for r in file_reports if r["error"]]
+    for name, outcome in zip(names, written):
+        if isinstance(outcome, Exception):
+            logger.error(f"Batch write to {name} failed: {outcome}")
+            collections[name] = {"records": len(merged[name]), "error": str(outcome)}
+            errors.append(f"{name}: {outcome}")
+        else:
+            collections[name] = outcome
+    write_seconds = time.perf_counter() - write_started
+
+    # Stage 4: history and materialized scores, once per touched year
+    db = await get_database()
+    if import_logs:
+        await db["import_logs"].insert_many(import_logs)
+    for year in sorted(touched_years):
+        await year_based_scoring_service.refresh_year(year)
+
+    duration = time.perf_counter() - started
+    records_imported = sum(c.get("upserted", 0) + c.get("modified", 0) for c in collections.values())
+    logger.info(
+        f"Batch import: {len(files)} files, {records_imported} records written "
+        f"in {duration:.2f}s"
+    )
+    return {
+        "success": not errors,
+        "files_total": len(files),
+        "files_failed": sum(1 for r in file_reports if r["error"]),
+        "records_processed": sum(r["records"] for r in file_reports),
+        "records_imported": records_imported,
+        "collections": collections,
+        "years_refreshed": sorted(touched_years),
+        "files": file_reports,
+        "skipped": skipped or [],
+        "errors": errors,
+        "parse_seconds": round(parse_seconds, 3),
+        "write_seconds": round(write_seconds, 3),
+        "duration_seconds": round(duration, 3),
+    }
+
+
+async def import_directory(directory: Path, source_type: str = "file") -> Dict[str, Any]:
+    """Discover and import every raw file under ``directory``."""
+    files, skipped = await run_in_thread(discover_raw_files, directory)
+    if not files:
+        raise ValidationError(f"No importable files found in {directory.name or directory}", field="directory")
+    return await run_batch_import(files, source_type=source_type, skipped=skipped)
@@ -0,0 +1 @@
+"""Geographic data pipeline modules."""
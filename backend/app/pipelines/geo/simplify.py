@@ -0,0 +1,211 @@
+"""
+Geo simplification - Precompute lighter province boundaries per zoom level.
+
+``data/geo/indonesia-38.json`` carries survey-grade coastlines that no
+national map needs. This stage runs Douglas-Peucker over the shared arcs
+of the province topology, so a border between two provinces is
+simplified once and both sides stay identical (no gaps or overlaps),
+drops islands and holes smaller than the tolerance and rounds the
+coordinates to the precision of the zoom level.
+
+Run it offline after the source boundaries change:
+
+    python -m app.pipelines.geo.simplify
+
+Variants are written next to the source as
+``simplified/<name>.<resolution>.json``.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.pipelines.geo.topology import Topology, build_topology, ring_area, stitch_ring
+
+# Source geometry, served as is
+FULL_RESOLUTION = "full"
+
+# Resolution -> (Douglas-Peucker tolerance in degrees, coordinate decimals)
+GEO_RESOLUTIONS = {
+    "high": (0.005, 4),
+    "medium": (0.015, 3),
+    "low": (0.03, 3),
+}
+
+SIMPLIFIED_DIR = "simplified"
+
+
+def variant_path(source: Path, resolution: str) -> Path:
+    """Where the variant of ``source`` at ``resolution`` is stored."""
+    return source.parent / SIMPLIFIED_DIR / f"{source.stem}.{resolution}.json"
+
+
+def douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplify a line with the Douglas-Peucker algorithm.
+
+    End points are always kept. Closed lines (first point equal to the
+    last) split at the vertex farthest from the start.
+
+    Args:
+        points: (n, 2) coordinate array
+        tolerance: Largest allowed distance from the original line
+
+    Returns:
+        The kept points, in order
+    """
+    n = len(points)
+    if n <= 2:
+        return points
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start = points[first]
+        inner = points[first + 1:last] - start
+        dx, dy = points[last] - start
+        length = np.hypot(dx, dy)
+        if length == 0:
+            distances = np.hypot(inner[:, 0], inner[:, 1])
+        else:
+            distances = np.abs(dx * inner[:, 1] - dy * inner[:, 0]) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return points[keep]
+
+
+def _round_ring(ring: np.ndarray, decimals: int) -> List[List[float]]:
+    """Round a ring and drop vertices that collapse onto their predecessor."""
+    rounded = np.round(ring, decimals)
+    changed = np.ones(len(rounded), dtype=bool)
+    changed[1:] = np.any(rounded[1:] != rounded[:-1], axis=1)
+    return rounded[changed].tolist()
+
+
+def simplify_topology(
+    topology: Topology,
+    tolerance: float,
+    decimals: int,
+) -> List[Dict[str, Any]]:
+    """
+    Build simplified GeoJSON features from a topology.
+
+    Rings whose area falls below ``tolerance`` squared are dropped, but
+    every feature keeps at least its largest polygon.
+
+    Args:
+        topology: Province topology from ``build_topology``
+        tolerance: Douglas-Peucker tolerance in degrees
+        decimals: Decimal places kept in the output coordinates
+
+    Returns:
+        Features with the same properties and simplified geometry
+    """
+    arcs = [douglas_peucker(arc, tolerance) for arc in topology.arcs]
+    min_area = tolerance ** 2
+
+    features = []
+    for feature, geometry in zip(topology.features, topology.geometries):
+        if geometry is None:
+            features.append(dict(feature))
+            continue
+
+        is_polygon = geometry["type"] == "Polygon"
+        polygons = [geometry["arcs"]] if is_polygon else geometry["arcs"]
+        kept = []
+        largest: Optional[List[np.ndarray]] = None
+        largest_area = -1.0
+        for polygon in polygons:
+            rings = [stitch_ring(arcs, refs) for refs in polygon]
+            valid = [len(r) >= 4 and ring_area(r) >= min_area for r in rings]
+            if valid[0]:
+                kept.append([r for r, ok in zip(rings, valid) if ok])
+            # Fallback so small provinces never disappear entirely
+            original = stitch_ring(topology.arcs, polygon[0])
+            area = ring_area(original)
+            if area > largest_area:
+                largest_area = area
+                largest = [rings[0] if len(rings[0]) >= 4 else original]
+        if not kept and largest is not None:
+            kept = [largest]
+
+        coordinates = [[_round_ring(ring, decimals) for ring in polygon] for polygon in kept]
+        features.append({
+            **feature,
+            "geometry": {
+                "type": geometry["type"],
+                "coordinates": coordinates[0] if is_polygon else coordinates,
+            },
+        })
+    return features
+
+
+def simplify_features(
+    features: List[Dict[str, Any]],
+    resolution: str,
+) -> List[Dict[str, Any]]:
+    """
+    Simplify GeoJSON features to one of ``GEO_RESOLUTIONS``.
+
+    Raises:
+        ValueError: If the resolution is unknown
+    """
+    if resolution not in GEO_RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}. Supported: {list(GEO_RESOLUTIONS)}")
+    tolerance, decimals = GEO_RESOLUTIONS[resolution]
+    return simplify_topology(build_topology(features), tolerance, decimals)
+
+
+def build_variants(source: Path) -> Dict[str, Path]:
+    """
+    Write every resolution variant of a FeatureCollection file.
+
+    Args:
+        source: Full-resolution GeoJSON FeatureCollection
+
+    Returns:
+        Mapping of resolution to written file
+    """
+    with open(source, "r", encoding="utf-8") as f:
+        collection = json.load(f)
+    topology = build_topology(collection["features"])
+
+    written = {}
+    for resolution, (tolerance, decimals) in GEO_RESOLUTIONS.items():
+        path = variant_path(source, resolution)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        variant = {
+            "type": "FeatureCollection",
+            "resolution": resolution,
+            "features": simplify_topology(topology, tolerance, decimals),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(variant, f, separators=(",", ":"))
+        written[resolution] = path
+    return written
+
+
+def main() -> None:
+    default_source = Path(__file__).resolve().parents[4] / "data" / "geo" / "indonesia-38.json"
+    parser = argparse.ArgumentParser(description="Precompute simplified province boundaries")
+    parser.add_argument("--source", type=Path, default=default_source, help="Full-resolution GeoJSON")
+    args = parser.parse_args()
+
+    print(f"{FULL_RESOLUTION:>8}  {args.source.stat().st_size / 1024:8.1f} KB  {args.source}")
+    for resolution, path in build_variants(args.source).items():
+        print(f"{resolution:>8}  {path.stat().st_size / 1024:8.1f} KB  {path}")
+
+
+if __name__ == "__main__":
+    main()
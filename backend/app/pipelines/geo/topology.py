@@ -0,0 +1,157 @@
+"""
+Geo topology - Split province polygons into shared arcs.
+
+Neighbouring provinces repeat every vertex of their common border. Here
+each ring is cut at junctions (vertices where the set of neighbouring
+rings changes) and every border segment is stored once as an arc;
+rings refer to arcs by index, ``~index`` when walked backwards (the
+TopoJSON convention). Anything done to an arc, such as simplification,
+then applies to both sides of a border identically.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+Point = Tuple[float, float]
+
+
+@dataclass
+class Topology:
+    """
+    Province features as shared arcs.
+
+    ``geometries`` holds one entry per feature: None for features
+    without geometry, otherwise a dict with the geometry ``type`` and
+    its ``arcs`` nested like GeoJSON coordinates (polygons of rings of
+    arc references).
+    """
+
+    features: List[Dict[str, Any]]
+    arcs: List[np.ndarray]
+    geometries: List[Optional[Dict[str, Any]]]
+
+
+def _polygons(geometry: Dict[str, Any]) -> List[List[List[Point]]]:
+    """Polygons of a geometry as rings of points without the closing vertex."""
+    coordinates = geometry["coordinates"]
+    polygons = coordinates if geometry["type"] == "MultiPolygon" else [coordinates]
+    result = []
+    for polygon in polygons:
+        rings = []
+        for ring in polygon:
+            points = [(float(x), float(y)) for x, y, *_ in ring]
+            if len(points) > 1 and points[0] == points[-1]:
+                points.pop()
+            if len(points) >= 3:
+                rings.append(points)
+        if rings:
+            result.append(rings)
+    return result
+
+
+def _find_junctions(rings: List[List[Point]]) -> set:
+    """Vertices where neighbouring rings meet or part."""
+    neighbours: Dict[Point, Tuple[Point, Point]] = {}
+    junctions = set()
+    for ring in rings:
+        n = len(ring)
+        for i, point in enumerate(ring):
+            pair = tuple(sorted((ring[i - 1], ring[(i + 1) % n])))
+            seen = neighbours.setdefault(point, pair)
+            if seen != pair:
+                junctions.add(point)
+    return junctions
+
+
+def _cut_ring(ring: List[Point], junctions: set) -> List[List[Point]]:
+    """Split a ring into arcs running from junction to junction."""
+    cuts = [i for i, point in enumerate(ring) if point in junctions]
+    if not cuts:
+        # Rotate to the smallest vertex so shared closed rings compare equal
+        start = ring.index(min(ring))
+        rotated = ring[start:] + ring[:start]
+        return [rotated + [rotated[0]]]
+
+    rotated = ring[cuts[0]:] + ring[:cuts[0]]
+    offsets = [i - cuts[0] for i in cuts] + [len(ring)]
+    closed = rotated + [rotated[0]]
+    return [closed[a:b + 1] for a, b in zip(offsets, offsets[1:])]
+
+
+def build_topology(features: List[Dict[str, Any]]) -> Topology:
+    """
+    Convert GeoJSON features to shared arcs.
+
+    Args:
+        features: Polygon or MultiPolygon features
+
+    Returns:
+        Topology whose arcs cover every ring exactly once
+    """
+    feature_polygons = [
+        _polygons(f["geometry"]) if f.get("geometry") else None
+        for f in features
+    ]
+    junctions = _find_junctions([
+        ring
+        for polygons in feature_polygons if polygons
+        for polygon in polygons
+        for ring in polygon
+    ])
+
+    arcs: List[np.ndarray] = []
+    index: Dict[Tuple[Point, ...], int] = {}
+
+    def arc_ref(points: List[Point]) -> int:
+        key = tuple(points)
+        if key in index:
+            return index[key]
+        reverse = key[::-1]
+        if reverse in index:
+            return ~index[reverse]
+        index[key] = len(arcs)
+        arcs.append(np.array(points, dtype=float))
+        return index[key]
+
+    geometries = []
+    for feature, polygons in zip(features, feature_polygons):
+        if polygons is None:
+            geometries.append(None)
+            continue
+        refs = [
+            [[arc_ref(arc) for arc in _cut_ring(ring, junctions)] for ring in polygon]
+            for polygon in polygons
+        ]
+        if feature["geometry"]["type"] == "Polygon":
+            geometries.append({"type": "Polygon", "arcs": refs[0] if refs else []})
+        else:
+            geometries.append({"type": "MultiPolygon", "arcs": refs})
+
+    return Topology(features=features, arcs=arcs, geometries=geometries)
+
+
+def stitch_ring(arcs: List[np.ndarray], refs: List[int]) -> np.ndarray:
+    """
+    Join the arcs of a ring into one closed coordinate array.
+
+    Args:
+        arcs: Arc coordinates of the topology
+        refs: Arc references of the ring, ``~i`` for reversed arcs
+
+    Returns:
+        (n, 2) array whose first and last rows are equal
+    """
+    parts = []
+    for i, ref in enumerate(refs):
+        arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+        # Consecutive arcs share their end and start vertex
+        parts.append(arc if i == 0 else arc[1:])
+    return np.concatenate(parts)
+
+
+def ring_area(ring: np.ndarray) -> float:
+    """Unsigned planar area of a closed ring (shoelace formula)."""
+    x, y = ring[:, 0], ring[:, 1]
+    return abs(float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))) / 2
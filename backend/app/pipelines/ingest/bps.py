@@ -3,16 +3,69 @@ BPS (Badan Pusat Statistik) data ingester.
 Handles data ingestion from BPS statistical datasets with various formats.
 """
 
-import pandas as pd
-import re
-from typing import Optional, Dict, List, Any
+import csv
+import math
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
 
+from app.common.executors import run_in_thread
 from app.logging import get_logger
+from app.services.province_resolver import (
+    province_resolver,
+    normalize_province_name,
+    normalize_province_names,
+)
 
 logger = get_logger(__name__)
 
+# A CSV given as a file path; uploads are saved to a temp file first
+CsvSource = Union[str, Path]
+
+# Column positions that commonly hold the value in BPS tables
+BPS_VALUE_COLUMNS = (1, 6, 7)
+
+# Placeholders BPS uses for missing values
+BPS_MISSING_VALUES = {"", "-", "..."}
+
+# Aggregate rows that are not provinces
+BPS_AGGREGATE_ROWS = {"INDONESIA", "38 PROVINSI", "TOTAL", ""}
+
+# Fallback data start markers when the registry is not loaded
+DATA_START_PROVINCES = {"ACEH", "SUMATERA UTARA", "DKI JAKARTA", "JAWA BARAT"}
+
+
+def _first_numeric(columns: pd.DataFrame) -> pd.Series:
+    """
+    Return the first numeric cell of every row, in column order.
+
+    Placeholders such as ``-`` or ``...`` and other non-numeric text are
+    treated as missing; rows without any number get NaN.
+    """
+    if columns.shape[1] == 0:
+        return pd.Series(math.nan, index=columns.index, dtype=float)
+    numeric = columns.apply(lambda column: pd.to_numeric(column, errors="coerce")).astype(float)
+    return numeric.bfill(axis=1).iloc[:, 0]
+
+
+def _first_value(cells: List[Any], positions: tuple) -> Optional[float]:
+    """Return the first numeric cell at the given positions."""
+    for col_idx in positions:
+        if col_idx >= len(cells):
+            continue
+        val = cells[col_idx]
+        if val is None or (isinstance(val, str) and val.strip() in BPS_MISSING_VALUES):
+            continue
+        try:
+            value = float(val)
+        except (ValueError, TypeError):
+            continue
+        if not math.isnan(value):
+            return value
+    return None
+
 
 class BPSIngester:
     """Ingester for BPS (Statistics Indonesia) data sources."""
@@ -52,132 +105,122 @@ class BPSIngester:
 
         logger.info(f"Ingesting BPS data from {file_path}")
 
+        region_index = await province_resolver.get_index()
+
         # Read raw CSV to detect format
         if ext == "csv":
-            return await self._parse_bps_csv(file_path, indicator_code, year)
+            return await self._parse_bps_csv(file_path, indicator_code, year, region_index)
         elif ext == "xlsx":
-            df = pd.read_excel(file_path)
-            return self._simple_process(df, indicator_code, year)
-        elif ext == "json":
-            df = pd.read_json(file_path)
-            return self._simple_process(df, indicator_code, year)
+            df = await run_in_thread(pd.read_excel, file_path)
+        else:
+            df = await run_in_thread(pd.read_json, file_path)
+        return await run_in_thread(self._simple_process, df, indicator_code, year, region_index)
 
     async def _parse_bps_csv(
         self,
-        file_path: str,
+        source: CsvSource,
         indicator_code: str,
         year: int,
+        region_index: Dict[str, str],
     ) -> List[Dict[str, Any]]:
         """Parse BPS-style CSV files with multi-row headers."""
-        
-        # Read all lines first
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Detect header format - find the row with province data
-        data_start_row = 0
-        for i, line in enumerate(lines):
-            # Province data starts with province name (ACEH, SUMATERA, etc)
-            first_cell = line.split(',')[0].strip().upper()
-            # Clean prefix like "PROV "
-            first_cell_clean = re.sub(r'^PROV\.?\s*', '', first_cell)
-            if first_cell_clean in self._get_region_mapping():
-                data_start_row = i
-                break
-            # Also check for standard province names with different cases
-            if first_cell_clean in ['ACEH', 'SUMATERA UTARA', 'DKI JAKARTA', 'JAWA BARAT']:
-                data_start_row = i
-                break
-        
-        logger.info(f"Detected data starting at row {data_start_row}")
-        
-        # Read the CSV skipping header rows
-        df = pd.read_csv(file_path, skiprows=data_start_row, header=None)
-        
-        return self._process_bps_dataframe(df, indicator_code, year)
-
-    def _process_bps_dataframe(
+        # The generator reads the source lazily, drain it in the thread pool
+        records = await run_in_thread(list, self.iter_csv_records(source, indicator_code, year, region_index))
+        logger.info(f"Processed {len(records)} records from BPS CSV")
+        return records
+
+    def iter_csv_records(
         self,
-        df: pd.DataFrame,
+        source: CsvSource,
         indicator_code: str,
         year: int,
-    ) -> List[Dict[str, Any]]:
-        """Process BPS dataframe into indicator records."""
-        records = []
+        region_index: Dict[str, str],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream indicator records from a BPS-style CSV in a single pass.
+
+        Header rows are skipped until the first row whose first cell is
+        a known province; from there every row is resolved and yielded
+        as soon as it is read, so large exports are never held in memory.
+
+        Args:
+            source: Path of the CSV file
+            indicator_code: Code for the indicator being imported
+            year: Year of the data
+            region_index: Normalized province name -> province ID
+
+        Yields:
+            Indicator records
+        """
         now = datetime.utcnow()
-        region_mapping = self._get_region_mapping()
-        
-        for _, row in df.iterrows():
-            if pd.isna(row.iloc[0]):
-                continue
-                
-            # Get province name from first column
-            province_raw = str(row.iloc[0]).strip().upper()
-            
-            # Clean common prefixes
-            province_clean = re.sub(r'^PROV\.?\s*', '', province_raw)
-            province_clean = re.sub(r'^KEP\.?\s*', 'KEPULAUAN ', province_clean)
-            province_clean = re.sub(r'^DI\.?\s*', 'DI ', province_clean)
-            province_clean = province_clean.strip()
-            
-            # Skip aggregate rows
-            if province_clean in ['INDONESIA', '38 PROVINSI', 'TOTAL', '']:
-                continue
-            
-            region_code = region_mapping.get(province_clean)
-            if not region_code:
-                # Try partial match
-                for name, code in region_mapping.items():
-                    if name in province_clean or province_clean in name:
-                        region_code = code
-                        break
-            
-            if not region_code:
-                logger.warning(f"Unknown region: {province_clean}")
-                continue
-            
-            # Extract value - prioritize specific columns based on indicator type
-            value = None
-            
-            # Try different column positions for value
-            # Column 1 is often the first data column
-            for col_idx in [1, 6, 7]:  # Common value positions
-                if col_idx < len(row):
-                    val = row.iloc[col_idx]
-                    if not pd.isna(val) and val != '-' and val != '...' and val != '':
-                        try:
-                            value = float(val)
-                            break
-                        except (ValueError, TypeError):
-                            continue
-            
-            if value is None:
-                logger.debug(f"No valid value found for {province_clean}")
-                continue
-            
-            records.append({
-                "province_id": region_code,
-                "indicator_code": indicator_code,
-                "tahun": year,
-                "value": value,
-                "source": self.source_name,
-                "imported_at": now,
-            })
-        
-        logger.info(f"Processed {len(records)} records from BPS CSV")
-        return records
+        # Raw first cell -> province ID (None for skipped rows), so each
+        # distinct name is normalized once even in multi-year exports
+        resolved: Dict[str, Optional[str]] = {}
+        data_started = False
+
+        with open(source, "r", encoding="utf-8-sig", newline="") as stream:
+            for line_no, row in enumerate(csv.reader(stream)):
+                if not row:
+                    continue
+                first_cell = row[0]
+
+                if not data_started:
+                    # Province data starts with province name (ACEH, SUMATERA, etc)
+                    first_cell_clean = normalize_province_name(first_cell)
+                    if first_cell_clean not in region_index and first_cell_clean not in DATA_START_PROVINCES:
+                        continue
+                    data_started = True
+                    logger.info(f"Detected data starting at row {line_no}")
+
+                if first_cell not in resolved:
+                    resolved[first_cell] = self._resolve_region(first_cell, region_index)
+                region_code = resolved[first_cell]
+                if not region_code:
+                    continue
+
+                value = _first_value(row, BPS_VALUE_COLUMNS)
+                if value is None:
+                    logger.debug(f"No valid value found for {first_cell.strip()}")
+                    continue
+
+                yield {
+                    "province_id": region_code,
+                    "indicator_code": indicator_code,
+                    "tahun": year,
+                    "value": value,
+                    "source": self.source_name,
+                    "imported_at": now,
+                }
+
+    @staticmethod
+    def _resolve_region(raw_name: Any, region_index: Dict[str, str]) -> Optional[str]:
+        """Resolve a raw BPS province cell to a province ID, or None to skip."""
+        province_clean = normalize_province_name(raw_name)
+
+        # Skip aggregate rows
+        if province_clean in BPS_AGGREGATE_ROWS:
+            return None
+
+        region_code = region_index.get(province_clean)
+        if not region_code:
+            # Try partial match
+            for name, code in region_index.items():
+                if name in province_clean or province_clean in name:
+                    region_code = code
+                    break
+
+        if not region_code:
+            logger.warning(f"Unknown region: {province_clean}")
+        return region_code
 
     def _simple_process(
         self,
         df: pd.DataFrame,
         indicator_code: str,
         year: int,
+        region_index: Dict[str, str],
     ) -> List[Dict[str, Any]]:
         """Simple processing for standard format files."""
-        records = []
-        now = datetime.utcnow()
-        region_mapping = self._get_region_mapping()
-        
         # Try to find province column
         province_col = None
         for col in df.columns:
@@ -185,90 +228,41 @@ class BPSIngester:
             if 'provinsi' in col_lower or 'province' in col_lower:
                 province_col = col
                 break
-        
+
         if province_col is None and len(df.columns) > 0:
             province_col = df.columns[0]
-        
-        for _, row in df.iterrows():
-            province_raw = str(row[province_col]).strip().upper()
-            province_clean = re.sub(r'^PROV\.?\s*', '', province_raw)
-            
-            if province_clean in ['INDONESIA', 'TOTAL', '']:
-                continue
-            
-            region_code = region_mapping.get(province_clean)
-            if not region_code:
-                continue
-            
-            # Find value column
-            value = None
-            for col in df.columns[1:]:
-                val = row[col]
-                if not pd.isna(val) and val != '-':
-                    try:
-                        value = float(val)
-                        break
-                    except (ValueError, TypeError):
-                        continue
-            
-            if value is None:
-                continue
-            
-            records.append({
+        if province_col is None:
+            return []
+
+        # Aggregate rows (INDONESIA, TOTAL) are not in the index
+        region_codes = normalize_province_names(df[province_col]).map(region_index)
+
+        # Value is the first numeric cell after the first column
+        values = _first_numeric(df.iloc[:, 1:])
+
+        return self._build_records(region_codes, values, indicator_code, year)
+
+    def _build_records(
+        self,
+        region_codes: pd.Series,
+        values: pd.Series,
+        indicator_code: str,
+        year: int,
+    ) -> List[Dict[str, Any]]:
+        """Emit records for rows with both a province ID and a value."""
+        now = datetime.utcnow()
+        keep = region_codes.notna() & values.notna()
+        return [
+            {
                 "province_id": region_code,
                 "indicator_code": indicator_code,
                 "tahun": year,
                 "value": value,
                 "source": self.source_name,
                 "imported_at": now,
-            })
-        
-        return records
-
-    def _get_region_mapping(self) -> Dict[str, str]:
-        """Get mapping from province names to internal IDs."""
-        return {
-            "ACEH": "11",
-            "SUMATERA UTARA": "12",
-            "SUMATERA BARAT": "13",
-            "RIAU": "14",
-            "JAMBI": "15",
-            "SUMATERA SELATAN": "16",
-            "BENGKULU": "17",
-            "LAMPUNG": "18",
-            "KEPULAUAN BANGKA BELITUNG": "19",
-            "KEP. BANGKA BELITUNG": "19",
-            "KEPULAUAN RIAU": "21",
-            "KEP. RIAU": "21",
-            "DKI JAKARTA": "31",
-            "JAWA BARAT": "32",
-            "JAWA TENGAH": "33",
-            "DI YOGYAKARTA": "34",
-            "JAWA TIMUR": "35",
-            "BANTEN": "36",
-            "BALI": "51",
-            "NUSA TENGGARA BARAT": "52",
-            "NUSA TENGGARA TIMUR": "53",
-            "KALIMANTAN BARAT": "61",
-            "KALIMANTAN TENGAH": "62",
-            "KALIMANTAN SELATAN": "63",
-            "KALIMANTAN TIMUR": "64",
-            "KALIMANTAN UTARA": "65",
-            "SULAWESI UTARA": "71",
-            "SULAWESI TENGAH": "72",
-            "SULAWESI SELATAN": "73",
-            "SULAWESI TENGGARA": "74",
-            "GORONTALO": "75",
-            "SULAWESI BARAT": "76",
-            "MALUKU": "81",
-            "MALUKU UTARA": "82",
-            "PAPUA BARAT": "91",
-            "PAPUA": "94",
-            "PAPUA SELATAN": "92",
-            "PAPUA TENGAH": "93",
-            "PAPUA PEGUNUNGAN": "95",
-            "PAPUA BARAT DAYA": "96",
-        }
+            }
+            for region_code, value in zip(region_codes[keep].tolist(), values[keep].tolist())
+        ]
 
 
 # Singleton instance
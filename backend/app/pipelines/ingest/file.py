@@ -7,6 +7,7 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
+from app.common.executors import run_in_thread
 from app.logging import get_logger
 
 logger = get_logger(__name__)
@@ -47,8 +48,9 @@ class FileIngester:
 
         logger.info(f"Ingesting data from {file_path}")
 
-        df = self._read_file(path, ext)
-        records = self._process_with_mapping(df, mapping, metadata or {})
+        # Parsing and conversion block, keep them off the event loop
+        df = await run_in_thread(self._read_file, path, ext)
+        records = await run_in_thread(self._process_with_mapping, df, mapping, metadata or {})
 
         logger.info(f"Ingested {len(records)} records from {path.name}")
         return records
@@ -70,21 +72,33 @@ class FileIngester:
         metadata: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
         """Process dataframe with column mapping."""
-        records = []
         now = datetime.utcnow()
-
-        for _, row in df.iterrows():
-            record = {"imported_at": now, **metadata}
-
-            for output_field, input_column in mapping.items():
-                if input_column in df.columns:
-                    value = row[input_column]
-                    if pd.notna(value):
-                        record[output_field] = value
-
-            records.append(record)
-
-        return records
+        base = {"imported_at": now, **metadata}
+
+        fields = {
+            output_field: input_column
+            for output_field, input_column in mapping.items()
+            if input_column in df.columns
+        }
+        if not fields:
+            return [dict(base) for _ in range(len(df))]
+
+        mapped = pd.DataFrame(
+            {output_field: df[input_column] for output_field, input_column in fields.items()},
+            index=df.index,
+        )
+        rows = mapped.to_dict("records")
+
+        # Missing cells are left out of the record, not stored as NaN
+        present = mapped.notna().to_numpy()
+        if present.all():
+            return [{**base, **row} for row in rows]
+
+        names = list(fields)
+        return [
+            {**base, **{name: row[name] for name, keep in zip(names, row_present) if keep}}
+            for row, row_present in zip(rows, present.tolist())
+        ]
 
     async def validate_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -103,7 +117,7 @@ class FileIngester:
             return {"valid": False, "error": f"Unsupported format: {ext}"}
 
         try:
-            df = self._read_file(path, ext)
+            df = await run_in_thread(self._read_file, path, ext)
             return {
                 "valid": True,
                 "rows": len(df),
@@ -2,10 +2,14 @@
 Pipeline runner - Orchestrates the full data processing pipeline.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.common.indicators import COLLECTION_MAPPING
 from app.pipelines.ingest.bps import bps_ingester
 from app.pipelines.ingest.file import file_ingester
 from app.pipelines.validate.schema import schema_validator
@@ -13,10 +17,14 @@ from app.pipelines.validate.quality import quality_checker
 from app.pipelines.transform.normalize import min_max_normalize
 from app.pipelines.transform.score import score_calculator
 from app.services import imports_service, indicators_service
+from app.services.year_based_scoring_service import year_based_scoring_service
 from app.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Called with (stage, records_processed) as a pipeline run advances
+ProgressCallback = Callable[[str, int], Awaitable[None]]
+
 
 @dataclass
 class PipelineResult:
@@ -185,6 +193,7 @@ async def run_full_pipeline(
     source_type: str = "bps",
     source_name: Optional[str] = None,
     save_to_db: bool = True,
+    progress: Optional[ProgressCallback] = None,
     **kwargs,
 ) -> PipelineResult:
     """
@@ -201,6 +210,7 @@ async def run_full_pipeline(
         source_type: Type of source ("bps", "file")
         source_name: Name of the data source
         save_to_db: Whether to save to database
+        progress: Optional callback notified when a stage starts
         **kwargs: Additional arguments
 
     Returns:
@@ -216,6 +226,8 @@ async def run_full_pipeline(
     )
 
     # Stage 1: Ingestion
+    if progress:
+        await progress("ingestion", 0)
     try:
         if source_type == "bps" or source_type == "file":
             records = await bps_ingester.ingest_from_file(
@@ -247,53 +259,50 @@ async def run_full_pipeline(
 
     # Stage 2: Import to database by indicator collection
     if save_to_db:
+        if progress:
+            await progress("import", final_result.records_processed)
         try:
             from app.db import get_database
-            
-            # Map indicator code to collection name
-            collection_mapping = {
-                "gini_ratio": "gini_ratio",
-                "ipm": "indeks_pembangunan_manusia",
-                "tpt": "tingkat_pengangguran_terbuka",
-                "kependudukan": "kependudukan",
-                "pdrb_per_kapita": "pdrb_per_kapita",
-                "ihk": "indeks_harga_konsumen",
-                "inflasi_tahunan": "inflasi_tahunan",
-                "persentase_penduduk_miskin": "persentase_penduduk_miskin",
-                "angkatan_kerja": "angkatan_kerja",
-                "rata_rata_upah_bersih": "rata_rata_upah_bersih",
-            }
-            
-            collection_name = collection_mapping.get(indicator_code, indicator_code)
+
+            collection_name = COLLECTION_MAPPING.get(indicator_code, indicator_code)
             
             db = await get_database()
             collection = db[collection_name]
             
-            # Insert records
-            inserted_count = 0
+            # Upsert by province_id and tahun; last record wins per key so
+            # unordered writes never race on the same document
+            now = datetime.utcnow()
+            by_key = {}
             for record in records:
-                # Add metadata
                 record["indikator"] = indicator_code
-                record["created_at"] = datetime.utcnow()
+                record["created_at"] = now
                 record["source_name"] = source_name or file_path
-                
-                try:
-                    # Upsert by province_id and tahun
-                    result = await collection.update_one(
-                        {
-                            "province_id": record.get("province_id"),
-                            "tahun": record.get("tahun"),
-                        },
-                        {"$set": record},
-                        upsert=True
-                    )
-                    if result.upserted_id or result.modified_count > 0:
-                        inserted_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to insert record: {e}")
+                by_key[(record.get("province_id"), record.get("tahun"))] = record
+
+            operations = [
+                UpdateOne(
+                    {"province_id": province_id, "tahun": tahun},
+                    {"$set": record},
+                    upsert=True,
+                )
+                for (province_id, tahun), record in by_key.items()
+            ]
+            try:
+                result = await collection.bulk_write(operations, ordered=False)
+                inserted_count = result.upserted_count + result.modified_count
+            except BulkWriteError as e:
+                for error in e.details.get("writeErrors", []):
+                    logger.warning(f"Failed to insert record: {error.get('errmsg')}")
+                inserted_count = e.details.get("nUpserted", 0) + e.details.get("nModified", 0)
             
             final_result.records_imported = inserted_count
             logger.info(f"Imported {inserted_count} records to {collection_name}")
+
+            # Rebuild materialized year scores for every year touched by this file
+            touched_years = {record.get("tahun") for record in records} | {year}
+            for touched_year in touched_years:
+                if touched_year is not None:
+                    await year_based_scoring_service.refresh_year(touched_year)
             
             # Log this import to import_logs for history tracking
             import_log = {
@@ -12,6 +12,10 @@ from app.repositories.scores_repo import (
     ScoresRepository,
     get_scores_repository,
 )
+from app.repositories.year_scores_repo import (
+    YearScoresRepository,
+    get_year_scores_repository,
+)
 from app.repositories.alerts_repo import (
     AlertsRepository,
     get_alerts_repository,
@@ -24,6 +28,10 @@ from app.repositories.configs_repo import (
     ConfigsRepository,
     get_configs_repository,
 )
+from app.repositories.import_batches_repo import (
+    ImportBatchesRepository,
+    get_import_batches_repository,
+)
 
 __all__ = [
     "RegionRepository",
@@ -32,10 +40,14 @@ __all__ = [
     "get_indicators_repository",
     "ScoresRepository",
     "get_scores_repository",
+    "YearScoresRepository",
+    "get_year_scores_repository",
     "AlertsRepository",
     "get_alerts_repository",
     "SourcesRepository",
     "get_sources_repository",
     "ConfigsRepository",
     "get_configs_repository",
+    "ImportBatchesRepository",
+    "get_import_batches_repository",
 ]
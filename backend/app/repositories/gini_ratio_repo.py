@@ -51,21 +51,6 @@ class GiniRatioRepository:
         total = await self.collection.count_documents(query)
         return items, total
 
-    async def get_province_name(self, province_id: str) -> Optional[str]:
-        """Get province name from provinces collection."""
-        try:
-            provinces_collection = self.db["provinces"]
-            province = await provinces_collection.find_one({"properties.id": province_id})
-            if province:
-                if "properties" in province and "PROVINSI" in province["properties"]:
-                    return province["properties"]["PROVINSI"]
-                elif "PROVINSI" in province:
-                    return province["PROVINSI"]
-            return None
-        except Exception as e:
-            print(f"Error getting province name: {e}")
-            return None
-
     # CRUD methods for new CRUD router
     async def find_by_province_and_year(
         self, province_id: str, year: int
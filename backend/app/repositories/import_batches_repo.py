@@ -0,0 +1,73 @@
+"""
+Import batches repository - Data access for queued import jobs.
+
+Each document in ``import_batches`` tracks one uploaded file from the
+moment it is queued until its pipeline run finishes.
+"""
+
+from typing import Optional, List, Dict, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.db import get_database
+from app.common.time import utc_now
+
+
+class ImportBatchesRepository:
+    """Repository for import job operations."""
+
+    COLLECTION_NAME = "import_batches"
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = db[self.COLLECTION_NAME]
+
+    @staticmethod
+    def _to_object_id(job_id: str) -> Optional[ObjectId]:
+        try:
+            return ObjectId(job_id)
+        except (InvalidId, TypeError):
+            return None
+
+    async def create(self, job: Dict[str, Any]) -> str:
+        """Insert a job document and return its ID."""
+        now = utc_now()
+        doc = {**job, "created_at": now, "updated_at": now}
+        result = await self.collection.insert_one(doc)
+        return str(result.inserted_id)
+
+    async def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Set fields on a job document."""
+        await self.collection.update_one(
+            {"_id": ObjectId(job_id)},
+            {"$set": {**fields, "updated_at": utc_now()}},
+        )
+
+    async def find_by_id(self, job_id: str) -> Optional[Dict]:
+        """Get a job by ID, None for unknown or malformed IDs."""
+        object_id = self._to_object_id(job_id)
+        if object_id is None:
+            return None
+        return await self.collection.find_one({"_id": object_id})
+
+    async def find_recent(self, limit: int = 20, status: Optional[str] = None) -> List[Dict]:
+        """Get the most recently created jobs."""
+        query = {"status": status} if status else {}
+        cursor = self.collection.find(query).sort("created_at", -1).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def fail_unfinished(self, statuses: List[str], message: str) -> int:
+        """Mark jobs left in the given statuses as failed."""
+        now = utc_now()
+        result = await self.collection.update_many(
+            {"status": {"$in": statuses}},
+            {"$set": {"status": "failed", "message": message, "finished_at": now, "updated_at": now}},
+        )
+        return result.modified_count
+
+
+async def get_import_batches_repository() -> ImportBatchesRepository:
+    """Factory function to get repository instance."""
+    db = await get_database()
+    return ImportBatchesRepository(db)
@@ -50,18 +50,3 @@ class IndeksPembangunanManusiaRepository:
         items = await cursor.to_list(length=limit)
         total = await self.collection.count_documents(query)
         return items, total
-
-    async def get_province_name(self, province_id: str) -> Optional[str]:
-        """Get province name from provinces collection."""
-        try:
-            provinces_collection = self.db["provinces"]
-            province = await provinces_collection.find_one({"properties.id": province_id})
-            if province:
-                if "properties" in province and "PROVINSI" in province["properties"]:
-                    return province["properties"]["PROVINSI"]
-                elif "PROVINSI" in province:
-                    return province["PROVINSI"]
-            return None
-        except Exception as e:
-            print(f"Error getting province name: {e}")
-            return None
@@ -2,7 +2,6 @@
 Repository for pdrb_perkapita (GDP Per Capita) collection.
 """
 
-from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from bson import ObjectId
 
@@ -80,21 +79,3 @@ class PdrbPerkapitaRepository:
         total = await collection.count_documents(query)
 
         return records, total
-
-    async def get_province_name(self, province_id: str) -> Optional[str]:
-        """Get province name from provinces collection.
-        
-        Args:
-            province_id: Province code
-            
-        Returns:
-            Province name if found, None otherwise
-        """
-        provinces_collection = self.db["provinces"]
-        province = await provinces_collection.find_one({"properties.id": province_id})
-
-        if province:
-            if "properties" in province and "PROVINSI" in province["properties"]:
-                return province["properties"]["PROVINSI"]
-
-        return None
@@ -2,7 +2,6 @@
 Repository for persentase_penduduk_miskin (Poverty Rate) collection.
 """
 
-from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from bson import ObjectId
 
@@ -81,24 +80,6 @@ class PersentasePendudukMiskinRepository:
 
         return records, total
 
-    async def get_province_name(self, province_id: str) -> Optional[str]:
-        """Get province name from provinces collection.
-        
-        Args:
-            province_id: Province code
-            
-        Returns:
-            Province name if found, None otherwise
-        """
-        provinces_collection = self.db["provinces"]
-        province = await provinces_collection.find_one({"properties.id": province_id})
-
-        if province:
-            if "properties" in province and "PROVINSI" in province["properties"]:
-                return province["properties"]["PROVINSI"]
-
-        return None
-
     # CRUD methods for new CRUD router
     async def find_by_province_and_year(self, province_id: str, year: int):
         """Find single record by province_id and year."""
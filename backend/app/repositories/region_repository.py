@@ -19,8 +19,13 @@ class RegionRepository:
         self.db = db
         self.collection = db[self.COLLECTION_NAME]
 
+    @staticmethod
+    def _projection(include_geometry: bool) -> Optional[dict]:
+        # Stored geometry is full resolution, skip it unless asked for
+        return None if include_geometry else {"geometry": 0}
+
     async def find_all(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, include_geometry: bool = True
     ) -> tuple[list[dict], int]:
         """
         Find all regions with pagination.
@@ -28,18 +33,19 @@ class RegionRepository:
         Args:
             skip: Number of documents to skip
             limit: Maximum documents to return
+            include_geometry: Whether to read the stored geometry
 
         Returns:
             Tuple of (list of regions, total count)
         """
-        cursor = self.collection.find().skip(skip).limit(limit)
+        cursor = self.collection.find({}, self._projection(include_geometry)).skip(skip).limit(limit)
         regions = await cursor.to_list(length=limit)
         total = await self.collection.count_documents({})
         return regions, total
 
-    async def find_by_code(self, code: str) -> Optional[dict]:
+    async def find_by_code(self, code: str, include_geometry: bool = True) -> Optional[dict]:
         """Find a region by its KODE_PROV (BPS province code)."""
-        return await self.collection.find_one({"KODE_PROV": code})
+        return await self.collection.find_one({"KODE_PROV": code}, self._projection(include_geometry))
 
     async def find_by_id(self, region_id: str) -> Optional[dict]:
         """Find a region by its id field (not MongoDB _id)."""
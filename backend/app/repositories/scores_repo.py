@@ -5,6 +5,7 @@ Scores repository - Data access for computed scores.
 from typing import Optional, List, Dict
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from pymongo import UpdateOne
 
 from app.db import get_database
 from app.common.time import utc_now
@@ -82,19 +83,47 @@ class ScoresRepository:
         doc = await self.find_by_region_and_year(region_code, year)
         return str(doc["_id"]) if doc else ""
 
+    async def bulk_upsert(self, year: int, scores: List[Dict]) -> int:
+        """
+        Create or update every score of a year in one bulk_write.
+
+        Args:
+            year: Year of the scores
+            scores: Score documents, each with a region_code
+
+        Returns:
+            Number of scores upserted or modified
+        """
+        if not scores:
+            return 0
+        computed_at = utc_now()
+        operations = [
+            UpdateOne(
+                {"region_code": score["region_code"], "year": year},
+                {"$set": {**score, "year": year, "computed_at": computed_at}},
+                upsert=True,
+            )
+            for score in scores
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count
+
     async def update_ranks(self, year: int, rankings: List[Dict]) -> int:
         """Bulk update ranks for a year."""
-        updated = 0
-        for rank_data in rankings:
-            result = await self.collection.update_one(
+        if not rankings:
+            return 0
+        operations = [
+            UpdateOne(
                 {"region_code": rank_data["region_code"], "year": year},
                 {"$set": {
                     "rank": rank_data["rank"],
                     "rank_delta": rank_data.get("rank_delta"),
                 }},
             )
-            updated += result.modified_count
-        return updated
+            for rank_data in rankings
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return result.modified_count
 
     async def delete_by_year(self, year: int) -> int:
         """Delete all scores for a year."""
@@ -0,0 +1,99 @@
+"""
+Year scores repository - Data access for materialized year-based scores.
+
+Rows in ``year_scores`` are rebuilt per year by the import pipeline.
+``year_score_status`` keeps one watermark document per year so readers
+can tell whether the materialized rows predate the latest data write.
+"""
+
+from typing import Optional, List, Dict
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne
+
+from app.db import get_database
+from app.common.time import utc_now
+
+
+class YearScoresRepository:
+    """Repository for materialized year score operations."""
+
+    COLLECTION_NAME = "year_scores"
+    STATUS_COLLECTION_NAME = "year_score_status"
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = db[self.COLLECTION_NAME]
+        self.status_collection = db[self.STATUS_COLLECTION_NAME]
+
+    async def find_by_year(self, year: int) -> List[Dict]:
+        """Get all materialized rows for a year ordered by rank."""
+        cursor = self.collection.find({"year": year}, {"_id": 0}).sort("rank", 1)
+        return await cursor.to_list(length=None)
+
+    async def find_by_province_and_year(
+        self, province_id: str, year: int
+    ) -> Optional[Dict]:
+        """Get the materialized row for one province and year."""
+        return await self.collection.find_one(
+            {"year": year, "province_id": province_id}, {"_id": 0}
+        )
+
+    async def replace_year(self, year: int, rows: List[Dict]) -> int:
+        """
+        Replace every materialized row of a year.
+
+        Rows are upserted by (year, province_id) and provinces missing
+        from ``rows`` are deleted afterwards, so concurrent readers never
+        see the year empty or half-inserted.
+
+        Args:
+            year: Year being materialized
+            rows: Ranked score rows for the year
+
+        Returns:
+            Number of rows written
+        """
+        if rows:
+            await self.collection.bulk_write(
+                [
+                    ReplaceOne(
+                        {"year": year, "province_id": row["province_id"]},
+                        dict(row),
+                        upsert=True,
+                    )
+                    for row in rows
+                ],
+                ordered=False,
+            )
+        await self.collection.delete_many({
+            "year": year,
+            "province_id": {"$nin": [row["province_id"] for row in rows]},
+        })
+        return len(rows)
+
+    async def mark_data_updated(self, year: int) -> None:
+        """Record that indicator data for a year changed."""
+        await self.status_collection.update_one(
+            {"year": year},
+            {"$set": {"data_updated_at": utc_now()}},
+            upsert=True,
+        )
+
+    async def mark_computed(self, year: int, computed_at: datetime) -> None:
+        """Record when the materialized rows of a year were rebuilt."""
+        await self.status_collection.update_one(
+            {"year": year},
+            {"$set": {"computed_at": computed_at}},
+            upsert=True,
+        )
+
+    async def get_status(self, year: int) -> Optional[Dict]:
+        """Get the watermark document of a year."""
+        return await self.status_collection.find_one({"year": year}, {"_id": 0})
+
+
+async def get_year_scores_repository() -> YearScoresRepository:
+    """Factory function to get repository instance."""
+    db = await get_database()
+    return YearScoresRepository(db)
@@ -15,6 +15,8 @@ from app.models.angkatan_kerja import (
     AngkatanKerjaResponse,
 )
 from app.models.csv_import import CSVImportResponse
+from app.common.errors import PayloadTooLargeError, domain_error_to_http
+from app.common.uploads import spooled_upload
 
 router = APIRouter(prefix="/angkatan-kerja", tags=["Angkatan Kerja"])
 
@@ -48,8 +50,11 @@ async def import_csv(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    return await AngkatanKerjaImportService.import_csv(content, tahun)
+    try:
+        async with spooled_upload(file) as upload:
+            return await AngkatanKerjaImportService.import_csv(upload.file, tahun)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
 
 @router.post(
@@ -3,47 +3,108 @@ Geo router - API endpoints for geographic data.
 """
 
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 
+from app.common.errors import DomainError, domain_error_to_http
+from app.common.precompressed import precompressed_response
+from app.pipelines.geo.topojson import TOPOJSON_MEDIA_TYPE
 from app.services import geo_service
+from app.services.geo_service import MAP_RESOLUTION, PROVINCE_RESOLUTION
+from app.settings import get_settings
 
 router = APIRouter(prefix="/geo", tags=["Geographic Data"])
 
+RESOLUTION_DESCRIPTION = "Boundary detail: full, high, medium or low"
+
+
+def _boundary_cache_control() -> str:
+    return f"public, max-age={get_settings().geo_cache_max_age}"
+
 
 @router.get("/provinces")
-async def get_provinces_geojson():
+async def get_provinces_geojson(
+    request: Request,
+    resolution: str = Query(MAP_RESOLUTION, description=RESOLUTION_DESCRIPTION),
+):
     """
     Get base GeoJSON for all Indonesian provinces.
+
+    The default ``low`` resolution is sized for a national map. Send
+    ``Accept: application/topo+json`` to get quantized TopoJSON instead,
+    with the provinces in ``objects.provinces``.
+
+    Bodies are pre-encoded and served gzip or brotli compressed, with an
+    ETag for ``If-None-Match`` revalidation.
     """
-    geojson = await geo_service.get_geojson()
-    return JSONResponse(content=geojson)
+    try:
+        if TOPOJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+            payload = await geo_service.get_topojson_payload(resolution)
+        else:
+            payload = await geo_service.get_geojson_payload(resolution)
+    except DomainError as e:
+        raise domain_error_to_http(e)
+    return precompressed_response(
+        request, payload, _boundary_cache_control(), vary="Accept, Accept-Encoding"
+    )
 
 
 @router.get("/choropleth")
 async def get_choropleth_data(
     year: Optional[int] = Query(None, description="Year (latest if not specified)"),
     metric: str = Query("composite_score", description="Metric to display"),
+    resolution: str = Query(MAP_RESOLUTION, description=RESOLUTION_DESCRIPTION),
 ):
     """
     Get GeoJSON with score data for choropleth map visualization.
     """
-    choropleth = await geo_service.get_choropleth_data(year=year, metric=metric)
+    try:
+        choropleth = await geo_service.get_choropleth_data(
+            year=year, metric=metric, resolution=resolution
+        )
+    except DomainError as e:
+        raise domain_error_to_http(e)
     return JSONResponse(content=choropleth)
 
 
+@router.get("/overlay")
+async def get_score_overlay(
+    year: Optional[int] = Query(None, description="Year (latest if not specified)"),
+    metric: str = Query("composite_score", description="composite_score or a collection name"),
+):
+    """
+    Get scores per province code without geometry.
+
+    Fetch ``/geo/provinces`` once and join this overlay on
+    ``properties.code`` (the BPS code, not the feature ID; the split
+    Papua provinces have IDs like ``91-A`` but codes 91-96) when
+    switching years or metrics.
+    """
+    try:
+        return await geo_service.get_score_overlay(year=year, metric=metric)
+    except DomainError as e:
+        raise domain_error_to_http(e)
+
+
 @router.get("/province/{region_code}")
-async def get_province_boundary(region_code: str):
+async def get_province_boundary(
+    request: Request,
+    region_code: str,
+    resolution: str = Query(PROVINCE_RESOLUTION, description=RESOLUTION_DESCRIPTION),
+):
     """
     Get GeoJSON feature for a specific province.
     """
-    feature = await geo_service.get_region_boundary(region_code)
-    if not feature:
+    try:
+        payload = await geo_service.get_region_payload(region_code, resolution)
+    except DomainError as e:
+        raise domain_error_to_http(e)
+    if not payload:
         raise HTTPException(
             status_code=404,
             detail=f"Province {region_code} not found",
         )
-    return JSONResponse(content=feature)
+    return precompressed_response(request, payload, _boundary_cache_control())
 
 
 @router.get("/color-scale")
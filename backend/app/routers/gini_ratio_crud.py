@@ -14,6 +14,8 @@ from app.models.gini_ratio_model import (
     GiniRatioResponse,
 )
 from app.models.csv_import import CSVImportResponse
+from app.common.errors import PayloadTooLargeError, domain_error_to_http
+from app.common.uploads import spooled_upload
 
 router = APIRouter(prefix="/gini-ratio", tags=["Gini Ratio"])
 
@@ -64,8 +66,11 @@ async def import_csv(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    return await GiniRatioImportService.import_csv(content, tahun)
+    try:
+        async with spooled_upload(file) as upload:
+            return await GiniRatioImportService.import_csv(upload.file, tahun)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
 
 @router.post(
@@ -4,10 +4,12 @@ Provides endpoints for monitoring application health.
 """
 
 from datetime import datetime, timezone
+from typing import Any, Dict
 from fastapi import APIRouter
 from pydantic import BaseModel
 
 from app.db import ping_database
+from app.db.indexes import get_index_status
 
 router = APIRouter(tags=["Health"])
 
@@ -32,6 +34,7 @@ class HealthDetailedResponse(BaseModel):
     database: str
     version: str
     timestamp: str
+    indexes: Dict[str, Any]
 
 
 @router.get(
@@ -70,12 +73,12 @@ async def health_check_detailed() -> HealthResponse:
     "/health/full",
     response_model=HealthDetailedResponse,
     summary="Full health check with metadata",
-    description="Returns complete health status with version and timestamp.",
+    description="Returns complete health status with version, timestamp and index status.",
 )
 async def health_check_full() -> HealthDetailedResponse:
     """
-    Full health check with version info and timestamp.
-    Useful for monitoring and debugging.
+    Full health check with version info, timestamp and index
+    bootstrap status. Useful for monitoring and debugging.
     """
     db_healthy = await ping_database()
 
@@ -84,4 +87,5 @@ async def health_check_full() -> HealthDetailedResponse:
         database="connected" if db_healthy else "disconnected",
         version="0.1.0",
         timestamp=datetime.now(timezone.utc).isoformat(),
+        indexes=get_index_status(),
     )
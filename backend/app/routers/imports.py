@@ -2,13 +2,26 @@
 Imports router - API endpoints for data import operations.
 """
 
+from pathlib import Path
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File, Form
-import tempfile
 import os
+import tempfile
 
+from app.common.errors import DomainError, PayloadTooLargeError, domain_error_to_http
+from app.common.executors import run_in_thread
+from app.common.uploads import save_upload, upload_to_temp_path
+from app.models.batch_import import BatchImportRequest
+from app.services.import_jobs import import_job_queue
 from app.services import imports_service
 from app.pipelines import run_full_pipeline, run_validation
+from app.pipelines.batch_import import (
+    BatchFile,
+    extract_archive,
+    import_directory,
+    resolve_data_path,
+    run_batch_import,
+)
 
 router = APIRouter(prefix="/imports", tags=["Data Import"])
 
@@ -35,44 +48,112 @@ async def import_from_file(
             detail=f"Unsupported file type: {ext}. Allowed: {allowed_extensions}",
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    try:
+        # Stream the upload to a temp file; deleted when the block exits
+        async with upload_to_temp_path(file, suffix=ext) as upload:
+            # Run the import pipeline
+            result = await run_full_pipeline(
+                file_path=upload.path,
+                indicator_code=indicator_code,
+                year=year,
+                source_type=source_type,
+                source_name=source_name or file.filename,
+                save_to_db=True,
+            )
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
+
+    if not result.success:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": result.message,
+                "errors": result.errors,
+                "warnings": result.warnings,
+            },
+        )
+
+    return {
+        "success": True,
+        "message": result.message,
+        "records_processed": result.records_processed,
+        "records_imported": result.records_imported,
+        "duration_seconds": result.duration_seconds,
+        "size_bytes": upload.size,
+        "sha256": upload.sha256,
+    }
+
+
+@router.post("/jobs", status_code=202)
+async def enqueue_import(
+    file: UploadFile = File(...),
+    indicator_code: str = Form(...),
+    year: int = Form(...),
+    source_name: Optional[str] = Form(None),
+    source_type: str = Form("file"),
+):
+    """
+    Queue an uploaded file for import and return immediately.
+
+    Poll ``GET /imports/jobs/{job_id}`` for progress and the outcome.
+    """
+    allowed_extensions = {".csv", ".xlsx", ".xls", ".json"}
+    ext = os.path.splitext(file.filename)[1].lower()
+    if ext not in allowed_extensions:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type: {ext}. Allowed: {allowed_extensions}",
+        )
+
+    try:
+        upload = await save_upload(file, suffix=ext)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
     try:
-        # Run the import pipeline
-        result = await run_full_pipeline(
-            file_path=tmp_path,
+        job_id = await import_job_queue.enqueue(
+            file_path=upload.path,
             indicator_code=indicator_code,
             year=year,
             source_type=source_type,
             source_name=source_name or file.filename,
-            save_to_db=True,
+            upload={"filename": upload.filename, "size_bytes": upload.size, "sha256": upload.sha256},
         )
+    except DomainError as e:
+        os.unlink(upload.path)
+        raise domain_error_to_http(e)
+    except Exception:
+        os.unlink(upload.path)
+        raise
 
-        if not result.success:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": result.message,
-                    "errors": result.errors,
-                    "warnings": result.warnings,
-                },
-            )
+    return {
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": f"/api/imports/jobs/{job_id}",
+    }
 
-        return {
-            "success": True,
-            "message": result.message,
-            "records_processed": result.records_processed,
-            "records_imported": result.records_imported,
-            "duration_seconds": result.duration_seconds,
-        }
 
-    finally:
-        # Clean up temp file
-        os.unlink(tmp_path)
+@router.get("/jobs")
+async def list_import_jobs(
+    status: Optional[str] = Query(None, description="Filter by job status"),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """List recent import jobs, newest first."""
+    return {"jobs": await import_job_queue.list_jobs(limit=limit, status=status)}
+
+
+@router.get("/jobs/{job_id}")
+async def get_import_job(job_id: str):
+    """
+    Get the status of a queued import.
+
+    ``status`` is one of queued, running, completed or failed; while
+    running, ``stage`` and ``records_processed`` report progress.
+    """
+    job = await import_job_queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
 
 
 @router.post("/validate")
@@ -93,19 +174,73 @@ async def validate_import_file(
             detail=f"Unsupported file type: {ext}",
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    from app.pipelines.ingest.file import file_ingester
+
+    try:
+        async with upload_to_temp_path(file, suffix=ext) as upload:
+            validation = await file_ingester.validate_file(upload.path)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
+
+    validation["size_bytes"] = upload.size
+    validation["sha256"] = upload.sha256
+    return validation
 
+
+@router.post("/archive")
+async def import_archive(
+    file: UploadFile = File(...),
+    source_type: str = Form("file"),
+):
+    """
+    Import every raw file in a zip archive with one request.
+
+    The archive is laid out like ``data/raw``: one folder per indicator
+    with the year in each file name. Files are parsed in parallel and
+    each collection is written with a single bulk operation.
+    """
+    if os.path.splitext(file.filename)[1].lower() != ".zip":
+        raise HTTPException(status_code=400, detail="Archive must be a .zip file")
+
+    try:
+        async with upload_to_temp_path(file, suffix=".zip") as upload:
+            with tempfile.TemporaryDirectory(prefix="batch-import-") as directory:
+                await run_in_thread(extract_archive, upload.path, directory)
+                report = await import_directory(Path(directory), source_type=source_type)
+    except DomainError as e:
+        raise domain_error_to_http(e)
+
+    report["size_bytes"] = upload.size
+    report["sha256"] = upload.sha256
+    return report
+
+
+@router.post("/directory")
+async def import_data_directory(request: BatchImportRequest):
+    """
+    Import files already on the server with one request.
+
+    Takes a ``directory`` laid out like ``data/raw`` or an explicit list
+    of ``files``; paths are relative to the import data directory.
+    """
     try:
-        from app.pipelines.ingest.file import file_ingester
-        validation = await file_ingester.validate_file(tmp_path)
-        return validation
+        if request.files:
+            files = [
+                BatchFile(
+                    path=str(resolve_data_path(f.path)),
+                    indicator_code=f.indicator_code,
+                    year=f.year,
+                    name=f.path,
+                )
+                for f in request.files
+            ]
+            return await run_batch_import(files)
+        if request.directory:
+            return await import_directory(resolve_data_path(request.directory))
+    except DomainError as e:
+        raise domain_error_to_http(e)
 
-    finally:
-        os.unlink(tmp_path)
+    raise HTTPException(status_code=400, detail="Provide either directory or files")
 
 
 @router.post("/batch")
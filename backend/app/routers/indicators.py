@@ -1,25 +1,14 @@
 from fastapi import APIRouter, HTTPException, Query, Body
 from typing import List, Dict, Optional, Any
 from app.db import get_database
+from app.common.indicators import COLLECTION_MAPPING
+from app.common.responses import FastJSONResponse
+from app.services.province_resolver import province_resolver
+from app.services.year_based_scoring_service import year_based_scoring_service
 from datetime import datetime
 
 router = APIRouter()
 
-COLLECTION_MAPPING = {
-    "gini_ratio": "gini_ratio",
-    "ipm": "indeks_pembangunan_manusia",
-    "tpt": "tingkat_pengangguran_terbuka",
-    "kependudukan": "kependudukan",
-    "pdrb_per_kapita": "pdrb_per_kapita",
-    "ihk": "indeks_harga_konsumen",
-    "inflasi_tahunan": "inflasi_tahunan",
-    "persentase_penduduk_miskin": "persentase_penduduk_miskin",
-    "angkatan_kerja": "angkatan_kerja",
-    "rata_rata_upah_bersih": "rata_rata_upah_bersih",
-}
-
-from app.common.provinces import PROVINCE_NAMES
-
 @router.get("/{indicator_code}")
 async def list_indicator_data(
     indicator_code: str,
@@ -46,6 +35,9 @@ async def list_indicator_data(
     total = await collection.count_documents(query)
 
     # Convert ObjectId to string and enrich with province name
+    province_names = await province_resolver.get_names(
+        str(item.get("province_id", "")) for item in items
+    )
     data = []
     for item in items:
         item["_id"] = str(item["_id"])
@@ -53,16 +45,17 @@ async def list_indicator_data(
         # Enrich province name if missing
         if "province_name" not in item:
              pid = str(item.get("province_id", ""))
-             item["province_name"] = PROVINCE_NAMES.get(pid, f"Unknown ({pid})")
+             item["province_name"] = province_names.get(pid, f"Unknown ({pid})")
              
         data.append(item)
 
-    return {
+    # Documents are ours; render them directly instead of via jsonable_encoder
+    return FastJSONResponse({
         "data": data,
         "total": total,
         "page": (skip // limit) + 1,
         "page_size": limit,
-    }
+    })
 
 @router.put("/{indicator_code}/{province_id}/{tahun}")
 async def update_indicator_data(
@@ -99,6 +92,7 @@ async def update_indicator_data(
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Data not found")
 
+    await year_based_scoring_service.refresh_year(tahun)
     return {"message": "Data updated successfully", "success": True}
 
 @router.delete("/{indicator_code}/{province_id}/{tahun}")
@@ -122,4 +116,5 @@ async def delete_indicator_data(
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Data not found")
 
+    await year_based_scoring_service.refresh_year(tahun)
     return {"message": "Data deleted successfully", "success": True}
@@ -14,6 +14,8 @@ from app.models.ipm_model import (
     IPMResponse,
 )
 from app.models.csv_import import CSVImportResponse
+from app.common.errors import PayloadTooLargeError, domain_error_to_http
+from app.common.uploads import spooled_upload
 
 router = APIRouter(prefix="/indeks-pembangunan-manusia", tags=["Indeks Pembangunan Manusia"])
 
@@ -44,8 +46,11 @@ async def import_csv(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    return await IPMImportService.import_csv(content, tahun)
+    try:
+        async with spooled_upload(file) as upload:
+            return await IPMImportService.import_csv(upload.file, tahun)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
 
 @router.post(
@@ -14,6 +14,8 @@ from app.models.pdrb_per_kapita_model import (
     PDRBPerKapitaResponse,
 )
 from app.models.csv_import import CSVImportResponse
+from app.common.errors import PayloadTooLargeError, domain_error_to_http
+from app.common.uploads import spooled_upload
 
 router = APIRouter(prefix="/pdrb-per-kapita", tags=["PDRB Per Kapita"])
 
@@ -44,8 +46,11 @@ async def import_csv_adhb(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    return await PDRBImportService.import_adhb(content, tahun)
+    try:
+        async with spooled_upload(file) as upload:
+            return await PDRBImportService.import_adhb(upload.file, tahun)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
 
 @router.post(
@@ -61,8 +66,11 @@ async def import_csv_adhk(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    return await PDRBImportService.import_adhk(content, tahun)
+    try:
+        async with spooled_upload(file) as upload:
+            return await PDRBImportService.import_adhk(upload.file, tahun)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
 
 @router.post(
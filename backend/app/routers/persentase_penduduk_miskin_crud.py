@@ -14,6 +14,8 @@ from app.models.persentase_penduduk_miskin_model import (
     PersentasePendudukMiskinResponse,
 )
 from app.models.csv_import import CSVImportResponse
+from app.common.errors import PayloadTooLargeError, domain_error_to_http
+from app.common.uploads import spooled_upload
 
 router = APIRouter(prefix="/persentase-penduduk-miskin", tags=["Persentase Penduduk Miskin"])
 
@@ -44,8 +46,11 @@ async def import_csv(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    return await PersentasePendudukMiskinImportService.import_csv(content, tahun)
+    try:
+        async with spooled_upload(file) as upload:
+            return await PersentasePendudukMiskinImportService.import_csv(upload.file, tahun)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
 
 @router.post(
@@ -7,10 +7,18 @@ from pydantic import BaseModel, Field
 from typing import Optional, Any, List
 from datetime import datetime
 
+from app.common.errors import DomainError, domain_error_to_http
+from app.common.responses import FastJSONResponse, shape_trusted
+from app.services.geo_service import MAP_RESOLUTION, PROVINCE_RESOLUTION
 from app.services.region_service import region_service
+from app.services.province_resolver import province_resolver
 
 router = APIRouter(prefix="/regions", tags=["Regions"])
 
+RESOLUTION_DESCRIPTION = (
+    "Geometry detail: full (stored, opt-in), high, medium, low (national map) or none"
+)
+
 
 # ===== Request/Response Models =====
 
@@ -126,6 +134,7 @@ class MessageResponse(BaseModel):
 async def list_regions(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    resolution: str = Query(MAP_RESOLUTION, description=RESOLUTION_DESCRIPTION),
 ) -> RegionsListResponse:
     """
     List all regions with pagination.
@@ -133,23 +142,30 @@ async def list_regions(
     Args:
         page: Page number (1-indexed)
         page_size: Number of items per page
+        resolution: Geometry resolution (full, high, medium, low or none)
 
     Returns:
         Paginated list of regions with total count
     """
-    regions, total = await region_service.get_all_regions(page=page, page_size=page_size)
+    try:
+        regions, total = await region_service.get_all_regions(
+            page=page, page_size=page_size, resolution=resolution
+        )
+    except DomainError as e:
+        raise domain_error_to_http(e)
 
     # Convert _id to string for response
     for region in regions:
         if "_id" in region:
             region["id"] = str(region.pop("_id"))
 
-    return RegionsListResponse(
-        regions=[RegionResponse(**r) for r in regions],
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    # Rows come from our own collection; skip validating every coordinate
+    return FastJSONResponse({
+        "regions": [shape_trusted(RegionResponse, r) for r in regions],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get(
@@ -158,12 +174,16 @@ async def list_regions(
     summary="Get region by code",
     description="Returns a single region by its code.",
 )
-async def get_region(region_code: str) -> RegionResponse:
+async def get_region(
+    region_code: str,
+    resolution: str = Query(PROVINCE_RESOLUTION, description=RESOLUTION_DESCRIPTION),
+) -> RegionResponse:
     """
     Get a single region by code.
 
     Args:
         region_code: The region code (e.g., 'ID-JK')
+        resolution: Geometry resolution (full, high, medium, low or none)
 
     Returns:
         Region data
@@ -171,7 +191,10 @@ async def get_region(region_code: str) -> RegionResponse:
     Raises:
         404: Region not found
     """
-    region = await region_service.get_region_by_code(region_code)
+    try:
+        region = await region_service.get_region_by_code(region_code, resolution=resolution)
+    except DomainError as e:
+        raise domain_error_to_http(e)
 
     if not region:
         raise HTTPException(
@@ -207,7 +230,9 @@ async def create_region(region_data: RegionCreateRequest) -> MessageResponse:
         409: Region with the same code already exists
     """
     # Check if region already exists
-    existing = await region_service.get_region_by_code(region_data.properties.KODE_PROV)
+    existing = await region_service.get_region_by_code(
+        region_data.properties.KODE_PROV, resolution="none"
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -291,3 +316,25 @@ async def delete_region(region_code: str) -> MessageResponse:
         )
 
     return MessageResponse(message=f"Region '{region_code}' deleted successfully")
+
+
+@router.post(
+    "/cache/refresh",
+    response_model=MessageResponse,
+    summary="Refresh the province registry",
+    description="Reloads cached province names after provinces were changed outside the API.",
+)
+async def refresh_region_cache() -> MessageResponse:
+    """
+    Drop and reload the in-memory province registry.
+
+    Region writes through this router refresh the registry automatically;
+    this is only needed after bulk loads of the provinces collection.
+
+    Returns:
+        Success message with the number of provinces loaded
+    """
+    province_resolver.invalidate()
+    index = await province_resolver.get_index()
+
+    return MessageResponse(message=f"Province registry reloaded ({len(set(index.values()))} provinces)")
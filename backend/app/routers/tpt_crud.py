@@ -14,6 +14,8 @@ from app.models.tpt_model import (
     TPTResponse,
 )
 from app.models.csv_import import CSVImportResponse
+from app.common.errors import PayloadTooLargeError, domain_error_to_http
+from app.common.uploads import spooled_upload
 
 router = APIRouter(prefix="/tingkat-pengangguran-terbuka", tags=["Tingkat Pengangguran Terbuka"])
 
@@ -44,8 +46,11 @@ async def import_csv(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    return await TPTImportService.import_csv(content, tahun)
+    try:
+        async with spooled_upload(file) as upload:
+            return await TPTImportService.import_csv(upload.file, tahun)
+    except PayloadTooLargeError as e:
+        raise domain_error_to_http(e)
 
 
 @router.post(
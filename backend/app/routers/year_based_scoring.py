@@ -2,10 +2,11 @@
 Year-based scoring router - API endpoints for year-based scoring.
 """
 
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query, Path
+from typing import Optional, List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Path, Response
 from pydantic import BaseModel, Field
 
+from app.common.responses import FastJSONResponse, shape_trusted
 from app.services.year_based_scoring_service import year_based_scoring_service
 
 
@@ -15,6 +16,19 @@ router = APIRouter(
 )
 
 
+def _apply_watermark(response: Response, watermark: Dict[str, Any]) -> None:
+    """
+    Expose the staleness watermark of materialized scores as headers.
+
+    Headers keep the JSON body shape unchanged for existing clients.
+    """
+    if watermark.get("computed_at") is not None:
+        response.headers["X-Scores-Computed-At"] = watermark["computed_at"].isoformat()
+    if watermark.get("data_updated_at") is not None:
+        response.headers["X-Scores-Data-Updated-At"] = watermark["data_updated_at"].isoformat()
+    response.headers["X-Scores-Stale"] = "true" if watermark.get("stale") else "false"
+
+
 # Response Models
 class CollectionScore(BaseModel):
     """Score for a single collection."""
@@ -56,6 +70,14 @@ class YearsResponse(BaseModel):
     """Available years response."""
     years: List[int]
     count: int
+    coverage: Dict[str, List[int]] = Field(
+        default_factory=dict,
+        description="Years with data per collection"
+    )
+    complete_years: List[int] = Field(
+        default_factory=list,
+        description="Years that every collection has data for"
+    )
 
 
 class ProvinceInfo(BaseModel):
@@ -85,10 +107,16 @@ async def get_available_years():
     Get list of years that have data in any collection.
     
     Returns:
-        List of available years sorted ascending
+        List of available years sorted ascending, with per-collection
+        coverage so incomplete years can be flagged by clients
     """
-    years = await year_based_scoring_service.get_available_years()
-    return YearsResponse(years=years, count=len(years))
+    coverage = await year_based_scoring_service.get_year_coverage()
+    return YearsResponse(
+        years=coverage["years"],
+        count=len(coverage["years"]),
+        coverage=coverage["coverage"],
+        complete_years=coverage["complete_years"],
+    )
 
 
 @router.get(
@@ -97,6 +125,7 @@ async def get_available_years():
     summary="Get national statistics for a year"
 )
 async def get_national_statistics(
+    response: Response,
     year: int = Path(..., description="Year to get statistics for", ge=2000, le=2100)
 ):
     """
@@ -116,6 +145,7 @@ async def get_national_statistics(
             detail=f"No data found for year {year}"
         )
     
+    _apply_watermark(response, stats["watermark"])
     return stats
 
 
@@ -169,7 +199,7 @@ async def get_scores_for_year(
     Returns:
         List of province scores sorted by rank (best to worst)
     """
-    scores = await year_based_scoring_service.calculate_all_scores_for_year(year)
+    scores, watermark = await year_based_scoring_service.get_ranked_scores(year)
     
     if not scores:
         raise HTTPException(
@@ -177,7 +207,10 @@ async def get_scores_for_year(
             detail=f"No data found for year {year}"
         )
     
-    return scores
+    # Rows come from the scoring engine; skip re-validating them
+    response = FastJSONResponse([shape_trusted(ProvinceScoreDetailed, row) for row in scores])
+    _apply_watermark(response, watermark)
+    return response
 
 
 @router.get(
@@ -186,6 +219,7 @@ async def get_scores_for_year(
     summary="Get top performing provinces"
 )
 async def get_top_provinces(
+    response: Response,
     year: int = Path(..., description="Year", ge=2000, le=2100),
     count: int = Query(5, description="Number of top provinces to return", ge=1, le=50)
 ):
@@ -199,7 +233,7 @@ async def get_top_provinces(
     Returns:
         List of top provinces sorted by score (descending)
     """
-    all_scores = await year_based_scoring_service.calculate_all_scores_for_year(year)
+    all_scores, watermark = await year_based_scoring_service.get_ranked_scores(year)
     
     if not all_scores:
         raise HTTPException(
@@ -207,6 +241,7 @@ async def get_top_provinces(
             detail=f"No data found for year {year}"
         )
     
+    _apply_watermark(response, watermark)
     return all_scores[:count]
 
 
@@ -216,6 +251,7 @@ async def get_top_provinces(
     summary="Get bottom performing provinces"
 )
 async def get_bottom_provinces(
+    response: Response,
     year: int = Path(..., description="Year", ge=2000, le=2100),
     count: int = Query(5, description="Number of bottom provinces to return", ge=1, le=50)
 ):
@@ -229,7 +265,7 @@ async def get_bottom_provinces(
     Returns:
         List of bottom provinces sorted by score (ascending)
     """
-    all_scores = await year_based_scoring_service.calculate_all_scores_for_year(year)
+    all_scores, watermark = await year_based_scoring_service.get_ranked_scores(year)
     
     if not all_scores:
         raise HTTPException(
@@ -237,6 +273,7 @@ async def get_bottom_provinces(
             detail=f"No data found for year {year}"
         )
     
+    _apply_watermark(response, watermark)
     return all_scores[-count:][::-1]  # Reverse to show worst first
 
 
@@ -246,6 +283,7 @@ async def get_bottom_provinces(
     summary="Get specific province score for a year"
 )
 async def get_province_score(
+    response: Response,
     year: int = Path(..., description="Year", ge=2000, le=2100),
     province_id: str = Path(..., description="Province ID")
 ):
@@ -259,7 +297,7 @@ async def get_province_score(
     Returns:
         Province score with collection breakdown
     """
-    score = await year_based_scoring_service.calculate_composite_score(
+    score, watermark = await year_based_scoring_service.get_province_ranked_score(
         province_id, 
         year
     )
@@ -270,6 +308,7 @@ async def get_province_score(
             detail=f"No data found for province {province_id} in year {year}"
         )
     
+    _apply_watermark(response, watermark)
     return score
 
 
@@ -6,6 +6,7 @@ from typing import Optional
 from datetime import datetime
 from app.repositories.angkatan_kerja_repo import get_angkatan_kerja_repository
 from app.models.angkatan_kerja import AngkatanKerjaModel
+from app.services.year_based_scoring_service import year_based_scoring_service
 
 
 class AngkatanKerjaService:
@@ -52,7 +53,9 @@ class AngkatanKerjaService:
         """
         data = AngkatanKerjaModel(**data_dict)
         repo = await get_angkatan_kerja_repository()
-        return await repo.create(data)
+        result = await repo.create(data)
+        await year_based_scoring_service.refresh_year(data.tahun)
+        return result
 
     async def update(
         self, province_id: str, tahun: int, update_data: dict
@@ -60,12 +63,16 @@ class AngkatanKerjaService:
         """Update angkatan_kerja record."""
         update_data["updated_at"] = datetime.utcnow()
         repo = await get_angkatan_kerja_repository()
-        return await repo.update(province_id, tahun, update_data)
+        result = await repo.update(province_id, tahun, update_data)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
     async def delete(self, province_id: str, tahun: int) -> bool:
         """Delete angkatan_kerja record."""
         repo = await get_angkatan_kerja_repository()
-        return await repo.delete(province_id, tahun)
+        result = await repo.delete(province_id, tahun)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
 
 # Singleton instance
@@ -2,30 +2,28 @@
 CSV Import Service for Angkatan Kerja data.
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class AngkatanKerjaImportService(BaseCSVImportService):
     """Service for importing Angkatan Kerja CSV files."""
 
     @staticmethod
-    async def import_csv(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_csv(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import Angkatan Kerja CSV.
         Columns: Province | Februari (Bekerja, Pengangguran, Jumlah AK, %Bekerja/AK) | 
                  Agustus (Bekerja, Pengangguran, Jumlah AK, %Bekerja/AK)
         """
-        df = pd.read_csv(BytesIO(file_content), skiprows=4)
+        df = await AngkatanKerjaImportService.read_csv(file_content, skiprows=4)
         db = await get_database()
         collection = db["angkatan_kerja"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         for index, row in df.iterrows():
@@ -60,12 +58,7 @@ class AngkatanKerjaImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun, "indikator": "angkatan_kerja"},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun, "indikator": "angkatan_kerja"}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -73,6 +66,11 @@ class AngkatanKerjaImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await AngkatanKerjaImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await AngkatanKerjaImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="angkatan_kerja",
             tahun=tahun,
@@ -80,5 +78,7 @@ class AngkatanKerjaImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
@@ -3,10 +3,18 @@ Base CSV Import Service - Common utilities for all CSV import services.
 """
 
 import pandas as pd
-import re
-from typing import Optional
+from io import BytesIO
+from typing import Optional, List, Dict, Tuple, Any, BinaryIO, Union
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
-from app.db import get_database
+from app.common.executors import run_in_thread
+from app.models.csv_import import ImportResult
+from app.services.province_resolver import province_resolver
+from app.services.year_based_scoring_service import year_based_scoring_service
+
+# Uploaded CSV as raw bytes or a file object positioned at the start
+CSVContent = Union[bytes, BinaryIO]
 
 
 class BaseCSVImportService:
@@ -18,23 +26,109 @@ class BaseCSVImportService:
         Find province ID by name with fuzzy matching.
         Handles common prefixes like PROV., KEP., DI.
         """
-        clean_name = re.sub(r'^PROV\.?\s+', '', str(province_name), flags=re.IGNORECASE).strip()
-        clean_name = re.sub(r'^KEP\.?\s+', 'KEPULAUAN ', clean_name, flags=re.IGNORECASE)
-        clean_name = re.sub(r'DI\.?\s+', 'DAERAH ISTIMEWA ', clean_name, flags=re.IGNORECASE)
-
-        db = await get_database()
-        collection = db["provinces"]
-        
-        result = await collection.find_one({
-            "properties.PROVINSI": {
-                "$regex": f"^{re.escape(clean_name)}$",
-                "$options": "i"
+        return await province_resolver.resolve(province_name)
+
+    @staticmethod
+    async def read_csv(file_content: CSVContent, **kwargs: Any) -> pd.DataFrame:
+        """
+        Parse an uploaded CSV in the thread pool.
+
+        Args:
+            file_content: Raw CSV bytes or a file object (e.g. a spooled upload)
+            **kwargs: Passed to ``pd.read_csv`` (e.g. skiprows)
+
+        Returns:
+            Parsed dataframe
+        """
+        if isinstance(file_content, (bytes, bytearray)):
+            file_content = BytesIO(file_content)
+        return await run_in_thread(pd.read_csv, file_content, **kwargs)
+
+    @staticmethod
+    async def bulk_upsert(
+        collection,
+        upserts: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+    ) -> Tuple[int, List[ImportResult], List[ImportResult]]:
+        """
+        Upsert all rows of a file with a single unordered bulk_write.
+
+        Rows sharing the same filter are collapsed to the last one, which
+        matches the outcome of applying them one by one in file order; the
+        earlier rows are reported as skipped, not as successes. A write
+        concern error leaves the durability of every write unknown, so all
+        rows without their own write error are reported as failed.
+
+        Args:
+            collection: Target Motor collection
+            upserts: List of (province_name, filter, document) per CSV row
+
+        Returns:
+            Tuple of (successful row count, failed rows, skipped rows)
+        """
+        if not upserts:
+            return 0, [], []
+
+        # Last row wins for duplicate filters; unordered writes must not race
+        latest: Dict[Tuple, int] = {}
+        for idx, (_, query, _) in enumerate(upserts):
+            latest[tuple(sorted(query.items()))] = idx
+        kept = sorted(latest.values())
+        kept_set = set(kept)
+
+        skipped_rows = [
+            ImportResult(
+                province_name=name,
+                success=False,
+                message="Skipped: superseded by a later row for the same record"
+            )
+            for idx, (name, _, _) in enumerate(upserts)
+            if idx not in kept_set
+        ]
+
+        operations = [
+            UpdateOne(upserts[idx][1], {"$set": upserts[idx][2]}, upsert=True)
+            for idx in kept
+        ]
+
+        try:
+            await collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            errors = {
+                error["index"]: error.get("errmsg", "Write failed")
+                for error in e.details.get("writeErrors", [])
             }
-        })
-        
-        if result:
-            return result.get('properties', {}).get('id')
-        return None
+            concern_errors = e.details.get("writeConcernErrors", [])
+            if concern_errors:
+                message = concern_errors[0].get("errmsg", "Write concern failed")
+                for op_idx in range(len(kept)):
+                    errors.setdefault(op_idx, message)
+
+            failed_rows = [
+                ImportResult(
+                    province_name=upserts[kept[op_idx]][0],
+                    success=False,
+                    message=message
+                )
+                for op_idx, message in sorted(errors.items())
+            ]
+            return len(kept) - len(failed_rows), failed_rows, skipped_rows
+        except Exception as e:
+            # The whole batch was rejected (e.g. connection error)
+            failed_rows = [
+                ImportResult(province_name=upserts[idx][0], success=False, message=str(e))
+                for idx in kept
+            ]
+            return 0, failed_rows, skipped_rows
+
+        return len(kept), [], skipped_rows
+
+    @staticmethod
+    async def after_import(tahun: int) -> None:
+        """
+        Hook run after a CSV import has written its rows.
+        Recomputes and materializes the imported year's scores.
+        """
+        await year_based_scoring_service.refresh_year(tahun)
 
     @staticmethod
     def clean_val(val):
@@ -2,29 +2,27 @@
 CSV Import Service for Indeks Harga Konsumen (IHK) data.
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class IHKImportService(BaseCSVImportService):
     """Service for importing Indeks Harga Konsumen CSV files."""
 
     @staticmethod
-    async def import_csv(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_csv(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import Indeks Harga Konsumen CSV.
         Columns: Province | Januari | Februari | ... | Desember | Tahunan
         """
-        df = pd.read_csv(BytesIO(file_content), skiprows=3)
+        df = await IHKImportService.read_csv(file_content, skiprows=3)
         db = await get_database()
         collection = db["indeks_harga_konsumen"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         bulan_list = ['Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni',
                       'Juli', 'Agustus', 'September', 'Oktober', 'November', 'Desember']
@@ -54,12 +52,7 @@ class IHKImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -67,6 +60,11 @@ class IHKImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await IHKImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await IHKImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="indeks_harga_konsumen",
             tahun=tahun,
@@ -74,5 +72,7 @@ class IHKImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
@@ -2,29 +2,27 @@
 CSV Import Service for Indeks Pembangunan Manusia (IPM) data.
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class IPMImportService(BaseCSVImportService):
     """Service for importing Indeks Pembangunan Manusia CSV files."""
 
     @staticmethod
-    async def import_csv(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_csv(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import Indeks Pembangunan Manusia CSV.
         Columns: Province | [Year columns]
         """
-        df = pd.read_csv(BytesIO(file_content), skiprows=2)
+        df = await IPMImportService.read_csv(file_content, skiprows=2)
         db = await get_database()
         collection = db["indeks_pembangunan_manusia"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         for index, row in df.iterrows():
@@ -48,12 +46,7 @@ class IPMImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -61,6 +54,11 @@ class IPMImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await IPMImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await IPMImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="indeks_pembangunan_manusia",
             tahun=tahun,
@@ -68,5 +66,7 @@ class IPMImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
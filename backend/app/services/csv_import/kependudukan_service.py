@@ -2,30 +2,28 @@
 CSV Import Service for Kependudukan data.
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class KependudukanImportService(BaseCSVImportService):
     """Service for importing Kependudukan CSV files."""
 
     @staticmethod
-    async def import_csv(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_csv(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import Kependudukan CSV.
         Columns: Provinsi | Jumlah Penduduk (Ribu) | Laju Pertumbuhan | 
                  Persentase Penduduk | Kepadatan per km2 | Rasio Jenis Kelamin
         """
-        df = pd.read_csv(BytesIO(file_content))
+        df = await KependudukanImportService.read_csv(file_content)
         db = await get_database()
         collection = db["kependudukan"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         for index, row in df.iterrows():
@@ -55,12 +53,7 @@ class KependudukanImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -68,6 +61,11 @@ class KependudukanImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await KependudukanImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await KependudukanImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="kependudukan",
             tahun=tahun,
@@ -75,5 +73,7 @@ class KependudukanImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
@@ -2,29 +2,27 @@
 CSV Import Service for PDRB Per Kapita data (ADHB & ADHK).
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class PDRBImportService(BaseCSVImportService):
     """Service for importing PDRB Per Kapita CSV files."""
 
     @staticmethod
-    async def import_adhb(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_adhb(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import PDRB Per Kapita ADHB (Atas Dasar Harga Berlaku) CSV.
         Columns: Provinsi | PDRB per Kapita ADHB (Ribu Rp)
         """
-        df = pd.read_csv(BytesIO(file_content))
+        df = await PDRBImportService.read_csv(file_content)
         db = await get_database()
         collection = db["pdrb_per_kapita"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         for index, row in df.iterrows():
@@ -48,12 +46,7 @@ class PDRBImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun, "indikator": "pdrb_per_kapita_adhb"},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun, "indikator": "pdrb_per_kapita_adhb"}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -61,6 +54,11 @@ class PDRBImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await PDRBImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await PDRBImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="pdrb_per_kapita_adhb",
             tahun=tahun,
@@ -68,20 +66,22 @@ class PDRBImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
 
     @staticmethod
-    async def import_adhk(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_adhk(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import PDRB Per Kapita ADHK (Atas Dasar Harga Konstan 2010) CSV.
         Columns: Provinsi | PDRB per Kapita HK (Ribu Rp)
         """
-        df = pd.read_csv(BytesIO(file_content))
+        df = await PDRBImportService.read_csv(file_content)
         db = await get_database()
         collection = db["pdrb_per_kapita"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         for index, row in df.iterrows():
@@ -105,12 +105,7 @@ class PDRBImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun, "indikator": "pdrb_per_kapita_adhk_2010"},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun, "indikator": "pdrb_per_kapita_adhk_2010"}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -118,6 +113,11 @@ class PDRBImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await PDRBImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await PDRBImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="pdrb_per_kapita_adhk_2010",
             tahun=tahun,
@@ -125,5 +125,7 @@ class PDRBImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
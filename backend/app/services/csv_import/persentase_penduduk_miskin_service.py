@@ -2,30 +2,28 @@
 CSV Import Service for Persentase Penduduk Miskin data.
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class PersentasePendudukMiskinImportService(BaseCSVImportService):
     """Service for importing Persentase Penduduk Miskin CSV files."""
 
     @staticmethod
-    async def import_csv(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_csv(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import Persentase Penduduk Miskin CSV.
         Columns: Province | Semester 1 (Perkotaan, Perdesaan, Total) | 
                  Semester 2 (Perkotaan, Perdesaan, Total) | Tahunan (Perkotaan, Perdesaan, Total)
         """
-        df = pd.read_csv(BytesIO(file_content), skiprows=4)
+        df = await PersentasePendudukMiskinImportService.read_csv(file_content, skiprows=4)
         db = await get_database()
         collection = db["persentase_penduduk_miskin"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         for index, row in df.iterrows():
@@ -63,12 +61,7 @@ class PersentasePendudukMiskinImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -76,6 +69,11 @@ class PersentasePendudukMiskinImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await PersentasePendudukMiskinImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await PersentasePendudukMiskinImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="persentase_penduduk_miskin",
             tahun=tahun,
@@ -83,5 +81,7 @@ class PersentasePendudukMiskinImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
@@ -2,29 +2,27 @@
 CSV Import Service for Rata-Rata Upah Bersih data.
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class RataRataUpahImportService(BaseCSVImportService):
     """Service for importing Rata-Rata Upah Bersih CSV files."""
 
     @staticmethod
-    async def import_csv(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_csv(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import Rata-Rata Upah Bersih CSV.
         Columns: Province | Februari (18 sectors) | Agustus (18 sectors) | Tahunan (18 sectors)
         """
-        df = pd.read_csv(BytesIO(file_content), skiprows=4)
+        df = await RataRataUpahImportService.read_csv(file_content, skiprows=4)
         db = await get_database()
         collection = db["rata_rata_upah_bersih"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         SEKTOR_LIST = [
@@ -67,12 +65,7 @@ class RataRataUpahImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -80,6 +73,11 @@ class RataRataUpahImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await RataRataUpahImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await RataRataUpahImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="rata_rata_upah_bersih",
             tahun=tahun,
@@ -87,5 +85,7 @@ class RataRataUpahImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
@@ -2,29 +2,27 @@
 CSV Import Service for Tingkat Pengangguran Terbuka (TPT) data.
 """
 
-import pandas as pd
-from io import BytesIO
 from datetime import datetime
 
 from app.db import get_database
 from app.models.csv_import import ImportResult, CSVImportResponse
-from .base_service import BaseCSVImportService
+from .base_service import BaseCSVImportService, CSVContent
 
 
 class TPTImportService(BaseCSVImportService):
     """Service for importing Tingkat Pengangguran Terbuka CSV files."""
 
     @staticmethod
-    async def import_csv(file_content: bytes, tahun: int) -> CSVImportResponse:
+    async def import_csv(file_content: CSVContent, tahun: int) -> CSVImportResponse:
         """
         Import Tingkat Pengangguran Terbuka CSV.
         Columns: Province | Februari | Agustus | Tahunan
         """
-        df = pd.read_csv(BytesIO(file_content), skiprows=3)
+        df = await TPTImportService.read_csv(file_content, skiprows=3)
         db = await get_database()
         collection = db["tingkat_pengangguran_terbuka"]
         
-        success_count = 0
+        upserts = []
         failed_rows = []
         
         for index, row in df.iterrows():
@@ -52,12 +50,7 @@ class TPTImportService(BaseCSVImportService):
                     "imported_at": datetime.utcnow()
                 }
                 
-                await collection.update_one(
-                    {"province_id": province_id, "tahun": tahun},
-                    {"$set": doc},
-                    upsert=True
-                )
-                success_count += 1
+                upserts.append((prov_name, {"province_id": province_id, "tahun": tahun}, doc))
             except Exception as e:
                 failed_rows.append(ImportResult(
                     province_name=prov_name,
@@ -65,6 +58,11 @@ class TPTImportService(BaseCSVImportService):
                     message=str(e)
                 ))
         
+        success_count, write_failures, skipped_rows = await TPTImportService.bulk_upsert(collection, upserts)
+        failed_rows.extend(write_failures)
+
+        await TPTImportService.after_import(tahun)
+
         return CSVImportResponse(
             indikator="tingkat_pengangguran_terbuka",
             tahun=tahun,
@@ -72,5 +70,7 @@ class TPTImportService(BaseCSVImportService):
             success_count=success_count,
             failed_count=len(failed_rows),
             failed_rows=failed_rows,
+            skipped_count=len(skipped_rows),
+            skipped_rows=skipped_rows,
             message=f"Successfully imported {success_count}/{len(df)} records"
         )
@@ -1,39 +1,241 @@
 """
 Geo service - Business logic for geographic data operations.
+
+Boundaries come from ``indonesia-38.json`` at full resolution or from
+the variants precomputed by ``app.pipelines.geo.simplify``; a variant
+missing on disk is simplified on first use instead. Boundary responses
+are encoded and compressed once per resolution and served as bytes.
 """
 
+import asyncio
 import json
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+from app.common import ValidationError
+from app.common.executors import run_in_process, run_in_thread
+from app.common.precompressed import (
+    FAST_BROTLI_QUALITY,
+    PrecompressedPayload,
+    build_json_payload,
+    build_payload,
+)
+from app.common.provinces import FEATURE_PROVINCE_CODES
+from app.pipelines.geo.simplify import (
+    FULL_RESOLUTION,
+    GEO_RESOLUTIONS,
+    simplify_features,
+    variant_path,
+)
+from app.pipelines.geo.topojson import TOPOJSON_MEDIA_TYPE, encode_topojson_bytes
 from app.repositories import get_scores_repository, get_region_repository
+from app.services.year_based_scoring_service import year_based_scoring_service
 from app.logging import get_logger
+from app.settings import get_settings
 
 logger = get_logger(__name__)
 
+# Resolutions accepted by the geo and regions endpoints
+RESOLUTIONS = (FULL_RESOLUTION, *GEO_RESOLUTIONS)
+
+# Endpoint defaults: national map and single-province view
+MAP_RESOLUTION = "low"
+PROVINCE_RESOLUTION = "high"
+
+
+def index_features(features: List[Dict]) -> Dict[str, int]:
+    """Map feature IDs and BPS province codes to feature positions."""
+    index: Dict[str, int] = {}
+    for position, feature in enumerate(features):
+        for key in (feature.get("id"), feature.get("properties", {}).get("code")):
+            if key is not None:
+                index.setdefault(str(key), position)
+    return index
+
+
+def build_feature_payloads(features: List[Dict]) -> List[PrecompressedPayload]:
+    """Encode each feature on its own (runs on the CPU executor)."""
+    return [build_json_payload(feature, FAST_BROTLI_QUALITY) for feature in features]
+
+
+def build_topojson_payload(features: List[Dict], quantization: int) -> PrecompressedPayload:
+    """Encode features as TopoJSON and compress it (runs on the CPU executor)."""
+    return build_payload(encode_topojson_bytes(features, quantization), TOPOJSON_MEDIA_TYPE)
+
 
 class GeoService:
     """Service layer for geographic data operations."""
 
     def __init__(self, geojson_path: Optional[str] = None):
-        self.geojson_path = geojson_path or "data/geo/indonesia_provinces.geojson"
-        self._geojson_cache: Optional[Dict] = None
+        self.geojson_path = geojson_path
+        self._geojson_cache: Dict[str, Dict] = {}
+        self._feature_index: Dict[str, Dict[str, int]] = {}
+        self._geojson_payloads: Dict[str, PrecompressedPayload] = {}
+        self._feature_payloads: Dict[str, List[PrecompressedPayload]] = {}
+        self._topojson_payloads: Dict[str, PrecompressedPayload] = {}
+        # One load per resolution even when the first requests arrive together
+        self._load_lock = asyncio.Lock()
+        # One build per (payload kind, resolution); unrelated builds run in parallel
+        self._payload_locks: Dict[Tuple[str, str], asyncio.Lock] = defaultdict(asyncio.Lock)
 
-    async def get_geojson(self) -> Dict:
+    @property
+    def source_path(self) -> Path:
+        """Full-resolution GeoJSON file."""
+        if self.geojson_path:
+            return Path(self.geojson_path)
+        return Path(get_settings().geo_data_dir) / "indonesia-38.json"
+
+    async def get_geojson(self, resolution: str = FULL_RESOLUTION) -> Dict:
         """
         Get the base GeoJSON for Indonesia provinces.
 
+        Args:
+            resolution: "full" or a simplified variant ("high", "medium", "low")
+
         Returns:
             GeoJSON FeatureCollection
+
+        Raises:
+            ValidationError: If the resolution is unknown
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValidationError(
+                f"Unknown resolution: {resolution}. Supported: {list(RESOLUTIONS)}",
+                field="resolution",
+            )
+        if resolution not in self._geojson_cache:
+            async with self._load_lock:
+                if resolution not in self._geojson_cache:
+                    geojson = await self._load_resolution(resolution)
+                    self._feature_index[resolution] = index_features(geojson.get("features", []))
+                    self._geojson_cache[resolution] = geojson
+        return self._geojson_cache[resolution]
+
+    async def get_geojson_payload(self, resolution: str = FULL_RESOLUTION) -> PrecompressedPayload:
+        """
+        Get the provinces as pre-encoded, pre-compressed GeoJSON.
+
+        Built once per resolution.
+
+        Args:
+            resolution: Boundary resolution, see ``get_geojson``
+
+        Returns:
+            PrecompressedPayload of the FeatureCollection
+        """
+        geojson = await self.get_geojson(resolution)
+        return await self._build_payload_once(
+            self._geojson_payloads, "geojson", resolution, build_json_payload, geojson
+        )
+
+    async def get_region_payload(
+        self,
+        region_code: str,
+        resolution: str = FULL_RESOLUTION,
+    ) -> Optional[PrecompressedPayload]:
+        """
+        Get one province feature as a pre-encoded payload.
+
+        Args:
+            region_code: Province code (e.g., "31") or feature ID (e.g., "91-A")
+            resolution: Boundary resolution, see ``get_geojson``
+
+        Returns:
+            PrecompressedPayload of the Feature, or None if unknown
+        """
+        features = await self._get_feature_payloads(resolution)
+        position = self._feature_index[resolution].get(region_code)
+        return features[position] if position is not None else None
+
+    async def get_topojson_payload(self, resolution: str = FULL_RESOLUTION) -> PrecompressedPayload:
+        """
+        Get the provinces as pre-encoded, pre-compressed TopoJSON.
+
+        Built once per resolution with ``geo_topojson_quantization``.
+
+        Args:
+            resolution: Boundary resolution, see ``get_geojson``
+
+        Returns:
+            PrecompressedPayload of the Topology
+        """
+        geojson = await self.get_geojson(resolution)
+        return await self._build_payload_once(
+            self._topojson_payloads, "topojson", resolution,
+            build_topojson_payload,
+            geojson.get("features", []),
+            get_settings().geo_topojson_quantization,
+        )
+
+    async def get_topojson(self, resolution: str = FULL_RESOLUTION) -> bytes:
+        """
+        Get the provinces as encoded TopoJSON bytes.
+
+        Args:
+            resolution: Boundary resolution, see ``get_geojson``
+
+        Returns:
+            UTF-8 TopoJSON document
         """
-        if self._geojson_cache is None:
-            self._geojson_cache = self._load_geojson()
-        return self._geojson_cache
+        payload = await self.get_topojson_payload(resolution)
+        return payload.body
+
+    async def warm(self) -> None:
+        """Build the payloads of the default resolutions ahead of the first request."""
+        try:
+            await asyncio.gather(
+                self.get_geojson_payload(MAP_RESOLUTION),
+                self.get_topojson_payload(MAP_RESOLUTION),
+                self._get_feature_payloads(PROVINCE_RESOLUTION),
+            )
+        except Exception as e:
+            # Built on the first request instead
+            logger.warning(f"Geo payload warm-up failed: {e}")
+
+    async def _get_feature_payloads(self, resolution: str) -> List[PrecompressedPayload]:
+        geojson = await self.get_geojson(resolution)
+        return await self._build_payload_once(
+            self._feature_payloads, "features", resolution,
+            build_feature_payloads, geojson.get("features", []),
+        )
+
+    async def _build_payload_once(
+        self,
+        cache: Dict[str, Any],
+        kind: str,
+        resolution: str,
+        build: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Run ``build`` on the CPU executor once per (kind, resolution)."""
+        if resolution not in cache:
+            async with self._payload_locks[(kind, resolution)]:
+                if resolution not in cache:
+                    cache[resolution] = await run_in_process(build, *args)
+        return cache[resolution]
+
+    async def get_geometry_index(self, resolution: str) -> Dict[str, Dict]:
+        """
+        Map feature IDs and BPS province codes to geometry at a resolution.
+
+        Args:
+            resolution: One of ``RESOLUTIONS``
+
+        Returns:
+            Mapping of feature ID or province code to GeoJSON geometry
+        """
+        features = (await self.get_geojson(resolution)).get("features", [])
+        return {
+            key: features[position].get("geometry")
+            for key, position in self._feature_index[resolution].items()
+        }
 
     async def get_choropleth_data(
         self,
         year: Optional[int] = None,
         metric: str = "composite_score",
+        resolution: str = FULL_RESOLUTION,
     ) -> Dict:
         """
         Get GeoJSON with score data joined for choropleth visualization.
@@ -41,11 +243,12 @@ class GeoService:
         Args:
             year: Year to get scores for (latest if None)
             metric: Score metric to include (composite_score, economic_score, etc.)
+            resolution: Boundary resolution, see ``get_geojson``
 
         Returns:
             GeoJSON FeatureCollection with score properties
         """
-        geojson = await self.get_geojson()
+        geojson = await self.get_geojson(resolution)
         scores_repo = await get_scores_repository()
 
         # Get year if not specified
@@ -60,20 +263,24 @@ class GeoService:
         rankings = await scores_repo.find_rankings(year)
         scores_by_code = {s["region_code"]: s for s in rankings}
 
-        # Join scores to features
+        # Join scores onto copies; cached features and their geometry are
+        # shared by every request and must never be modified
         features = []
         for feature in geojson.get("features", []):
             code = feature["properties"].get("code")
             score_data = scores_by_code.get(code, {})
 
-            # Add score properties
-            feature["properties"]["year"] = year
-            feature["properties"]["composite_score"] = score_data.get("composite_score")
-            feature["properties"]["rank"] = score_data.get("rank")
-            feature["properties"]["rank_delta"] = score_data.get("rank_delta")
-            feature["properties"][metric] = score_data.get(metric)
-
-            features.append(feature)
+            features.append({
+                **feature,
+                "properties": {
+                    **feature["properties"],
+                    "year": year,
+                    "composite_score": score_data.get("composite_score"),
+                    "rank": score_data.get("rank"),
+                    "rank_delta": score_data.get("rank_delta"),
+                    metric: score_data.get(metric),
+                },
+            })
 
         return {
             "type": "FeatureCollection",
@@ -85,23 +292,66 @@ class GeoService:
             "features": features,
         }
 
-    async def get_region_boundary(self, region_code: str) -> Optional[Dict]:
+    async def get_score_overlay(
+        self,
+        year: Optional[int] = None,
+        metric: str = "composite_score",
+    ) -> Dict:
         """
-        Get GeoJSON feature for a single region.
+        Get year scores keyed by province code, without geometry.
+
+        Clients load boundaries once and swap this overlay when the year
+        or metric changes. Served from the year-score snapshot cache.
 
         Args:
-            region_code: Province code (e.g., "ID-JK")
+            year: Year to get scores for (latest if None)
+            metric: "composite_score" or a scored collection name
 
         Returns:
-            GeoJSON Feature or None
+            Dictionary with ``year``, ``metric`` and ``regions`` mapping
+            BPS province code (``properties.code`` of the boundary
+            features) to {score, rank, delta, metric}
+
+        Raises:
+            ValidationError: If the metric is unknown
         """
-        geojson = await self.get_geojson()
+        metrics = ["composite_score", *year_based_scoring_service.COLLECTION_CONFIGS]
+        if metric not in metrics:
+            raise ValidationError(f"Unknown metric: {metric}. Supported: {metrics}", field="metric")
 
-        for feature in geojson.get("features", []):
-            if feature["properties"].get("code") == region_code:
-                return feature
+        if year is None:
+            years = await year_based_scoring_service.get_available_years()
+            year = years[-1] if years else None
 
-        return None
+        snapshot = await year_based_scoring_service.get_year_snapshot(year) if year else None
+        if snapshot is None:
+            return {"year": year, "metric": metric, "regions": {}}
+
+        previous = await year_based_scoring_service.get_year_snapshot(year - 1)
+        return {
+            "year": year,
+            "metric": metric,
+            "regions": snapshot.to_overlay(metric, previous),
+        }
+
+    async def get_region_boundary(
+        self,
+        region_code: str,
+        resolution: str = FULL_RESOLUTION,
+    ) -> Optional[Dict]:
+        """
+        Get GeoJSON feature for a single region.
+
+        Args:
+            region_code: Province code (e.g., "31") or feature ID (e.g., "91-A")
+            resolution: Boundary resolution, see ``get_geojson``
+
+        Returns:
+            GeoJSON Feature or None
+        """
+        geojson = await self.get_geojson(resolution)
+        position = self._feature_index[resolution].get(region_code)
+        return geojson["features"][position] if position is not None else None
 
     def get_color_scale(
         self,
@@ -131,15 +381,44 @@ class GeoService:
         ]
         return colors
 
-    def _load_geojson(self) -> Dict:
+    async def _load_resolution(self, resolution: str) -> Dict:
+        """Read a resolution from disk, simplifying the source if needed."""
+        source = self.source_path
+        if resolution == FULL_RESOLUTION:
+            return await run_in_thread(self._load_geojson, source)
+
+        path = variant_path(source, resolution)
+        if path.exists():
+            return await run_in_thread(self._load_geojson, path)
+
+        logger.warning(
+            f"No precomputed {resolution} boundaries at {path}, simplifying now; "
+            f"run python -m app.pipelines.geo.simplify to build them"
+        )
+        # Called under the load lock, so read the source directly
+        full = self._geojson_cache.get(FULL_RESOLUTION) or await self._load_resolution(FULL_RESOLUTION)
+        features = await run_in_process(simplify_features, full["features"], resolution)
+        return {"type": "FeatureCollection", "resolution": resolution, "features": features}
+
+    @staticmethod
+    def _load_geojson(path: Path) -> Dict:
         """Load GeoJSON from file."""
-        path = Path(self.geojson_path)
         if not path.exists():
             logger.warning(f"GeoJSON file not found: {path}")
             return {"type": "FeatureCollection", "features": []}
 
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            geojson = json.load(f)
+
+        # indonesia-38.json names provinces KODE_PROV/PROVINSI; the split
+        # Papua provinces still share KODE_PROV, so their code comes from the ID
+        for feature in geojson.get("features", []):
+            properties = feature.setdefault("properties", {})
+            properties["code"] = FEATURE_PROVINCE_CODES.get(
+                str(feature.get("id")), properties.get("KODE_PROV")
+            )
+            properties.setdefault("name", properties.get("PROVINSI"))
+        return geojson
 
 
 # Singleton instance
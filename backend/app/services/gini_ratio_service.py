@@ -7,6 +7,8 @@ from typing import Optional, List, Dict
 from app.repositories.gini_ratio_repo import GiniRatioRepository
 from app.db import get_database
 from app.common.errors import NotFoundError
+from app.services.province_names import enrich_with_province_names
+from app.services.year_based_scoring_service import year_based_scoring_service
 
 
 class GiniRatioService:
@@ -14,21 +16,12 @@ class GiniRatioService:
 
     async def _enrich_with_province_name(self, record: Dict) -> Dict:
         """Enrich record with province name from provinces collection."""
-        db = await get_database()
-        repo = GiniRatioRepository(db)
-        province_id = record.get("province_id")
-        if province_id:
-            province_name = await repo.get_province_name(province_id)
-            record["province_name"] = province_name
+        await enrich_with_province_names([record])
         return record
 
     async def _enrich_records_with_province_names(self, records: List[Dict]) -> List[Dict]:
-        """Enrich multiple records with province names."""
-        enriched = []
-        for record in records:
-            enriched_record = await self._enrich_with_province_name(record)
-            enriched.append(enriched_record)
-        return enriched
+        """Enrich multiple records with province names in one query."""
+        return await enrich_with_province_names(records)
 
     async def get_all_gini_ratio(
         self,
@@ -118,6 +111,7 @@ class GiniRatioService:
         db = await get_database()
         repo = GiniRatioRepository(db)
         result = await repo.create(data)
+        await year_based_scoring_service.refresh_year(data.get("tahun"))
         return result
 
     async def update(self, province_id: str, year: int, data: Dict) -> bool:
@@ -125,6 +119,7 @@ class GiniRatioService:
         db = await get_database()
         repo = GiniRatioRepository(db)
         success = await repo.update(province_id, year, data)
+        await year_based_scoring_service.refresh_year(year)
         return success
 
     async def delete(self, province_id: str, year: int) -> bool:
@@ -132,6 +127,7 @@ class GiniRatioService:
         db = await get_database()
         repo = GiniRatioRepository(db)
         success = await repo.delete(province_id, year)
+        await year_based_scoring_service.refresh_year(year)
         return success
 
     async def list_all(
@@ -6,6 +6,7 @@ from typing import Optional
 from datetime import datetime
 from app.repositories.ihk_repo import get_ihk_repository
 from app.models.ihk_model import IndeksHargaKonsumenModel
+from app.services.year_based_scoring_service import year_based_scoring_service
 
 
 class IHKService:
@@ -35,7 +36,9 @@ class IHKService:
         """Create new IHK record."""
         data = IndeksHargaKonsumenModel(**data_dict)
         repo = await get_ihk_repository()
-        return await repo.create(data)
+        result = await repo.create(data)
+        await year_based_scoring_service.refresh_year(data.tahun)
+        return result
 
     async def update(
         self, province_id: str, tahun: int, update_data: dict
@@ -43,12 +46,16 @@ class IHKService:
         """Update IHK record."""
         update_data["updated_at"] = datetime.utcnow()
         repo = await get_ihk_repository()
-        return await repo.update(province_id, tahun, update_data)
+        result = await repo.update(province_id, tahun, update_data)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
     async def delete(self, province_id: str, tahun: int) -> bool:
         """Delete IHK record."""
         repo = await get_ihk_repository()
-        return await repo.delete(province_id, tahun)
+        result = await repo.delete(province_id, tahun)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
 
 ihk_service = IHKService()
@@ -0,0 +1,269 @@
+"""
+Import jobs - Background queue for file imports.
+
+Uploads are saved to a temporary file and queued; the request returns
+a job ID right away. A fixed number of worker tasks run the import
+pipeline for queued jobs, and every state change is written to the
+``import_batches`` collection so clients can poll the job status.
+
+Jobs live in process memory, which assumes a single API process (as in
+the Dockerfile). Jobs still queued or running when the process stops
+cannot be resumed and are marked failed on the next start.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.common.errors import ServiceUnavailableError
+from app.common.time import utc_now
+from app.logging import get_logger
+from app.pipelines.run_pipeline import run_full_pipeline
+from app.repositories.import_batches_repo import get_import_batches_repository
+from app.settings import get_settings
+
+logger = get_logger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Pause before retrying a failed final status write
+FINISH_RETRY_DELAY_SECONDS = 1.0
+
+
+@dataclass
+class ImportJob:
+    """A queued pipeline run over a saved upload."""
+
+    id: str
+    file_path: str
+    indicator_code: str
+    year: int
+    source_type: str
+    source_name: Optional[str]
+
+
+class ImportJobQueue:
+    """Bounded queue of import jobs processed by background workers."""
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Start the workers and fail jobs orphaned by a previous process."""
+        async with self._start_lock:
+            if self.running:
+                return
+
+            # Runs before any job of this process exists, so only orphans match
+            repo = await get_import_batches_repository()
+            orphaned = await repo.fail_unfinished(
+                [JOB_QUEUED, JOB_RUNNING],
+                "Interrupted by a server restart, please upload the file again",
+            )
+            if orphaned:
+                logger.warning(f"Marked {orphaned} interrupted import jobs as failed")
+
+            settings = get_settings()
+            self._queue = asyncio.Queue(maxsize=max(1, settings.import_queue_size))
+            self._workers = [
+                asyncio.create_task(self._worker(n), name=f"import-worker-{n}")
+                for n in range(max(1, settings.import_workers))
+            ]
+            logger.info(f"Started {len(self._workers)} import workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers and delete files of jobs that never ran."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while self._queue is not None and not self._queue.empty():
+            job = self._queue.get_nowait()
+            self._remove_file(job.file_path)
+
+    async def enqueue(
+        self,
+        file_path: str,
+        indicator_code: str,
+        year: int,
+        source_type: str = "file",
+        source_name: Optional[str] = None,
+        upload: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Record a job and queue it for the workers.
+
+        The queue takes ownership of ``file_path`` and deletes it once
+        the job has finished.
+
+        Args:
+            file_path: Saved upload to import
+            indicator_code: Code for the indicator
+            year: Year of the data
+            source_type: Type of source ("bps", "file")
+            source_name: Name of the data source
+            upload: Upload metadata stored with the job (size, hash)
+
+        Returns:
+            Job ID
+
+        Raises:
+            ServiceUnavailableError: If the queue is full
+        """
+        if not self.running:
+            await self.start()
+        if self._queue.full():
+            raise ServiceUnavailableError("import queue", "Import queue is full, retry later")
+
+        repo = await get_import_batches_repository()
+        job_id = await repo.create({
+            "status": JOB_QUEUED,
+            "stage": None,
+            "indicator_code": indicator_code,
+            "tahun": year,
+            "source_type": source_type,
+            "source_name": source_name,
+            "upload": upload or {},
+            "records_processed": 0,
+            "records_imported": 0,
+            "errors": [],
+            "warnings": [],
+        })
+
+        try:
+            self._queue.put_nowait(ImportJob(
+                id=job_id,
+                file_path=file_path,
+                indicator_code=indicator_code,
+                year=year,
+                source_type=source_type,
+                source_name=source_name,
+            ))
+        except asyncio.QueueFull:
+            # Filled up by a concurrent request while the job was recorded
+            await repo.update(job_id, {"status": JOB_FAILED, "message": "Import queue is full"})
+            raise ServiceUnavailableError("import queue", "Import queue is full, retry later")
+        logger.info(f"Queued import job {job_id}: {indicator_code} {year}")
+        return job_id
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status document of a job.
+
+        Args:
+            job_id: Job ID returned by ``enqueue``
+
+        Returns:
+            Job status with ``id`` instead of ``_id``, or None if unknown
+        """
+        repo = await get_import_batches_repository()
+        doc = await repo.find_by_id(job_id)
+        return self._serialize(doc) if doc else None
+
+    async def list_jobs(self, limit: int = 20, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the most recent jobs, newest first."""
+        repo = await get_import_batches_repository()
+        return [self._serialize(doc) for doc in await repo.find_recent(limit, status)]
+
+    @staticmethod
+    def _serialize(doc: Dict[str, Any]) -> Dict[str, Any]:
+        job = dict(doc)
+        job["id"] = str(job.pop("_id"))
+        return job
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+
+    async def _worker(self, n: int) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            except Exception as e:
+                # Never let one job take the worker down
+                logger.error(f"Import worker {n} failed on job {job.id}: {e}")
+            finally:
+                self._remove_file(job.file_path)
+                self._queue.task_done()
+
+    async def _run(self, job: ImportJob) -> None:
+        """Run the pipeline for a job and persist progress and outcome."""
+        repo = await get_import_batches_repository()
+        started = time.perf_counter()
+        await repo.update(job.id, {"status": JOB_RUNNING, "started_at": utc_now()})
+
+        async def report(stage: str, records_processed: int) -> None:
+            await repo.update(job.id, {"stage": stage, "records_processed": records_processed})
+
+        try:
+            result = await run_full_pipeline(
+                file_path=job.file_path,
+                indicator_code=job.indicator_code,
+                year=job.year,
+                source_type=job.source_type,
+                source_name=job.source_name,
+                save_to_db=True,
+                progress=report,
+            )
+        except Exception as e:
+            logger.error(f"Import job {job.id} failed: {e}")
+            await self._finish(repo, job.id, {
+                "status": JOB_FAILED,
+                "message": f"Import failed: {e}",
+                "errors": [str(e)],
+                "duration_seconds": round(time.perf_counter() - started, 3),
+                "finished_at": utc_now(),
+            })
+            return
+
+        duration = time.perf_counter() - started
+        await self._finish(repo, job.id, {
+            "status": JOB_COMPLETED if result.success else JOB_FAILED,
+            "stage": None,
+            "message": result.message,
+            "records_processed": result.records_processed,
+            "records_imported": result.records_imported,
+            "rows_per_sec": round(result.records_processed / duration, 1) if duration > 0 else None,
+            "errors": result.errors,
+            "warnings": result.warnings,
+            "duration_seconds": round(duration, 3),
+            "finished_at": utc_now(),
+        })
+
+
+    @staticmethod
+    async def _finish(repo, job_id: str, fields: Dict[str, Any]) -> None:
+        """
+        Write the final status of a job, retrying once on failure.
+
+        A job whose final write is lost would stay ``running`` until the
+        next restart, so errors are logged here instead of raised.
+        """
+        for attempt in (1, 2):
+            try:
+                await repo.update(job_id, fields)
+                return
+            except Exception as e:
+                logger.error(f"Could not record final status of import job {job_id} (attempt {attempt}): {e}")
+                if attempt == 1:
+                    await asyncio.sleep(FINISH_RETRY_DELAY_SECONDS)
+
+
+# Singleton instance
+import_job_queue = ImportJobQueue()
@@ -7,6 +7,7 @@ from typing import Optional, List, Dict
 from app.repositories.labor_force_repo import LaborForceRepository
 from app.db import get_database
 from app.common.errors import NotFoundError
+from app.services.province_names import enrich_with_province_names
 
 
 class LaborForceService:
@@ -14,21 +15,12 @@ class LaborForceService:
 
     async def _enrich_with_province_name(self, record: Dict) -> Dict:
         """Enrich record with province name from provinces collection."""
-        db = await get_database()
-        repo = LaborForceRepository(db)
-        province_id = record.get("province_id")
-        if province_id:
-            province_name = await repo.get_province_name(province_id)
-            record["province_name"] = province_name
+        await enrich_with_province_names([record])
         return record
 
     async def _enrich_records_with_province_names(self, records: List[Dict]) -> List[Dict]:
-        """Enrich multiple records with province names."""
-        enriched = []
-        for record in records:
-            enriched_record = await self._enrich_with_province_name(record)
-            enriched.append(enriched_record)
-        return enriched
+        """Enrich multiple records with province names in one query."""
+        return await enrich_with_province_names(records)
 
     async def get_all_labor_force(
         self,
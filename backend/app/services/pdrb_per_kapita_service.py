@@ -6,6 +6,7 @@ from typing import Optional
 from datetime import datetime
 from app.repositories.pdrb_per_kapita_repo import get_pdrb_per_kapita_repository
 from app.models.pdrb_per_kapita_model import PDRBPerKapitaModel
+from app.services.year_based_scoring_service import year_based_scoring_service
 
 
 class PDRBPerKapitaService:
@@ -35,7 +36,9 @@ class PDRBPerKapitaService:
         """Create new pdrb_per_kapita record."""
         data = PDRBPerKapitaModel(**data_dict)
         repo = await get_pdrb_per_kapita_repository()
-        return await repo.create(data)
+        result = await repo.create(data)
+        await year_based_scoring_service.refresh_year(data.tahun)
+        return result
 
     async def update(
         self, province_id: str, tahun: int, indikator: str, update_data: dict
@@ -43,12 +46,16 @@ class PDRBPerKapitaService:
         """Update pdrb_per_kapita record."""
         update_data["updated_at"] = datetime.utcnow()
         repo = await get_pdrb_per_kapita_repository()
-        return await repo.update(province_id, tahun, indikator, update_data)
+        result = await repo.update(province_id, tahun, indikator, update_data)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
     async def delete(self, province_id: str, tahun: int, indikator: str) -> bool:
         """Delete pdrb_per_kapita record."""
         repo = await get_pdrb_per_kapita_repository()
-        return await repo.delete(province_id, tahun, indikator)
+        result = await repo.delete(province_id, tahun, indikator)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
 
 pdrb_per_kapita_service = PDRBPerKapitaService()
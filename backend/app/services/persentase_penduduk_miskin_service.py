@@ -6,6 +6,8 @@ from typing import Optional
 from app.db.client import get_database
 from app.models.persentase_penduduk_miskin import PersentasePendudukMiskinRecord
 from app.repositories.persentase_penduduk_miskin_repo import PersentasePendudukMiskinRepository
+from app.services.province_names import enrich_with_province_names
+from app.services.year_based_scoring_service import year_based_scoring_service
 
 
 class PersentasePendudukMiskinService:
@@ -33,7 +35,7 @@ class PersentasePendudukMiskinService:
             filters["year"] = year
 
         records, total = await repo.find_all(filters, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
@@ -52,7 +54,7 @@ class PersentasePendudukMiskinService:
         repo = PersentasePendudukMiskinRepository(db)
 
         records, total = await repo.find_by_province(province_id, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
@@ -71,40 +73,23 @@ class PersentasePendudukMiskinService:
         repo = PersentasePendudukMiskinRepository(db)
 
         records, total = await repo.find_by_year(year, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
-    async def _enrich_with_province_name(self, record: dict, repo: PersentasePendudukMiskinRepository) -> dict:
-        """Add province name to record from provinces collection.
-        
-        Args:
-            record: Raw database record
-            repo: PersentasePendudukMiskinRepository instance
-            
-        Returns:
-            Record with province_name added
-        """
-        province_name = await repo.get_province_name(record.get("province_id", ""))
-        record["province_name"] = province_name
-        return record
-
-    async def _enrich_records_with_province_names(self, records: list, repo: PersentasePendudukMiskinRepository) -> list[PersentasePendudukMiskinRecord]:
+    async def _enrich_records_with_province_names(self, records: list) -> list[PersentasePendudukMiskinRecord]:
         """Enrich multiple records with province names.
         
+        All names of the page are resolved with a single query.
+        
         Args:
             records: List of raw database records
-            repo: PersentasePendudukMiskinRepository instance
             
         Returns:
             List of PersentasePendudukMiskinRecord models with province names
         """
-        enriched = []
-        for record in records:
-            enriched_record = await self._enrich_with_province_name(record, repo)
-            enriched.append(PersentasePendudukMiskinRecord(**enriched_record))
-
-        return enriched
+        enriched = await enrich_with_province_names(records)
+        return [PersentasePendudukMiskinRecord(**record) for record in enriched]
 
     # CRUD methods for new CRUD router
     async def get_by_province_and_year(self, province_id: str, year: int):
@@ -117,19 +102,25 @@ class PersentasePendudukMiskinService:
         """Create new record."""
         db = await get_database()
         repo = PersentasePendudukMiskinRepository(db)
-        return await repo.create(data)
+        result = await repo.create(data)
+        await year_based_scoring_service.refresh_year(data.get("tahun"))
+        return result
 
     async def update(self, province_id: str, year: int, data: dict) -> bool:
         """Update existing record."""
         db = await get_database()
         repo = PersentasePendudukMiskinRepository(db)
-        return await repo.update(province_id, year, data)
+        result = await repo.update(province_id, year, data)
+        await year_based_scoring_service.refresh_year(year)
+        return result
 
     async def delete(self, province_id: str, year: int) -> bool:
         """Delete record."""
         db = await get_database()
         repo = PersentasePendudukMiskinRepository(db)
-        return await repo.delete(province_id, year)
+        result = await repo.delete(province_id, year)
+        await year_based_scoring_service.refresh_year(year)
+        return result
 
 
 # Singleton instance for dependency injection
@@ -0,0 +1,42 @@
+"""
+Province names - Batched province name lookups for API responses.
+
+Resolves every province_id of a page at once from the in-memory
+province registry instead of one ``find_one`` per record.
+"""
+
+from typing import Iterable, List, Dict
+
+from app.services.province_resolver import province_resolver
+
+
+async def get_province_names(province_ids: Iterable[str]) -> Dict[str, str]:
+    """
+    Resolve province names for many IDs.
+
+    Args:
+        province_ids: Province IDs to resolve
+
+    Returns:
+        Dictionary mapping province_id to province name.
+        Unknown IDs are left out.
+    """
+    return await province_resolver.get_names(province_ids)
+
+
+async def enrich_with_province_names(records: List[Dict]) -> List[Dict]:
+    """
+    Set ``province_name`` on every record from its ``province_id``.
+
+    Records are updated in place; unknown provinces get None.
+
+    Args:
+        records: Raw database records
+
+    Returns:
+        The same records with province_name added
+    """
+    names = await get_province_names(record.get("province_id") for record in records)
+    for record in records:
+        record["province_name"] = names.get(record.get("province_id"))
+    return records
@@ -0,0 +1,213 @@
+"""
+Province resolver - Process-wide in-memory province registry.
+
+Loads the provinces collection once and answers both directions of
+lookup from memory: normalized name -> ID for CSV imports and
+ID -> display name for API responses. Entries expire after a TTL and
+are dropped explicitly when regions change.
+"""
+
+import asyncio
+import re
+import time
+from typing import Iterable, Optional, Dict
+
+import pandas as pd
+
+from app.db import get_database
+from app.logging import get_logger
+from app.common.provinces import PROVINCE_NAMES
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# BPS table prefixes expanded before lookup
+_PREFIXES = (
+    (re.compile(r"^PROV\.?\s+"), ""),
+    (re.compile(r"^KEP\.?\s+"), "KEPULAUAN "),
+    (re.compile(r"^DI\.?\s+"), "DAERAH ISTIMEWA "),
+)
+
+
+def normalize_province_name(name: str) -> str:
+    """
+    Normalize a province name for lookup.
+
+    Upper-cases, collapses whitespace and expands the prefixes BPS
+    tables use: ``PROV.`` is dropped, ``KEP.`` becomes ``KEPULAUAN`` and
+    ``DI.`` becomes ``DAERAH ISTIMEWA``.
+
+    Args:
+        name: Raw province name from a CSV cell or database document
+
+    Returns:
+        Normalized name used as index key
+    """
+    text = _WHITESPACE.sub(" ", str(name)).strip().upper()
+    for pattern, replacement in _PREFIXES:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def normalize_province_names(names: pd.Series) -> pd.Series:
+    """
+    Vectorized ``normalize_province_name`` for a whole column.
+
+    Args:
+        names: Raw province names (any dtype, missing values included)
+
+    Returns:
+        Series of normalized names aligned with the input
+    """
+    # Normalize each distinct name once, then broadcast back to the rows
+    codes, uniques = pd.factorize(names.astype(str))
+    text = pd.Series(uniques, dtype=object).str.replace(_WHITESPACE, " ", regex=True).str.strip().str.upper()
+    for pattern, replacement in _PREFIXES:
+        text = text.str.replace(pattern, replacement, regex=True)
+    return pd.Series(text.to_numpy()[codes], index=names.index, dtype=object)
+
+
+class ProvinceResolver:
+    """
+    Cached registry of province IDs and names.
+
+    Both maps are built lazily on first use (or by ``warm`` at startup)
+    and rebuilt once ``TTL_SECONDS`` have passed or after ``invalidate``
+    is called (e.g. when regions are created or renamed).
+    """
+
+    TTL_SECONDS = 300
+
+    def __init__(self):
+        self._index: Optional[Dict[str, str]] = None
+        self._names: Optional[Dict[str, str]] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        # Bumped on invalidation so a load racing a region write is not kept
+        self._generation = 0
+
+    @staticmethod
+    def _extract(doc: Dict) -> tuple[Optional[str], Optional[str]]:
+        """
+        Get (province_id, province_name) from a provinces document.
+
+        Supports both the GeoJSON layout (``properties.id``/``PROVINSI``)
+        and the flat layout written by RegionService.
+        """
+        properties = doc.get("properties") or {}
+        province_id = properties.get("id") or doc.get("id")
+        name = properties.get("PROVINSI") or doc.get("PROVINSI")
+        return province_id, name
+
+    async def _load(self) -> tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Read the provinces collection in one query.
+
+        Returns:
+            Tuple of (normalized name -> province_id, province_id -> name).
+            Both are seeded from PROVINCE_NAMES, so they are never empty;
+            documents in the collection override the seed.
+        """
+        db = await get_database()
+        cursor = db["provinces"].find(
+            {},
+            {"id": 1, "PROVINSI": 1, "properties.id": 1, "properties.PROVINSI": 1}
+        )
+
+        index = {normalize_province_name(name): pid for pid, name in PROVINCE_NAMES.items()}
+        names = dict(PROVINCE_NAMES)
+        async for doc in cursor:
+            province_id, name = self._extract(doc)
+            if province_id and name:
+                index[normalize_province_name(name)] = province_id
+                names[province_id] = name
+
+        logger.info(f"Loaded {len(index)} province names into registry")
+        return index, names
+
+    def _is_fresh(self) -> bool:
+        """Check whether the cached maps exist and are within the TTL."""
+        return (
+            self._index is not None
+            and time.monotonic() - self._loaded_at < self.TTL_SECONDS
+        )
+
+    async def _ensure_loaded(self) -> tuple[Dict[str, str], Dict[str, str]]:
+        """Return the cached maps, reloading them when missing or expired."""
+        if self._is_fresh():
+            return self._index, self._names
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._index, self._names
+            generation = self._generation
+            index, names = await self._load()
+            if generation == self._generation:
+                self._index = index
+                self._names = names
+                self._loaded_at = time.monotonic()
+            return index, names
+
+    async def get_index(self) -> Dict[str, str]:
+        """
+        Get the normalized name -> province_id index, loading it if needed.
+
+        Returns:
+            Dictionary keyed by ``normalize_province_name`` output
+        """
+        index, _ = await self._ensure_loaded()
+        return index
+
+    async def get_names(self, province_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Get display names for many province IDs.
+
+        Args:
+            province_ids: Province IDs to resolve
+
+        Returns:
+            Dictionary mapping province_id to name; unknown IDs are left out
+        """
+        _, names = await self._ensure_loaded()
+        return {pid: names[pid] for pid in province_ids if pid in names}
+
+    async def get_name(self, province_id: str) -> Optional[str]:
+        """
+        Get the display name of a province.
+
+        Args:
+            province_id: Province ID
+
+        Returns:
+            Province name or None if the ID is unknown
+        """
+        _, names = await self._ensure_loaded()
+        return names.get(province_id)
+
+    async def resolve(self, province_name: str) -> Optional[str]:
+        """
+        Resolve a province name to its ID.
+
+        Args:
+            province_name: Raw province name, prefixes allowed
+
+        Returns:
+            Province ID or None if the name is unknown
+        """
+        index = await self.get_index()
+        return index.get(normalize_province_name(province_name))
+
+    async def warm(self) -> None:
+        """Load the registry ahead of the first request."""
+        await self._ensure_loaded()
+
+    def invalidate(self) -> None:
+        """Drop the cached maps so the next lookup reloads provinces."""
+        self._generation += 1
+        self._index = None
+        self._names = None
+
+
+# Singleton instance
+province_resolver = ProvinceResolver()
@@ -6,6 +6,7 @@ from typing import Optional
 from datetime import datetime
 from app.repositories.rata_rata_upah_bersih_repo import get_rata_rata_upah_bersih_repository
 from app.models.rata_rata_upah_bersih_model import RataRataUpahBersihModel
+from app.services.year_based_scoring_service import year_based_scoring_service
 
 
 class RataRataUpahBersihService:
@@ -35,7 +36,9 @@ class RataRataUpahBersihService:
         """Create new rata_rata_upah_bersih record."""
         data = RataRataUpahBersihModel(**data_dict)
         repo = await get_rata_rata_upah_bersih_repository()
-        return await repo.create(data)
+        result = await repo.create(data)
+        await year_based_scoring_service.refresh_year(data.tahun)
+        return result
 
     async def update(
         self, province_id: str, tahun: int, update_data: dict
@@ -43,12 +46,16 @@ class RataRataUpahBersihService:
         """Update rata_rata_upah_bersih record."""
         update_data["updated_at"] = datetime.utcnow()
         repo = await get_rata_rata_upah_bersih_repository()
-        return await repo.update(province_id, tahun, update_data)
+        result = await repo.update(province_id, tahun, update_data)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
     async def delete(self, province_id: str, tahun: int) -> bool:
         """Delete rata_rata_upah_bersih record."""
         repo = await get_rata_rata_upah_bersih_repository()
-        return await repo.delete(province_id, tahun)
+        result = await repo.delete(province_id, tahun)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
 
 rata_rata_upah_bersih_service = RataRataUpahBersihService()
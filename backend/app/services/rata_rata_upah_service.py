@@ -6,6 +6,7 @@ from typing import Optional
 from app.db.client import get_database
 from app.models.rata_rata_upah import RataRataUpahBersihRecord
 from app.repositories.rata_rata_upah_repo import RataRataUpahRepository
+from app.services.province_names import enrich_with_province_names
 
 
 class RataRataUpahService:
@@ -33,7 +34,7 @@ class RataRataUpahService:
             filters["year"] = year
 
         records, total = await repo.find_all(filters, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
@@ -52,7 +53,7 @@ class RataRataUpahService:
         repo = RataRataUpahRepository(db)
 
         records, total = await repo.find_by_province(province_id, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
@@ -71,37 +72,20 @@ class RataRataUpahService:
         repo = RataRataUpahRepository(db)
 
         records, total = await repo.find_by_year(year, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
-    async def _enrich_with_province_name(self, record: dict, repo: RataRataUpahRepository) -> dict:
-        """Add province name to record from provinces collection.
-        
-        Args:
-            record: Raw database record
-            repo: RataRataUpahRepository instance
-            
-        Returns:
-            Record with province_name added
-        """
-        province_name = await repo.get_province_name(record.get("province_id", ""))
-        record["province_name"] = province_name
-        return record
-
-    async def _enrich_records_with_province_names(self, records: list, repo: RataRataUpahRepository) -> list[RataRataUpahBersihRecord]:
+    async def _enrich_records_with_province_names(self, records: list) -> list[RataRataUpahBersihRecord]:
         """Enrich multiple records with province names.
         
+        All names of the page are resolved with a single query.
+        
         Args:
             records: List of raw database records
-            repo: RataRataUpahRepository instance
             
         Returns:
             List of RataRataUpahBersihRecord models with province names
         """
-        enriched = []
-        for record in records:
-            enriched_record = await self._enrich_with_province_name(record, repo)
-            enriched.append(RataRataUpahBersihRecord(**enriched_record))
-
-        return enriched
+        enriched = await enrich_with_province_names(records)
+        return [RataRataUpahBersihRecord(**record) for record in enriched]
@@ -6,13 +6,18 @@ from typing import Optional
 
 from app.repositories import get_region_repository
 from app.models import RegionModel
+from app.services.geo_service import FULL_RESOLUTION, MAP_RESOLUTION, PROVINCE_RESOLUTION, geo_service
+from app.services.province_resolver import province_resolver
+
+# Resolution that leaves geometry out of region responses
+NO_GEOMETRY = "none"
 
 
 class RegionService:
     """Service layer for region business logic."""
 
     async def get_all_regions(
-        self, page: int = 1, page_size: int = 20
+        self, page: int = 1, page_size: int = 20, resolution: str = MAP_RESOLUTION
     ) -> tuple[list[dict], int]:
         """
         Get all regions with pagination.
@@ -20,18 +25,47 @@ class RegionService:
         Args:
             page: Page number (1-indexed)
             page_size: Number of items per page
+            resolution: Geometry resolution, "none" to leave it out
 
         Returns:
             Tuple of (regions list, total count)
         """
         skip = (page - 1) * page_size
         repo = await get_region_repository()
-        return await repo.find_all(skip=skip, limit=page_size)
+        regions, total = await repo.find_all(
+            skip=skip, limit=page_size, include_geometry=resolution == FULL_RESOLUTION
+        )
+        await self._attach_geometry(regions, resolution)
+        return regions, total
 
-    async def get_region_by_code(self, code: str) -> Optional[dict]:
+    async def get_region_by_code(
+        self, code: str, resolution: str = PROVINCE_RESOLUTION
+    ) -> Optional[dict]:
         """Get a single region by its code."""
         repo = await get_region_repository()
-        return await repo.find_by_code(code)
+        region = await repo.find_by_code(code, include_geometry=resolution == FULL_RESOLUTION)
+        if region:
+            await self._attach_geometry([region], resolution)
+        return region
+
+    @staticmethod
+    async def _attach_geometry(regions: list[dict], resolution: str) -> None:
+        """Replace stored geometry with a precomputed simplified variant."""
+        if resolution == FULL_RESOLUTION:
+            return
+        if resolution == NO_GEOMETRY:
+            for region in regions:
+                region["geometry"] = None
+            return
+
+        geometries = await geo_service.get_geometry_index(resolution)
+        for region in regions:
+            properties = region.get("properties") or {}
+            keys = (region.get("id"), region.get("KODE_PROV"), properties.get("KODE_PROV"))
+            region["geometry"] = next(
+                (geometries[str(key)] for key in keys if key is not None and str(key) in geometries),
+                None,
+            )
 
     async def create_region(self, region_data: dict) -> str:
         """
@@ -58,17 +92,23 @@ class RegionService:
             region = RegionModel(**region_data)
         
         repo = await get_region_repository()
-        return await repo.create(region)
+        region_id = await repo.create(region)
+        province_resolver.invalidate()
+        return region_id
 
     async def update_region(self, code: str, update_data: dict) -> bool:
         """Update a region by code."""
         repo = await get_region_repository()
-        return await repo.update(code, update_data)
+        updated = await repo.update(code, update_data)
+        province_resolver.invalidate()
+        return updated
 
     async def delete_region(self, code: str) -> bool:
         """Delete a region by code."""
         repo = await get_region_repository()
-        return await repo.delete(code)
+        deleted = await repo.delete(code)
+        province_resolver.invalidate()
+        return deleted
 
 
 # Singleton instance
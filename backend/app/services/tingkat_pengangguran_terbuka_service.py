@@ -6,6 +6,7 @@ from typing import Optional
 from app.db.client import get_database
 from app.models.tingkat_pengangguran_terbuka import TingkatPengangguranTerbukaRecord
 from app.repositories.tingkat_pengangguran_terbuka_repo import TingkatPengangguranTerbukaRepository
+from app.services.province_names import enrich_with_province_names
 
 
 class TingkatPengangguranTerbukaService:
@@ -33,7 +34,7 @@ class TingkatPengangguranTerbukaService:
             filters["year"] = year
 
         records, total = await repo.find_all(filters, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
@@ -52,7 +53,7 @@ class TingkatPengangguranTerbukaService:
         repo = TingkatPengangguranTerbukaRepository(db)
 
         records, total = await repo.find_by_province(province_id, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
@@ -71,37 +72,20 @@ class TingkatPengangguranTerbukaService:
         repo = TingkatPengangguranTerbukaRepository(db)
 
         records, total = await repo.find_by_year(year, skip, limit)
-        enriched_records = await self._enrich_records_with_province_names(records, repo)
+        enriched_records = await self._enrich_records_with_province_names(records)
 
         return enriched_records, total
 
-    async def _enrich_with_province_name(self, record: dict, repo: TingkatPengangguranTerbukaRepository) -> dict:
-        """Add province name to record from provinces collection.
-        
-        Args:
-            record: Raw database record
-            repo: TingkatPengangguranTerbukaRepository instance
-            
-        Returns:
-            Record with province_name added
-        """
-        province_name = await repo.get_province_name(record.get("province_id", ""))
-        record["province_name"] = province_name
-        return record
-
-    async def _enrich_records_with_province_names(self, records: list, repo: TingkatPengangguranTerbukaRepository) -> list[TingkatPengangguranTerbukaRecord]:
+    async def _enrich_records_with_province_names(self, records: list) -> list[TingkatPengangguranTerbukaRecord]:
         """Enrich multiple records with province names.
         
+        All names of the page are resolved with a single query.
+        
         Args:
             records: List of raw database records
-            repo: TingkatPengangguranTerbukaRepository instance
             
         Returns:
             List of TingkatPengangguranTerbukaRecord models with province names
         """
-        enriched = []
-        for record in records:
-            enriched_record = await self._enrich_with_province_name(record, repo)
-            enriched.append(TingkatPengangguranTerbukaRecord(**enriched_record))
-
-        return enriched
+        enriched = await enrich_with_province_names(records)
+        return [TingkatPengangguranTerbukaRecord(**record) for record in enriched]
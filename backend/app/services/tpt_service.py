@@ -6,6 +6,7 @@ from typing import Optional
 from datetime import datetime
 from app.repositories.tpt_repo import get_tpt_repository
 from app.models.tpt_model import TingkatPengangguranTerbukaModel
+from app.services.year_based_scoring_service import year_based_scoring_service
 
 
 class TPTService:
@@ -35,7 +36,9 @@ class TPTService:
         """Create new TPT record."""
         data = TingkatPengangguranTerbukaModel(**data_dict)
         repo = await get_tpt_repository()
-        return await repo.create(data)
+        result = await repo.create(data)
+        await year_based_scoring_service.refresh_year(data.tahun)
+        return result
 
     async def update(
         self, province_id: str, tahun: int, update_data: dict
@@ -43,12 +46,16 @@ class TPTService:
         """Update TPT record."""
         update_data["updated_at"] = datetime.utcnow()
         repo = await get_tpt_repository()
-        return await repo.update(province_id, tahun, update_data)
+        result = await repo.update(province_id, tahun, update_data)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
     async def delete(self, province_id: str, tahun: int) -> bool:
         """Delete TPT record."""
         repo = await get_tpt_repository()
-        return await repo.delete(province_id, tahun)
+        result = await repo.delete(province_id, tahun)
+        await year_based_scoring_service.refresh_year(tahun)
+        return result
 
 
 tpt_service = TPTService()
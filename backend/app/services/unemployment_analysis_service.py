@@ -5,7 +5,9 @@ Service for unemployment rate analysis, scoring, and alerts.
 from typing import List, Optional, Tuple
 import statistics
 from app.db.client import get_database
+from app.db.fanout import fan_out
 from app.repositories.tingkat_pengangguran_terbuka_repo import TingkatPengangguranTerbukaRepository
+from app.services.province_resolver import province_resolver
 from app.models.unemployment_analysis import (
     UnemploymentScore, TrendAnalysis, Alert, ProvinceAnalysis,
     RegionalGapAnalysis, ComparisonAnalysis, SeverityLevel, TrendDirection
@@ -135,15 +137,19 @@ class UnemploymentAnalysisService:
         db = await get_database()
         repo = TingkatPengangguranTerbukaRepository(db)
         
-        # Get all provinces for the year
-        records, _ = await repo.find_by_year(year, skip=0, limit=100)
+        # Get all provinces for the year, and the previous year for trends
+        results = await fan_out({
+            f"tpt:{year}": repo.find_by_year(year, skip=0, limit=100),
+            f"tpt:{year - 1}": repo.find_by_year(year - 1, skip=0, limit=100),
+        })
+        records, _ = results[f"tpt:{year}"]
         
         if not records:
             raise ValueError(f"No data found for year {year}")
         
-        # Get previous year data for trend analysis
-        prev_year_records, _ = await repo.find_by_year(year - 1, skip=0, limit=100)
+        prev_year_records, _ = results[f"tpt:{year - 1}"]
         prev_year_map = {r.get("province_id"): r for r in prev_year_records}
+        province_names = await province_resolver.get_names(r.get("province_id") for r in records)
         
         # Analyze each province
         province_analyses = []
@@ -151,7 +157,7 @@ class UnemploymentAnalysisService:
         
         for record in records:
             province_id = record.get("province_id")
-            province_name = await repo.get_province_name(province_id) or province_id
+            province_name = province_names.get(province_id) or province_id
             
             # Use tahunan (annual) rate, fallback to agustus
             unemployment_rate = record.get("data", {}).get("tahunan") or record.get("data", {}).get("agustus")
@@ -226,8 +232,12 @@ class UnemploymentAnalysisService:
         repo = TingkatPengangguranTerbukaRepository(db)
         
         # Get data for both years
-        records_from, _ = await repo.find_by_year(year_from, skip=0, limit=100)
-        records_to, _ = await repo.find_by_year(year_to, skip=0, limit=100)
+        results = await fan_out({
+            "from": repo.find_by_year(year_from, skip=0, limit=100),
+            "to": repo.find_by_year(year_to, skip=0, limit=100),
+        })
+        records_from, _ = results["from"]
+        records_to, _ = results["to"]
         
         # Create maps for easy lookup
         map_from = {r.get("province_id"): r for r in records_from}
@@ -235,6 +245,7 @@ class UnemploymentAnalysisService:
         
         # Find common provinces
         common_provinces = set(map_from.keys()) & set(map_to.keys())
+        province_names = await province_resolver.get_names(common_provinces)
         
         improved = []
         worsened = []
@@ -247,7 +258,7 @@ class UnemploymentAnalysisService:
             if rate_from is None or rate_to is None:
                 continue
             
-            province_name = await repo.get_province_name(province_id) or province_id
+            province_name = province_names.get(province_id) or province_id
             trend = self.analyze_trend(rate_from, rate_to, year_from, year_to)
             score = self.calculate_score(rate_to)
             alerts = self.generate_alerts(province_name, score, trend)
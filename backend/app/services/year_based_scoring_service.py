@@ -3,11 +3,20 @@ Year-based scoring service - Business logic for year-based regional scoring.
 Scores each collection individually and aggregates them.
 """
 
+import asyncio
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 import numpy as np
 
-from app.db import get_database
+from app.logging import get_logger
+from app.common.indicators import COLLECTION_CONFIGS
+from app.db import get_database, fan_out
+from app.common.executors import run_scoring
+from app.repositories.year_scores_repo import get_year_scores_repository
+from app.services.province_names import get_province_names
+from app.services.year_scoring_engine import YearScoreSnapshot, compute_year_snapshot
+
+logger = get_logger(__name__)
 
 
 class YearBasedScoringService:
@@ -16,58 +25,45 @@ class YearBasedScoringService:
     
     Scores each collection individually using min-max normalization,
     then aggregates scores across all collections.
+
+    Ranked results are cached per year in-process and materialized into
+    the ``year_scores`` collection. Any write to indicator data must call
+    ``refresh_year`` so both are rebuilt for the affected year.
     """
     
-    # Collection configurations
-    # Format: collection_name: (field_to_score, lower_is_better)
-    COLLECTION_CONFIGS = {
-        "gini_ratio": {
-            "field": "data_semester_2.total",  # Use semester 2 data (tahunan is null)
-            "lower_is_better": True,
-            "display_name": "Gini Ratio"
-        },
-        "indeks_pembangunan_manusia": {
-            "field": "data",  # Direct float field
-            "lower_is_better": False,
-            "display_name": "Indeks Pembangunan Manusia"
-        },
-        "tingkat_pengangguran_terbuka": {
-            "field": "data.agustus",  # Use August data (tahunan is null)
-            "lower_is_better": True,
-            "display_name": "Tingkat Pengangguran Terbuka"
-        },
-        "persentase_penduduk_miskin": {
-            "field": "data_semester_2.total",  # Use semester 2 data
-            "lower_is_better": True,
-            "display_name": "Persentase Penduduk Miskin"
-        },
-        "pdrb_per_kapita": {
-            "field": "data_ribu_rp",  # PDRB in thousands of rupiah
-            "lower_is_better": False,
-            "display_name": "PDRB Per Kapita"
-        },
-        "rata_rata_upah": {
-            "field": "sektor.total.agustus",  # Total sector, August data (tahunan is null)
-            "lower_is_better": False,
-            "display_name": "Rata-rata Upah Bersih"
-        },
-        "inflasi_tahunan": {
-            "field": "data_bulanan.desember",  # Use December data (tahunan is null)
-            "lower_is_better": True,
-            "display_name": "Inflasi Tahunan"
-        },
-        "indeks_harga_konsumen": {
-            "field": "data_bulanan.desember",  # Use December data (tahunan is null)
-            "lower_is_better": True,
-            "display_name": "Indeks Harga Konsumen"
-        },
-        "angkatan_kerja": {
-            "field": "data_agustus.persentase_bekerja_ak",  # Use August data for labor force participation
-            "lower_is_better": False,
-            "display_name": "Angkatan Kerja (% Bekerja)"
-        }
-    }
+    # Scored collections, see app.common.indicators
+    COLLECTION_CONFIGS = COLLECTION_CONFIGS
     
+    def __init__(self):
+        # year -> snapshot, or None for a year without data
+        self._snapshot_cache: Dict[int, Optional[YearScoreSnapshot]] = {}
+        # year -> computation shared by concurrent cold reads of that year
+        self._in_flight: Dict[int, asyncio.Task] = {}
+        # collection_name -> sorted years with data, built with distinct()
+        self._years_index: Optional[Dict[str, List[int]]] = None
+        # Bumped on every invalidation so in-flight computations that
+        # started before a write never repopulate the cache with stale data
+        self._cache_generation = 0
+        # Cleared when the backend lacks $unionWith (mongomock)
+        self._union_supported = True
+
+    def invalidate(self, year: Optional[int] = None) -> None:
+        """
+        Drop cached year snapshots after indicator data changes.
+
+        Args:
+            year: Year whose data changed, or None to drop every year
+        """
+        self._cache_generation += 1
+        # A write may add a year to any collection
+        self._years_index = None
+        if year is None:
+            self._snapshot_cache.clear()
+            self._in_flight.clear()
+        else:
+            self._snapshot_cache.pop(int(year), None)
+            self._in_flight.pop(int(year), None)
+
     @staticmethod
     def _get_field_value(doc: Dict, field_path: str) -> Optional[float]:
         """
@@ -91,6 +87,42 @@ class YearBasedScoringService:
         
         return float(value) if value is not None else None
     
+    def _value_pipeline(self, collection_name: str, year: int) -> List[Dict[str, Any]]:
+        """
+        Build the aggregation stages that extract ``(province_id, value)``
+        pairs of one collection server-side.
+
+        The configured dot-notation field is resolved by MongoDB, so only
+        the two projected fields cross the wire. The raw value is cast with
+        ``_to_float`` on read; a server-side ``$convert`` is not supported
+        by mongomock, which the benchmark suite runs against.
+
+        Args:
+            collection_name: Name of the collection
+            year: Year to filter
+
+        Returns:
+            List of aggregation stages
+        """
+        field_path = self.COLLECTION_CONFIGS[collection_name]["field"]
+        return [
+            {"$match": {"tahun": year, field_path: {"$ne": None}}},
+            {"$project": {
+                "_id": 0,
+                "collection": {"$literal": collection_name},
+                "province_id": 1,
+                "value": f"${field_path}",
+            }},
+        ]
+
+    @staticmethod
+    def _to_float(value: Any) -> Optional[float]:
+        """Cast a projected value to float, None if it is not numeric."""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
     async def get_collection_data_for_year(
         self, 
         collection_name: str, 
@@ -106,27 +138,73 @@ class YearBasedScoringService:
         Returns:
             List of documents with province_id and value
         """
-        db = await get_database()
-        collection = db[collection_name]
-        
-        config = self.COLLECTION_CONFIGS.get(collection_name)
-        if not config:
+        if collection_name not in self.COLLECTION_CONFIGS:
             return []
-        
-        # Query MongoDB for the year
-        cursor = collection.find({"tahun": year})
-        
-        results = []
+
+        db = await get_database()
+        cursor = db[collection_name].aggregate(
+            self._value_pipeline(collection_name, year)
+        )
+
+        rows = []
         async for doc in cursor:
-            value = self._get_field_value(doc, config["field"])
+            value = self._to_float(doc.get("value"))
             if value is not None:
-                results.append({
-                    "province_id": doc.get("province_id"),
-                    "value": value
-                })
-        
-        return results
-    
+                rows.append({"province_id": doc.get("province_id"), "value": value})
+        return rows
+
+    async def get_year_values(self, year: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get ``(province_id, value)`` pairs of every scored collection for a
+        year in a single round-trip.
+
+        The first collection is aggregated directly and the others are
+        appended with ``$unionWith``; each row is tagged with its collection.
+        Backends without ``$unionWith`` (mongomock) get one aggregation
+        per collection instead.
+
+        Args:
+            year: Year to filter
+
+        Returns:
+            Dictionary mapping collection_name to list of province_id/value
+        """
+        collection_names = list(self.COLLECTION_CONFIGS.keys())
+        if not self._union_supported:
+            results = await fan_out({
+                name: self.get_collection_data_for_year(name, year)
+                for name in collection_names
+            })
+            return {name: results[name] for name in collection_names}
+
+        values: Dict[str, List[Dict[str, Any]]] = {name: [] for name in collection_names}
+
+        first, *others = collection_names
+        pipeline = self._value_pipeline(first, year)
+        for name in others:
+            pipeline.append({
+                "$unionWith": {
+                    "coll": name,
+                    "pipeline": self._value_pipeline(name, year),
+                }
+            })
+
+        db = await get_database()
+        try:
+            async for doc in db[first].aggregate(pipeline):
+                value = self._to_float(doc.get("value"))
+                if value is not None:
+                    values[doc["collection"]].append({
+                        "province_id": doc.get("province_id"),
+                        "value": value,
+                    })
+        except NotImplementedError:
+            logger.warning("$unionWith is not supported by this backend, reading collections one by one")
+            self._union_supported = False
+            return await self.get_year_values(year)
+
+        return values
+
     @staticmethod
     def calculate_min_max_score(
         value: float,
@@ -202,6 +280,114 @@ class YearBasedScoringService:
         
         return scores
     
+    @staticmethod
+    def _is_valid_province_id(province_id: Any) -> bool:
+        """
+        Check that a province ID is a 2-digit BPS province code (11-97).
+
+        Includes the new Papua provinces (95, 96, 97).
+        """
+        if not (isinstance(province_id, str) and len(province_id) == 2 and province_id.isdigit()):
+            return False
+        return 11 <= int(province_id) <= 97
+
+    @property
+    def display_names(self) -> Dict[str, str]:
+        """Mapping of collection name to display name."""
+        return {
+            name: config["display_name"]
+            for name, config in self.COLLECTION_CONFIGS.items()
+        }
+
+    async def _get_province_names(self, province_ids: List[str]) -> Dict[str, str]:
+        """
+        Resolve province names for many IDs with a single query.
+
+        Args:
+            province_ids: Province IDs to resolve
+
+        Returns:
+            Dictionary mapping province_id to province name
+        """
+        return await get_province_names(province_ids)
+
+    async def compute_year_snapshot(self, year: int) -> Optional[YearScoreSnapshot]:
+        """
+        Score and rank all provinces for a year in a single pass.
+
+        All collections are read in one aggregation round-trip; scoring,
+        composites and ranks are computed on a province x collection matrix.
+
+        Only 2-digit BPS province codes are scored. Aggregate rows
+        (e.g. the national "00" row) and malformed IDs are dropped before
+        min-max normalization, so they neither get a rank nor stretch the
+        min/max of a collection.
+
+        Args:
+            year: Year to calculate scores for
+
+        Returns:
+            Ranked YearScoreSnapshot, or None if no data exists for the year
+        """
+        year_values = await self.get_year_values(year)
+
+        values_by_collection = {}
+        for collection_name, data in year_values.items():
+            values_by_collection[collection_name] = {
+                item["province_id"]: item["value"]
+                for item in data
+                if self._is_valid_province_id(item["province_id"])
+            }
+
+        # Scoring one year takes about a millisecond; see executor_scoring_mode
+        snapshot = await run_scoring(
+            compute_year_snapshot,
+            year,
+            list(self.COLLECTION_CONFIGS.keys()),
+            [config["lower_is_better"] for config in self.COLLECTION_CONFIGS.values()],
+            values_by_collection,
+        )
+        if snapshot is None:
+            return None
+
+        snapshot.province_names = await self._get_province_names(snapshot.province_ids)
+        return snapshot
+
+    async def get_year_snapshot(self, year: int) -> Optional[YearScoreSnapshot]:
+        """
+        Get the ranked snapshot for a year, computing it on a cache miss.
+
+        Years without data are cached as None too. Concurrent cold reads
+        of a year share one computation; a write started meanwhile
+        detaches it, so later reads compute afresh.
+
+        Args:
+            year: Year to get scores for
+
+        Returns:
+            Cached or freshly computed YearScoreSnapshot, or None if no data
+        """
+        if year in self._snapshot_cache:
+            return self._snapshot_cache[year]
+
+        task = self._in_flight.get(year)
+        if task is None:
+            task = asyncio.create_task(self._compute_and_cache(year, self._cache_generation))
+            self._in_flight[year] = task
+        # A cancelled reader must not cancel the computation others await
+        return await asyncio.shield(task)
+
+    async def _compute_and_cache(self, year: int, generation: int) -> Optional[YearScoreSnapshot]:
+        """Compute a year and cache it unless data changed meanwhile."""
+        try:
+            snapshot = await self.compute_year_snapshot(year)
+            if generation == self._cache_generation:
+                self._snapshot_cache[year] = snapshot
+            return snapshot
+        finally:
+            if self._in_flight.get(year) is asyncio.current_task():
+                del self._in_flight[year]
+
     async def calculate_composite_score(
         self,
         province_id: str,
@@ -215,43 +401,17 @@ class YearBasedScoringService:
             year: Year to calculate for
             
         Returns:
-            Dictionary with composite score and breakdown
+            Dictionary with composite score, rank and breakdown
         """
-        collection_scores = {}
-        
-        # Calculate score for each collection
-        for collection_name in self.COLLECTION_CONFIGS.keys():
-            scores = await self.calculate_collection_scores(collection_name, year)
-            if province_id in scores:
-                collection_scores[collection_name] = scores[province_id]
-        
-        if not collection_scores:
+        snapshot = await self.get_year_snapshot(year)
+        if snapshot is None:
             return None
-        
-        # Calculate composite score (average)
-        composite_score = sum(collection_scores.values()) / len(collection_scores)
-        
-        # Get province name from provinces collection (GeoJSON format)
-        db = await get_database()
-        province_name = "Unknown"
-        
-        # Query provinces collection with GeoJSON structure
-        province_doc = await db.provinces.find_one({"properties.id": province_id})
-        if province_doc and "properties" in province_doc and "PROVINSI" in province_doc["properties"]:
-            province_name = province_doc["properties"]["PROVINSI"]
-        
-        return {
-            "province_id": province_id,
-            "province_name": province_name,
-            "year": year,
-            "composite_score": round(composite_score, 2),
-            "collection_scores": {
-                self.COLLECTION_CONFIGS[k]["display_name"]: round(v, 2)
-                for k, v in collection_scores.items()
-            },
-            "collections_scored": len(collection_scores),
-            "calculated_at": datetime.utcnow()
-        }
+
+        position = snapshot.position_of(province_id)
+        if position is None:
+            return None
+
+        return snapshot.to_row(position, self.display_names)
     
     async def calculate_all_scores_for_year(
         self,
@@ -266,37 +426,127 @@ class YearBasedScoringService:
         Returns:
             List of score dictionaries sorted by composite_score (descending)
         """
-        # Get all unique province IDs from any collection
-        db = await get_database()
-        province_ids = set()
-        
-        for collection_name in self.COLLECTION_CONFIGS.keys():
-            collection = db[collection_name]
-            cursor = collection.find({"tahun": year}, {"province_id": 1})
-            async for doc in cursor:
-                if "province_id" in doc:
-                    pid = doc["province_id"]
-                    # Filter: only include valid province IDs (2 digits, 11-97)
-                    # Updated to include new Papua provinces: 95, 96, 97
-                    if isinstance(pid, str) and len(pid) == 2 and pid.isdigit():
-                        pid_int = int(pid)
-                        if 11 <= pid_int <= 97:
-                            province_ids.add(pid)
-        
-        # Calculate composite score for each province
-        results = []
-        for province_id in province_ids:
-            score_data = await self.calculate_composite_score(province_id, year)
-            if score_data:
-                results.append(score_data)
-        
-        # Sort by composite score (descending) and add rank
-        results.sort(key=lambda x: x["composite_score"], reverse=True)
-        for idx, result in enumerate(results, 1):
-            result["rank"] = idx
-        
-        return results
+        snapshot = await self.get_year_snapshot(year)
+        if snapshot is None:
+            return []
+
+        return snapshot.to_rows(self.display_names)
     
+    async def refresh_year(self, year: int) -> int:
+        """
+        Recompute a year after its indicator data changed and persist the
+        ranked rows into the materialized ``year_scores`` collection.
+
+        Failures are logged rather than raised so that a completed import
+        is never reported as failed; the year's watermark stays stale.
+
+        Args:
+            year: Year whose data changed
+
+        Returns:
+            Number of materialized rows written
+        """
+        year = int(year)
+        repo = await get_year_scores_repository()
+        await repo.mark_data_updated(year)
+        self.invalidate(year)
+
+        try:
+            snapshot = await self.get_year_snapshot(year)
+            rows = snapshot.to_rows(self.display_names) if snapshot else []
+            written = await repo.replace_year(year, rows)
+            computed_at = snapshot.calculated_at if snapshot else datetime.utcnow()
+            await repo.mark_computed(year, computed_at)
+        except Exception as e:
+            logger.error(f"Failed to refresh year scores for {year}: {e}")
+            return 0
+
+        logger.info(f"Materialized {written} year scores for {year}")
+        return written
+
+    @staticmethod
+    def _build_watermark(status: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the staleness watermark of a year from its status document.
+
+        Rows are stale when they were never computed or when indicator
+        data was written after the last computation.
+        """
+        status = status or {}
+        computed_at = status.get("computed_at")
+        data_updated_at = status.get("data_updated_at")
+        stale = computed_at is None or (
+            data_updated_at is not None and data_updated_at > computed_at
+        )
+        return {
+            "computed_at": computed_at,
+            "data_updated_at": data_updated_at,
+            "stale": stale,
+        }
+
+    async def get_ranked_scores(self, year: int) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Read the materialized ranking of a year.
+
+        Years that were never materialized (e.g. data imported before the
+        ``year_scores`` collection existed) are computed and stored once.
+
+        Args:
+            year: Year to get scores for
+
+        Returns:
+            Tuple of (rows sorted by rank, staleness watermark)
+        """
+        repo = await get_year_scores_repository()
+        results = await fan_out({
+            "year_scores": repo.find_by_year(year),
+            "year_score_status": repo.get_status(year),
+        })
+        rows, status = results["year_scores"], results["year_score_status"]
+
+        if not rows:
+            rows = await self.calculate_all_scores_for_year(year)
+            if not rows:
+                return [], self._build_watermark(None)
+            try:
+                await repo.replace_year(year, rows)
+                await repo.mark_computed(year, rows[0]["calculated_at"])
+            except Exception as e:
+                # A concurrent request may be materializing the same year
+                logger.warning(f"Could not materialize year scores for {year}: {e}")
+            status = await repo.get_status(year)
+
+        return rows, self._build_watermark(status)
+
+    async def get_province_ranked_score(
+        self,
+        province_id: str,
+        year: int
+    ) -> tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Read the materialized score row of one province.
+
+        Args:
+            province_id: Province ID
+            year: Year
+
+        Returns:
+            Tuple of (score row or None, staleness watermark)
+        """
+        repo = await get_year_scores_repository()
+        results = await fan_out({
+            "year_score": repo.find_by_province_and_year(province_id, year),
+            "year_score_status": repo.get_status(year),
+        })
+        row, status = results["year_score"], results["year_score_status"]
+        if row is not None or (status and status.get("computed_at")):
+            return row, self._build_watermark(status)
+
+        # Year never materialized: build it once, then pick the province
+        rows, watermark = await self.get_ranked_scores(year)
+        row = next((r for r in rows if r["province_id"] == province_id), None)
+        return row, watermark
+
     async def get_score_breakdown(
         self,
         province_id: str,
@@ -304,67 +554,66 @@ class YearBasedScoringService:
     ) -> Optional[Dict[str, Any]]:
         """
         Get detailed score breakdown for a province.
+
+        Served from the year's snapshot: at most one year computation,
+        a cache lookup when warm.
         
         Args:
             province_id: Province ID
             year: Year
             
         Returns:
-            Detailed breakdown with raw values and scores
+            Detailed breakdown with raw values, min/max, scores,
+            composite score and rank
         """
-        db = await get_database()
-        breakdown = {
-            "province_id": province_id,
-            "year": year,
-            "collections": []
-        }
-        
-        for collection_name, config in self.COLLECTION_CONFIGS.items():
-            collection = db[collection_name]
-            doc = await collection.find_one({
-                "province_id": province_id,
-                "tahun": year
-            })
-            
-            if doc:
-                raw_value = self._get_field_value(doc, config["field"])
-                if raw_value is not None:
-                    # Get all values for this year to calculate score
-                    all_data = await self.get_collection_data_for_year(collection_name, year)
-                    values = [item["value"] for item in all_data]
-                    
-                    if values:
-                        min_val = min(values)
-                        max_val = max(values)
-                        score = self.calculate_min_max_score(
-                            raw_value,
-                            min_val,
-                            max_val,
-                            config["lower_is_better"]
-                        )
-                        
-                        breakdown["collections"].append({
-                            "collection": collection_name,
-                            "display_name": config["display_name"],
-                            "raw_value": raw_value,
-                            "score": round(score, 2),
-                            "min_value": min_val,
-                            "max_value": max_val,
-                            "lower_is_better": config["lower_is_better"]
-                        })
-        
-        if not breakdown["collections"]:
+        snapshot = await self.get_year_snapshot(year)
+        if snapshot is None:
             return None
-        
-        # Add composite score
-        composite = await self.calculate_composite_score(province_id, year)
-        if composite:
-            breakdown["composite_score"] = composite["composite_score"]
-            breakdown["province_name"] = composite["province_name"]
-            breakdown["rank"] = composite.get("rank")
-        
-        return breakdown
+
+        position = snapshot.position_of(province_id)
+        if position is None:
+            return None
+
+        return snapshot.to_breakdown(position, self.display_names)
     
+    @staticmethod
+    def _to_year(value: Any) -> Optional[int]:
+        """Coerce a stored ``tahun`` value to an int year, or None."""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    async def get_years_index(self) -> Dict[str, List[int]]:
+        """
+        Get the years with data per collection.
+
+        Built with one server-side ``distinct`` per collection, run
+        concurrently, and cached until the next ``invalidate``.
+
+        Returns:
+            Dictionary mapping collection_name to sorted years
+        """
+        if self._years_index is not None:
+            return self._years_index
+
+        generation = self._cache_generation
+        db = await get_database()
+        distinct_values = await fan_out({
+            name: db[name].distinct("tahun")
+            for name in self.COLLECTION_CONFIGS
+        })
+
+        index = {}
+        for name, values in distinct_values.items():
+            years = {self._to_year(value) for value in values}
+            years.discard(None)
+            index[name] = sorted(years)
+
+        if generation == self._cache_generation:
+            self._years_index = index
+        return index
+
     async def get_available_years(self) -> List[int]:
         """
         Get list of years that have data in any collection.
@@ -372,18 +621,55 @@ class YearBasedScoringService:
         Returns:
             Sorted list of years
         """
+        index = await self.get_years_index()
+        return sorted({year for years in index.values() for year in years})
+
+    async def get_year_coverage(self) -> Dict[str, Any]:
+        """
+        Get available years with per-collection coverage.
+
+        Returns:
+            Dictionary with ``years``, ``coverage`` (collection_name ->
+            years) and ``complete_years`` (years every collection has)
+        """
+        index = await self.get_years_index()
+        years = sorted({year for collection_years in index.values() for year in collection_years})
+        complete_years = [
+            year for year in years
+            if all(year in collection_years for collection_years in index.values())
+        ]
+        return {
+            "years": years,
+            "coverage": index,
+            "complete_years": complete_years,
+        }
+    
+    async def _get_total_population(self, year: int) -> float:
+        """
+        Sum all province populations of a year from kependudukan.
+
+        Args:
+            year: Year to sum
+
+        Returns:
+            Total population, 0 if it cannot be read
+        """
         db = await get_database()
-        years = set()
+        total_population = 0
         
-        for collection_name in self.COLLECTION_CONFIGS.keys():
-            collection = db[collection_name]
-            cursor = collection.find({}, {"tahun": 1})
+        try:
+            cursor = db.kependudukan.find({"tahun": year}, {"data_tahunan.total": 1})
             async for doc in cursor:
-                if "tahun" in doc:
-                    years.add(doc["tahun"])
-        
-        return sorted(list(years))
-    
+                # Get total population from data_tahunan.total field
+                pop_value = self._get_field_value(doc, "data_tahunan.total")
+                if pop_value:
+                    total_population += pop_value
+        except Exception as e:
+            print(f"Error calculating population: {e}")
+            total_population = 0
+
+        return total_population
+
     async def get_national_statistics(self, year: int) -> Optional[Dict[str, Any]]:
         """
         Calculate national statistics for a specific year.
@@ -392,10 +678,15 @@ class YearBasedScoringService:
             year: Year to calculate statistics for
             
         Returns:
-            Dictionary with median score, leader, critical province, and population
+            Dictionary with median score, leader, critical province, population
+            and the staleness watermark of the underlying scores
         """
-        # Get all scores for the year
-        all_scores = await self.calculate_all_scores_for_year(year)
+        # Independent reads; plain gather because get_ranked_scores fans out
+        # itself and nesting fan_out could exhaust its semaphore
+        (all_scores, watermark), total_population = await asyncio.gather(
+            self.get_ranked_scores(year),
+            self._get_total_population(year),
+        )
         
         if not all_scores:
             return None
@@ -410,22 +701,6 @@ class YearBasedScoringService:
         # Get critical (worst performing province)
         critical = all_scores[-1] if all_scores else None
         
-        # Get total population from kependudukan collection
-        db = await get_database()
-        total_population = 0
-        
-        try:
-            # Sum all province populations for the year
-            cursor = db.kependudukan.find({"tahun": year})
-            async for doc in cursor:
-                # Get total population from data_tahunan.total field
-                pop_value = self._get_field_value(doc, "data_tahunan.total")
-                if pop_value:
-                    total_population += pop_value
-        except Exception as e:
-            print(f"Error calculating population: {e}")
-            total_population = 0
-        
         return {
             "year": year,
             "median_score": round(median_score, 1),
@@ -440,7 +715,8 @@ class YearBasedScoringService:
                 "score": round(critical["composite_score"], 1)
             } if critical else None,
             "total_population": int(total_population),
-            "provinces_count": len(all_scores)
+            "provinces_count": len(all_scores),
+            "watermark": watermark
         }
 
 
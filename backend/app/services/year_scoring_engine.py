@@ -0,0 +1,283 @@
+"""
+Year scoring engine - Vectorized min-max scoring for a single year.
+
+Holds all indicator values of a year as a province x collection matrix
+and computes per-collection scores, composites and ranks in one pass.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, List, Any
+
+import numpy as np
+
+
+# Score assigned when every province has the same value for a collection
+NEUTRAL_SCORE = 50.0
+
+
+@dataclass
+class YearScoreSnapshot:
+    """
+    Fully ranked scoring result for one year.
+
+    Rows are ordered by rank (best first). Matrix columns follow
+    the order of ``collections``. Missing values are NaN.
+    """
+
+    year: int
+    collections: List[str]
+    province_ids: List[str]
+    raw_values: np.ndarray
+    scores: np.ndarray
+    min_values: np.ndarray
+    max_values: np.ndarray
+    composite: np.ndarray
+    collections_scored: np.ndarray
+    lower_is_better: List[bool] = field(default_factory=list)
+    province_names: Dict[str, str] = field(default_factory=dict)
+    calculated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self) -> None:
+        self._positions = {pid: idx for idx, pid in enumerate(self.province_ids)}
+
+    def __len__(self) -> int:
+        return len(self.province_ids)
+
+    def position_of(self, province_id: str) -> Optional[int]:
+        """Return the row index of a province, or None if it was not scored."""
+        return self._positions.get(province_id)
+
+    def to_row(
+        self,
+        position: int,
+        display_names: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """
+        Build the API row for the province at ``position``.
+
+        Args:
+            position: Row index (rank - 1)
+            display_names: Mapping collection_name -> display name
+
+        Returns:
+            Score dictionary in the shape served by /year-scores
+        """
+        province_id = self.province_ids[position]
+        row_scores = self.scores[position]
+
+        return {
+            "province_id": province_id,
+            "province_name": self.province_names.get(province_id, "Unknown"),
+            "year": self.year,
+            "composite_score": round(float(self.composite[position]), 2),
+            "collection_scores": {
+                display_names[name]: round(float(row_scores[col]), 2)
+                for col, name in enumerate(self.collections)
+                if not np.isnan(row_scores[col])
+            },
+            "collections_scored": int(self.collections_scored[position]),
+            "rank": position + 1,
+            "calculated_at": self.calculated_at,
+        }
+
+    def to_rows(self, display_names: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Build API rows for all provinces in rank order."""
+        return [self.to_row(idx, display_names) for idx in range(len(self))]
+
+    def to_breakdown(
+        self,
+        position: int,
+        display_names: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """
+        Build the per-collection breakdown for the province at ``position``.
+
+        Raw values, column min/max, scores, composite and rank all come
+        from this snapshot, so they are always mutually consistent.
+
+        Args:
+            position: Row index (rank - 1)
+            display_names: Mapping collection_name -> display name
+
+        Returns:
+            Breakdown dictionary in the shape served by /breakdown
+        """
+        province_id = self.province_ids[position]
+        raw_row = self.raw_values[position]
+        score_row = self.scores[position]
+
+        collections = []
+        for col, name in enumerate(self.collections):
+            if np.isnan(raw_row[col]):
+                continue
+            collections.append({
+                "collection": name,
+                "display_name": display_names[name],
+                "raw_value": float(raw_row[col]),
+                "score": round(float(score_row[col]), 2),
+                "min_value": float(self.min_values[col]),
+                "max_value": float(self.max_values[col]),
+                "lower_is_better": bool(self.lower_is_better[col]),
+            })
+
+        return {
+            "province_id": province_id,
+            "province_name": self.province_names.get(province_id),
+            "year": self.year,
+            "composite_score": round(float(self.composite[position]), 2),
+            "rank": position + 1,
+            "collections": collections,
+        }
+
+    def to_overlay(
+        self,
+        metric: str = "composite_score",
+        previous: Optional["YearScoreSnapshot"] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Build a geometry-free map overlay keyed by province ID.
+
+        Args:
+            metric: "composite_score" or a collection name
+            previous: Snapshot of the previous year, for rank deltas
+
+        Returns:
+            province_id -> {score, rank, delta, metric}; ``delta`` is
+            positive when the province moved up, ``metric`` is None when
+            the province has no value for the metric
+
+        Raises:
+            KeyError: If ``metric`` is neither composite_score nor a collection
+        """
+        if metric == "composite_score":
+            values = self.composite
+        else:
+            values = self.scores[:, self.collections.index(metric)] if metric in self.collections else None
+            if values is None:
+                raise KeyError(metric)
+
+        overlay = {}
+        for position, province_id in enumerate(self.province_ids):
+            rank = position + 1
+            previous_position = previous.position_of(province_id) if previous else None
+            value = float(values[position])
+            overlay[province_id] = {
+                "score": round(float(self.composite[position]), 2),
+                "rank": rank,
+                "delta": previous_position + 1 - rank if previous_position is not None else None,
+                "metric": None if np.isnan(value) else round(value, 2),
+            }
+        return overlay
+
+
+def build_value_matrix(
+    collections: List[str],
+    values_by_collection: Dict[str, Dict[str, float]],
+) -> tuple[List[str], np.ndarray]:
+    """
+    Assemble per-collection ``{province_id: value}`` maps into a matrix.
+
+    Args:
+        collections: Ordered collection names (matrix columns)
+        values_by_collection: collection_name -> {province_id: value}
+
+    Returns:
+        Tuple of (sorted province_ids, raw value matrix with NaN for gaps)
+    """
+    province_ids = sorted({
+        pid
+        for name in collections
+        for pid in values_by_collection.get(name, {})
+    })
+    positions = {pid: idx for idx, pid in enumerate(province_ids)}
+
+    raw = np.full((len(province_ids), len(collections)), np.nan, dtype=float)
+    for col, name in enumerate(collections):
+        for pid, value in values_by_collection.get(name, {}).items():
+            raw[positions[pid], col] = value
+
+    return province_ids, raw
+
+
+def min_max_scores(raw: np.ndarray, lower_is_better: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Column-wise min-max normalization to a 0-100 scale.
+
+    Args:
+        raw: Province x collection matrix, NaN for missing values
+        lower_is_better: Boolean vector, one flag per column
+
+    Returns:
+        Tuple of (scores, column minimums, column maximums).
+        Missing inputs stay NaN; constant columns score NEUTRAL_SCORE.
+    """
+    has_data = ~np.isnan(raw).all(axis=0)
+
+    min_values = np.full(raw.shape[1], np.nan)
+    max_values = np.full(raw.shape[1], np.nan)
+    min_values[has_data] = np.nanmin(raw[:, has_data], axis=0)
+    max_values[has_data] = np.nanmax(raw[:, has_data], axis=0)
+
+    spread = max_values - min_values
+    constant = spread == 0
+    safe_spread = np.where(constant, 1.0, spread)
+
+    normalized = (raw - min_values) / safe_spread
+    normalized = np.where(lower_is_better, 1 - normalized, normalized)
+    scores = normalized * 100
+
+    # Constant columns: every present value gets the neutral score
+    scores = np.where(constant & ~np.isnan(raw), NEUTRAL_SCORE, scores)
+
+    return scores, min_values, max_values
+
+
+def compute_year_snapshot(
+    year: int,
+    collections: List[str],
+    lower_is_better: List[bool],
+    values_by_collection: Dict[str, Dict[str, float]],
+) -> Optional[YearScoreSnapshot]:
+    """
+    Score, aggregate and rank all provinces for one year.
+
+    The composite is the unweighted mean of the available collection
+    scores, so missing indicators re-normalize the remaining weights.
+
+    Args:
+        year: Year being scored
+        collections: Ordered collection names
+        lower_is_better: Direction flag per collection
+        values_by_collection: collection_name -> {province_id: value}
+
+    Returns:
+        Ranked YearScoreSnapshot, or None when no province has data
+    """
+    province_ids, raw = build_value_matrix(collections, values_by_collection)
+    if not province_ids:
+        return None
+
+    scores, min_values, max_values = min_max_scores(
+        raw, np.asarray(lower_is_better, dtype=bool)
+    )
+
+    present = ~np.isnan(scores)
+    collections_scored = present.sum(axis=1)
+    composite = np.where(present, scores, 0.0).sum(axis=1) / collections_scored
+
+    # Stable sort keeps province_id order for ties
+    order = np.argsort(-composite, kind="stable")
+
+    return YearScoreSnapshot(
+        year=year,
+        collections=list(collections),
+        province_ids=[province_ids[idx] for idx in order],
+        raw_values=raw[order],
+        scores=scores[order],
+        min_values=min_values,
+        max_values=max_values,
+        composite=composite[order],
+        collections_scored=collections_scored[order],
+        lower_is_better=[bool(flag) for flag in lower_is_better],
+    )
@@ -14,6 +14,40 @@ class Settings(BaseSettings):
     # MongoDB
     mongo_uri: str
     mongo_db: str
+    mongo_max_pool_size: int = 100
+    # Concurrent reads per fan-out (capped at the pool size)
+    mongo_fanout_limit: int = 16
+    # Fan-out queries slower than this are logged as warnings
+    mongo_slow_query_ms: int = 500
+
+    # Executors for blocking pandas/NumPy work
+    executor_thread_workers: int = 4
+    # Heavy CPU work (batch parsing, geo builds): "process", "thread" or "inline"
+    executor_cpu_mode: str = "process"
+    # Per-year scoring; runs in about a millisecond, so IPC would dominate
+    executor_scoring_mode: str = "inline"
+    executor_process_workers: int = 2
+
+    # Uploads larger than this are rejected with 413
+    upload_max_bytes: int = 50 * 1024 * 1024
+    # Uploads stay in memory up to this size, then spill to disk
+    upload_spool_bytes: int = 1024 * 1024
+
+    # Background import jobs
+    import_workers: int = 2
+    import_queue_size: int = 100
+
+    # Batch imports: manifests may only reference files under this directory
+    import_data_dir: str = str(Path(__file__).parent.parent.parent / "data")
+    # Uncompressed size limit for uploaded batch archives
+    import_archive_max_bytes: int = 500 * 1024 * 1024
+
+    # Province boundaries (indonesia-38.json and its simplified variants)
+    geo_data_dir: str = str(Path(__file__).parent.parent.parent / "data" / "geo")
+    # TopoJSON grid points per axis; higher keeps more coordinate precision
+    geo_topojson_quantization: int = 10000
+    # Cache-Control max-age of boundary responses (they change only on deploy)
+    geo_cache_max_age: int = 86400
 
     # API
     api_host: str = "0.0.0.0"
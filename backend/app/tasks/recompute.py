@@ -5,6 +5,8 @@ This module provides functions to recompute composite scores
 based on the latest indicator data and weights.
 """
 
+import asyncio
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -17,54 +19,39 @@ from app.logging import get_logger
 logger = get_logger(__name__)
 
 
-async def recompute_scores(
+async def _load_calculator() -> ScoreCalculator:
+    """Get the score calculator, using custom weights if configured."""
+    configs_repo = await get_configs_repository()
+    weights_config = await configs_repo.find_by_key("indicator_weights")
+    if weights_config:
+        weights = {
+            code: IndicatorWeight(code=code, weight=w, invert=code in ["POVERTY_RATE", "GINI", "UNEMPLOYMENT"])
+            for code, w in weights_config.get("value", {}).items()
+        }
+        return ScoreCalculator(weights)
+    return score_calculator
+
+
+async def _compute_year_scores(
     year: int,
-    generate_alerts: bool = True,
-) -> Dict[str, Any]:
+    calculator: ScoreCalculator,
+) -> List[Dict[str, Any]]:
     """
-    Recompute composite scores for a specific year.
-
-    Steps:
-    1. Fetch all indicators for the year
-    2. Normalize values per indicator
-    3. Calculate composite scores
-    4. Update rankings
-    5. Optionally generate alerts
+    Compute unranked composite scores for a year.
 
     Args:
-        year: Year to recompute scores for
-        generate_alerts: Whether to generate alerts after recomputation
+        year: Year to compute
+        calculator: Score calculator holding the indicator weights
 
     Returns:
-        Dict with recomputation results
+        One score dict per region, empty if the year has no indicators
     """
-    start_time = datetime.utcnow()
-    logger.info(f"Starting score recomputation for year {year}")
-
     indicators_repo = await get_indicators_repository()
-    scores_repo = await get_scores_repository()
-    configs_repo = await get_configs_repository()
-
-    # Get custom weights if configured
-    weights_config = await configs_repo.find_by_key("indicator_weights")
-    if weights_config:
-        weights = {
-            code: IndicatorWeight(code=code, weight=w, invert=code in ["POVERTY_RATE", "GINI", "UNEMPLOYMENT"])
-            for code, w in weights_config.get("value", {}).items()
-        }
-        calculator = ScoreCalculator(weights)
-    else:
-        calculator = score_calculator
 
     # Fetch indicators for the year
     indicators = await indicators_repo.find_by_year(year)
     if not indicators:
-        logger.warning(f"No indicators found for year {year}")
-        return {
-            "success": False,
-            "message": f"No indicators found for year {year}",
-            "year": year,
-        }
+        return []
 
     # Group by indicator code for normalization
     by_indicator: Dict[str, List[Dict]] = {}
@@ -102,15 +89,26 @@ async def recompute_scores(
             "calculated_at": datetime.utcnow(),
         })
 
-    # Get previous year scores for delta
-    prev_scores = await scores_repo.find_rankings(year - 1)
-    prev_scores_list = [(s["region_code"], s["composite_score"]) for s in prev_scores]
+    return scores
+
+
+def _apply_rankings(
+    scores: List[Dict[str, Any]],
+    previous_scores: List[Dict[str, Any]],
+    calculator: ScoreCalculator,
+) -> None:
+    """
+    Merge rank, previous rank and rank delta into scores in place.
 
-    # Calculate rankings
+    Args:
+        scores: Scores of the year being ranked
+        previous_scores: Scores of the year before (may be empty)
+        calculator: Score calculator
+    """
+    prev_scores_list = [(s["region_code"], s["composite_score"]) for s in previous_scores]
     current_scores_list = [(s["region_code"], s["composite_score"]) for s in scores]
     rankings = calculator.calculate_rankings(current_scores_list, prev_scores_list)
 
-    # Merge rankings into scores
     rankings_map = {r["region_code"]: r for r in rankings}
     for score in scores:
         ranking = rankings_map.get(score["region_code"], {})
@@ -118,15 +116,16 @@ async def recompute_scores(
         score["previous_rank"] = ranking.get("previous_rank")
         score["rank_delta"] = ranking.get("rank_delta")
 
-    # Save scores
-    saved = 0
-    for score in scores:
-        await scores_repo.upsert(
-            {"region_code": score["region_code"], "year": year},
-            score,
-        )
-        saved += 1
 
+async def _save_year_scores(
+    year: int,
+    scores: List[Dict[str, Any]],
+    generate_alerts: bool,
+) -> Dict[str, Any]:
+    """Persist ranked scores with one bulk_write and optionally alert."""
+    scores_repo = await get_scores_repository()
+    await scores_repo.bulk_upsert(year, scores)
+    saved = len(scores)
     logger.info(f"Saved {saved} scores for year {year}")
 
     # Generate alerts if requested
@@ -135,45 +134,127 @@ async def recompute_scores(
         alert_result = await alerts_service.generate_alerts(year)
         alerts_generated = alert_result.get("created", 0)
 
-    duration = (datetime.utcnow() - start_time).total_seconds()
-
     return {
         "success": True,
         "message": f"Recomputed scores for {saved} regions",
         "year": year,
         "regions_processed": saved,
         "alerts_generated": alerts_generated,
-        "duration_seconds": duration,
     }
 
 
+def _no_indicators_result(year: int) -> Dict[str, Any]:
+    logger.warning(f"No indicators found for year {year}")
+    return {
+        "success": False,
+        "message": f"No indicators found for year {year}",
+        "year": year,
+    }
+
+
+async def recompute_scores(
+    year: int,
+    generate_alerts: bool = True,
+) -> Dict[str, Any]:
+    """
+    Recompute composite scores for a specific year.
+
+    Steps:
+    1. Fetch all indicators for the year
+    2. Normalize values per indicator
+    3. Calculate composite scores
+    4. Update rankings
+    5. Optionally generate alerts
+
+    Args:
+        year: Year to recompute scores for
+        generate_alerts: Whether to generate alerts after recomputation
+
+    Returns:
+        Dict with recomputation results
+    """
+    start_time = datetime.utcnow()
+    logger.info(f"Starting score recomputation for year {year}")
+
+    calculator = await _load_calculator()
+    scores = await _compute_year_scores(year, calculator)
+    if not scores:
+        return _no_indicators_result(year)
+
+    # Get previous year scores for delta
+    scores_repo = await get_scores_repository()
+    prev_scores = await scores_repo.find_rankings(year - 1)
+    _apply_rankings(scores, prev_scores, calculator)
+
+    result = await _save_year_scores(year, scores, generate_alerts)
+    result["duration_seconds"] = (datetime.utcnow() - start_time).total_seconds()
+    return result
+
+
 async def recompute_all_scores(
     start_year: int = 2015,
     end_year: Optional[int] = None,
     generate_alerts: bool = False,
+    max_workers: int = 4,
 ) -> Dict[str, Any]:
     """
     Recompute scores for all years.
 
+    Years are computed concurrently by at most ``max_workers`` workers.
+    Rank deltas use the previous year's freshly computed scores, so the
+    result does not depend on the order in which years finish; the year
+    before ``start_year`` is read from the stored scores.
+
     Args:
         start_year: First year to recompute
         end_year: Last year to recompute (current year if None)
         generate_alerts: Whether to generate alerts (only for latest year)
+        max_workers: Maximum number of years processed at the same time
 
     Returns:
-        Dict with recomputation results
+        Dict with recomputation results and per-year timing
     """
     if end_year is None:
         end_year = datetime.now().year
 
     logger.info(f"Starting full score recomputation: {start_year}-{end_year}")
+    started = time.perf_counter()
+
+    years = list(range(start_year, end_year + 1))
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    calculator = await _load_calculator()
+
+    async def compute(year: int) -> tuple[List[Dict[str, Any]], float]:
+        async with semaphore:
+            year_started = time.perf_counter()
+            scores = await _compute_year_scores(year, calculator)
+            return scores, time.perf_counter() - year_started
+
+    computed = dict(zip(years, await asyncio.gather(*(compute(year) for year in years))))
+
+    scores_repo = await get_scores_repository()
+
+    async def save(year: int) -> Dict[str, Any]:
+        scores, compute_seconds = computed[year]
+        if not scores:
+            return _no_indicators_result(year)
+
+        async with semaphore:
+            year_started = time.perf_counter()
+            previous = computed.get(year - 1, ([], 0.0))[0]
+            if not previous:
+                previous = await scores_repo.find_rankings(year - 1)
+            _apply_rankings(scores, previous, calculator)
+
+            # Only generate alerts for the latest year
+            gen_alerts = generate_alerts and year == end_year
+            result = await _save_year_scores(year, scores, gen_alerts)
+            result["duration_seconds"] = round(
+                compute_seconds + time.perf_counter() - year_started, 3
+            )
+            return result
 
-    results = []
-    for year in range(start_year, end_year + 1):
-        # Only generate alerts for the latest year
-        gen_alerts = generate_alerts and year == end_year
-        result = await recompute_scores(year, generate_alerts=gen_alerts)
-        results.append(result)
+    results = list(await asyncio.gather(*(save(year) for year in years)))
 
     total_regions = sum(r.get("regions_processed", 0) for r in results)
     successful = sum(1 for r in results if r.get("success"))
@@ -183,5 +264,7 @@ async def recompute_all_scores(
         "message": f"Recomputed {total_regions} scores across {successful} years",
         "years_processed": successful,
         "total_regions": total_regions,
+        "duration_seconds": round(time.perf_counter() - started, 3),
+        "timings": {r["year"]: r.get("duration_seconds") for r in results},
         "details": results,
     }
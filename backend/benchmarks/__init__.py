@@ -0,0 +1,7 @@
+"""
+Benchmark suite for scoring and import hot paths.
+
+Run from the backend directory::
+
+    python -m benchmarks.run --years 5 --iterations 20 --output bench.json
+"""
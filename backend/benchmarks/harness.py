@@ -0,0 +1,145 @@
+"""
+Benchmark harness - Timing and MongoDB query counting for async hot paths.
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+from pymongo import monitoring
+
+
+class QueryCounter(monitoring.CommandListener):
+    """
+    Command listener counting the database commands a code path issues.
+
+    Register it on the client (``event_listeners=[counter]``) and call
+    ``reset`` before each measured run.
+    """
+
+    # Driver housekeeping that is not caused by application code
+    IGNORED_COMMANDS = {
+        "hello", "isMaster", "ismaster", "ping", "buildInfo",
+        "endSessions", "saslStart", "saslContinue", "killCursors",
+    }
+
+    def __init__(self):
+        self.count = 0
+        self.by_command: Counter = Counter()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.by_command.clear()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in self.IGNORED_COMMANDS:
+            return
+        self.count += 1
+        self.by_command[event.command_name] += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    A named async operation to time.
+
+    ``setup`` runs before every iteration and is not timed, e.g. to drop
+    caches so a cold path is measured each time.
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    setup: Optional[Callable[[], Awaitable[None]]] = None
+    iterations: Optional[int] = None
+
+
+def summarize(
+    name: str,
+    timings_ms: List[float],
+    query_counts: Optional[List[int]] = None,
+    commands: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    """
+    Reduce raw timings to the reported statistics.
+
+    Args:
+        name: Case name
+        timings_ms: Wall time per iteration in milliseconds
+        query_counts: Database commands per iteration, if counted
+        commands: Command breakdown of the last iteration
+
+    Returns:
+        JSON-serializable result row
+    """
+    timings = np.asarray(timings_ms, dtype=float)
+    result = {
+        "name": name,
+        "iterations": int(timings.size),
+        "p50_ms": round(float(np.percentile(timings, 50)), 3),
+        "p95_ms": round(float(np.percentile(timings, 95)), 3),
+        "mean_ms": round(float(timings.mean()), 3),
+        "min_ms": round(float(timings.min()), 3),
+        "max_ms": round(float(timings.max()), 3),
+        "queries_per_run": None,
+        "commands": None,
+    }
+    if query_counts:
+        result["queries_per_run"] = int(np.median(query_counts))
+        result["commands"] = dict(commands or {})
+    return result
+
+
+async def run_case(
+    case: BenchmarkCase,
+    iterations: int,
+    warmup: int = 1,
+    counter: Optional[QueryCounter] = None,
+) -> Dict[str, Any]:
+    """
+    Time a benchmark case.
+
+    Args:
+        case: Case to run
+        iterations: Measured iterations (overridden by case.iterations)
+        warmup: Unmeasured iterations run first
+        counter: Query counter registered on the client, if any
+
+    Returns:
+        Result row from ``summarize``
+    """
+    iterations = case.iterations or iterations
+
+    for _ in range(warmup):
+        if case.setup:
+            await case.setup()
+        await case.run()
+
+    timings_ms = []
+    query_counts = []
+    for _ in range(iterations):
+        if case.setup:
+            await case.setup()
+        if counter:
+            counter.reset()
+
+        started = time.perf_counter()
+        await case.run()
+        timings_ms.append((time.perf_counter() - started) * 1000)
+
+        if counter:
+            query_counts.append(counter.count)
+
+    return summarize(
+        case.name,
+        timings_ms,
+        query_counts if counter else None,
+        counter.by_command if counter else None,
+    )
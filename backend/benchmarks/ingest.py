@@ -0,0 +1,128 @@
+"""
+Ingest throughput benchmark - Rows/sec of the DataFrame-to-record stages.
+
+Runs the live conversion stages (``BPSIngester._simple_process`` for
+Excel/JSON exports and ``FileIngester._process_with_mapping``) over every
+CSV under ``data/raw`` without a database, so it needs no mongod::
+
+    python -m benchmarks.ingest --repeat 50 --output ingest.json
+
+Each file is read once up front and tiled ``--repeat`` times, so the
+numbers reflect record conversion, not CSV parsing or disk I/O.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+RAW_DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "raw"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=50, help="Times each file is tiled")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def load_frames(repeat: int) -> Dict[str, pd.DataFrame]:
+    """
+    Read the raw BPS tables in the shapes the ingesters receive.
+
+    Returns:
+        Frames keyed by ``bps`` (headerless, as read by the BPS parser)
+        and ``table`` (first row as header, as read by FileIngester)
+    """
+    paths = sorted(RAW_DATA_DIR.glob("*/*.csv"))
+    bps = [pd.read_csv(path, header=None, dtype=str, encoding="utf-8-sig") for path in paths]
+    table = [pd.read_csv(path, encoding="utf-8-sig") for path in paths]
+    return {
+        "bps": pd.concat(bps * repeat, ignore_index=True),
+        # Columns differ per file, keep the widest one for the generic path
+        "table": pd.concat(
+            [max(table, key=lambda df: len(df.columns))] * (len(paths) * repeat),
+            ignore_index=True,
+        ),
+    }
+
+
+def build_cases(frames: Dict[str, pd.DataFrame]) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+    """Conversion stages to time, each returning its records."""
+    from app.common.provinces import PROVINCE_NAMES
+    from app.pipelines.ingest.bps import BPSIngester
+    from app.pipelines.ingest.file import FileIngester
+    from app.services.province_resolver import normalize_province_name
+
+    region_index = {normalize_province_name(name): pid for pid, name in PROVINCE_NAMES.items()}
+    bps_ingester = BPSIngester()
+    file_ingester = FileIngester()
+
+    bps_frame = frames["bps"]
+    table = frames["table"]
+    mapping = {"region_name": table.columns[0], "value": table.columns[1]}
+
+    return {
+        "bps._simple_process": lambda: bps_ingester._simple_process(
+            bps_frame, "GINI", 2024, region_index
+        ),
+        "file._process_with_mapping": lambda: file_ingester._process_with_mapping(
+            table, mapping, {"tahun": 2024}
+        ),
+    }
+
+
+def run_case(name: str, run: Callable[[], List[Dict[str, Any]]], rows: int, iterations: int) -> Dict[str, Any]:
+    """Time a stage and report rows/sec from the best iteration."""
+    timings = []
+    records = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        records = len(run())
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        "name": name,
+        "rows": rows,
+        "records": records,
+        "best_ms": round(best * 1000, 3),
+        "rows_per_sec": round(rows / best) if best else None,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+
+    # Settings are required at import time by some modules
+    os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+    os.environ.setdefault("MONGO_DB", "regional_gap_bench")
+
+    # Unknown-region warnings for footnote rows would flood the output
+    logging.disable(logging.WARNING)
+
+    frames = load_frames(args.repeat)
+    results = []
+    for name, run in build_cases(frames).items():
+        print(f"Running {name}...", file=sys.stderr)
+        rows = len(frames["table" if name.startswith("file.") else "bps"])
+        results.append(run_case(name, run, rows, args.iterations))
+
+    report = {"repeat": args.repeat, "iterations": args.iterations, "results": results}
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
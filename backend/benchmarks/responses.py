@@ -0,0 +1,173 @@
+"""
+Response serialization benchmark - Responses/sec of the largest endpoints.
+
+Compares, for the same rows, the previous rendering path (handler-side
+model construction, FastAPI's ``response_model`` validate and dump, or
+``jsonable_encoder``, then stdlib ``JSONResponse``) with the trusted-row
+fast path (``shape_trusted`` plus orjson ``FastJSONResponse``). Needs no
+database::
+
+    python -m benchmarks.responses --iterations 50 --output responses.json
+
+Database reads are identical on both paths and are not timed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--indicator-rows", type=int, default=100, help="Rows per indicator page (API max 100)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def build_rows(indicator_rows: int, seed: int = 42) -> Dict[str, Any]:
+    """Rows shaped like what each endpoint reads from MongoDB."""
+    from app.common.provinces import PROVINCE_NAMES
+    from app.services.year_scoring_engine import compute_year_snapshot
+    from benchmarks.seed import load_province_features
+
+    rng = np.random.default_rng(seed)
+    stamp = datetime(2025, 1, 1, 12, 0)
+
+    regions = load_province_features()
+    for region in regions:
+        region["created_at"] = region["updated_at"] = stamp
+
+    province_ids = sorted(PROVINCE_NAMES)
+    indicators = [
+        {
+            "_id": f"{idx:024x}",
+            "province_id": province_ids[idx % len(province_ids)],
+            "province_name": PROVINCE_NAMES[province_ids[idx % len(province_ids)]],
+            "tahun": 2024,
+            "data": {"semester_1": float(rng.uniform(0.25, 0.45)), "semester_2": float(rng.uniform(0.25, 0.45))},
+            "created_at": stamp,
+            "updated_at": stamp,
+        }
+        for idx in range(indicator_rows)
+    ]
+
+    collections = [f"indicator_{idx}" for idx in range(9)]
+    snapshot = compute_year_snapshot(
+        2024,
+        collections,
+        [False] * len(collections),
+        {name: {pid: float(rng.uniform(0, 100)) for pid in province_ids} for name in collections},
+    )
+    snapshot.province_names = dict(PROVINCE_NAMES)
+    scores = snapshot.to_rows({name: name.upper() for name in collections})
+
+    return {"regions": regions, "indicators": indicators, "scores": scores}
+
+
+def build_cases(rows: Dict[str, Any]) -> Dict[str, Dict[str, Callable[[], Any]]]:
+    """Baseline and fast renderers per endpoint, each returning a Response."""
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from pydantic import TypeAdapter
+
+    from app.common.responses import FastJSONResponse, shape_trusted
+    from app.routers.regions import RegionResponse, RegionsListResponse
+    from app.routers.year_based_scoring import ProvinceScoreDetailed
+
+    regions, indicators, scores = rows["regions"], rows["indicators"], rows["scores"]
+    regions_adapter = TypeAdapter(RegionsListResponse)
+    scores_adapter = TypeAdapter(List[ProvinceScoreDetailed])
+
+    def regions_baseline():
+        # Handler builds models; FastAPI dumps, re-validates and dumps again
+        model = RegionsListResponse(
+            regions=[RegionResponse(**r) for r in regions], total=len(regions), page=1, page_size=100
+        )
+        content = regions_adapter.validate_python(model.model_dump())
+        return JSONResponse(regions_adapter.dump_python(content, mode="json"))
+
+    def regions_fast():
+        return FastJSONResponse({
+            "regions": [shape_trusted(RegionResponse, r) for r in regions],
+            "total": len(regions),
+            "page": 1,
+            "page_size": 100,
+        })
+
+    def scores_baseline():
+        content = scores_adapter.validate_python(scores)
+        return JSONResponse(scores_adapter.dump_python(content, mode="json"))
+
+    def scores_fast():
+        return FastJSONResponse([shape_trusted(ProvinceScoreDetailed, row) for row in scores])
+
+    def indicators_page():
+        return {"data": indicators, "total": len(indicators), "page": 1, "page_size": len(indicators)}
+
+    return {
+        "regions.list_regions.full": {"baseline": regions_baseline, "fast": regions_fast},
+        "indicators.list_indicator_data": {
+            "baseline": lambda: JSONResponse(jsonable_encoder(indicators_page())),
+            "fast": lambda: FastJSONResponse(indicators_page()),
+        },
+        "year_scores.get_scores_for_year": {"baseline": scores_baseline, "fast": scores_fast},
+    }
+
+
+def time_renderer(render: Callable[[], Any], iterations: int) -> Dict[str, Any]:
+    """Time a renderer and report responses/sec from the best iteration."""
+    body = render().body
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        "best_ms": round(best * 1000, 3),
+        "p50_ms": round(float(np.percentile(timings, 50)) * 1000, 3),
+        "responses_per_sec": round(1 / best) if best else None,
+        "body_bytes": len(body),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+
+    # Settings are required at import time by some modules
+    os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+    os.environ.setdefault("MONGO_DB", "regional_gap_bench")
+
+    rows = build_rows(args.indicator_rows)
+    results = []
+    for name, renderers in build_cases(rows).items():
+        print(f"Running {name}...", file=sys.stderr)
+        baseline = time_renderer(renderers["baseline"], args.iterations)
+        fast = time_renderer(renderers["fast"], args.iterations)
+        results.append({
+            "name": name,
+            "baseline": baseline,
+            "fast": fast,
+            "speedup": round(baseline["best_ms"] / fast["best_ms"], 2) if fast["best_ms"] else None,
+        })
+
+    report = {"iterations": args.iterations, "results": results}
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Benchmark runner - Seeds a throwaway database and times the hot paths.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.run --mongo-uri mongodb://localhost:27017 \\
+        --years 5 --iterations 20 --output bench.json
+
+``--mock`` runs against mongomock-motor instead of a real mongod. It
+lacks query counts and some aggregation operators, so cases using them
+are reported with an ``error`` instead of timings; use a local mongod
+for numbers that gate changes. The benchmark database is dropped and
+reseeded on every run, never point it at real data.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+RAW_DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "raw"
+
+DEFAULT_DB_NAME = "regional_gap_bench"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--mongo-uri", default=os.environ.get("BENCH_MONGO_URI", "mongodb://localhost:27017"))
+    parser.add_argument("--db-name", default=DEFAULT_DB_NAME)
+    parser.add_argument("--mock", action="store_true", help="Use mongomock-motor instead of mongod")
+    parser.add_argument("--years", type=int, default=5, help="Number of synthetic years")
+    parser.add_argument("--last-year", type=int, default=2024)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--only", nargs="*", help="Run only cases whose name starts with these prefixes")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+async def connect(args: argparse.Namespace):
+    """
+    Point the application database client at the benchmark database.
+
+    Returns:
+        Tuple of (database, QueryCounter or None)
+    """
+    from app.db import client as db_client
+    from benchmarks.harness import QueryCounter
+
+    if args.mock:
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            raise SystemExit("--mock requires mongomock-motor (pip install mongomock-motor)")
+        mongo_client = AsyncMongoMockClient()
+        counter = None
+    else:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        counter = QueryCounter()
+        mongo_client = AsyncIOMotorClient(
+            args.mongo_uri,
+            event_listeners=[counter],
+            serverSelectionTimeoutMS=5000,
+        )
+
+    # Services resolve the database through app.db.client
+    db_client._client = mongo_client
+    db_client._database = mongo_client[args.db_name]
+    return db_client._database, counter
+
+
+def build_cases(year: int) -> List[Any]:
+    """Benchmark cases for the scoring, analysis and import hot paths."""
+    from benchmarks.harness import BenchmarkCase
+    from app.pipelines.run_pipeline import run_full_pipeline
+    from app.services.csv_import import GiniRatioImportService
+    from app.services.unemployment_analysis_service import UnemploymentAnalysisService
+    from app.services.year_based_scoring_service import year_based_scoring_service
+
+    unemployment_service = UnemploymentAnalysisService()
+    gini_csv = (RAW_DATA_DIR / "gini-ratio" / f"{year}.csv").read_bytes()
+    ipm_csv = RAW_DATA_DIR / "indeks-pembangunan-manusia" / f"{year}.csv"
+
+    async def drop_score_cache():
+        year_based_scoring_service.invalidate(year)
+
+    return [
+        BenchmarkCase(
+            name="scoring.calculate_all_scores_for_year.cold",
+            run=lambda: year_based_scoring_service.calculate_all_scores_for_year(year),
+            setup=drop_score_cache,
+        ),
+        BenchmarkCase(
+            name="scoring.calculate_all_scores_for_year.warm",
+            run=lambda: year_based_scoring_service.calculate_all_scores_for_year(year),
+        ),
+        BenchmarkCase(
+            name="scoring.get_score_breakdown.warm",
+            run=lambda: year_based_scoring_service.get_score_breakdown("31", year),
+        ),
+        BenchmarkCase(
+            name="scoring.get_year_coverage.cold",
+            run=year_based_scoring_service.get_year_coverage,
+            setup=drop_score_cache,
+        ),
+        BenchmarkCase(
+            name="scoring.get_national_statistics",
+            run=lambda: year_based_scoring_service.get_national_statistics(year),
+        ),
+        BenchmarkCase(
+            name="unemployment.analyze_regional_gap",
+            run=lambda: unemployment_service.analyze_regional_gap(year),
+        ),
+        BenchmarkCase(
+            name="import.csv.gini_ratio",
+            run=lambda: GiniRatioImportService.import_csv(gini_csv, year),
+        ),
+        BenchmarkCase(
+            name="pipeline.run_full_pipeline.ipm",
+            run=lambda: run_full_pipeline(str(ipm_csv), "ipm", year),
+        ),
+    ]
+
+
+async def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    if not args.db_name.endswith("_bench"):
+        raise SystemExit("Benchmark database name must end with '_bench'")
+
+    # Settings are required at import time by some modules
+    os.environ.setdefault("MONGO_URI", args.mongo_uri)
+    os.environ.setdefault("MONGO_DB", args.db_name)
+
+    from benchmarks.harness import run_case
+    from benchmarks.seed import seed_database
+
+    db, counter = await connect(args)
+    years = list(range(args.last_year - args.years + 1, args.last_year + 1))
+    seeded = await seed_database(db, years)
+
+    results = []
+    for case in build_cases(args.last_year):
+        if args.only and not any(case.name.startswith(prefix) for prefix in args.only):
+            continue
+        print(f"Running {case.name}...", file=sys.stderr)
+        try:
+            results.append(await run_case(case, args.iterations, args.warmup, counter))
+        except Exception as e:
+            results.append({"name": case.name, "error": f"{type(e).__name__}: {e}"})
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "backend": "mongomock" if args.mock else "mongod",
+        "years": years,
+        "seeded": seeded,
+        "iterations": args.iterations,
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
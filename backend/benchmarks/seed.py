@@ -0,0 +1,118 @@
+"""
+Synthetic benchmark data - Provinces and per-indicator documents.
+
+Documents carry the same nested fields the services read, so every
+scoring and analysis path sees realistic input. Values are drawn from
+a seeded generator and are therefore identical between runs.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.common.indicators import COLLECTION_CONFIGS, COLLECTION_MAPPING
+
+GEOJSON_PATH = Path(__file__).resolve().parents[2] / "data" / "geo" / "indonesia-38.json"
+
+# Extra fields read outside the scoring configs:
+# collection -> [(field, low, high)]
+EXTRA_FIELDS: Dict[str, List[Tuple[str, float, float]]] = {
+    "tingkat_pengangguran_terbuka": [("data.tahunan", 2.0, 9.0)],
+    "kependudukan": [
+        ("data.jumlah_penduduk_ribu", 700.0, 50000.0),
+        ("data_tahunan.total", 700.0, 50000.0),
+    ],
+    "rata_rata_upah_bersih": [("sektor.total.agustus", 2000000.0, 5000000.0)],
+}
+
+# Value range per scored collection
+VALUE_RANGES: Dict[str, Tuple[float, float]] = {
+    "gini_ratio": (0.25, 0.45),
+    "indeks_pembangunan_manusia": (60.0, 83.0),
+    "tingkat_pengangguran_terbuka": (2.0, 9.0),
+    "persentase_penduduk_miskin": (4.0, 27.0),
+    "pdrb_per_kapita": (20000.0, 300000.0),
+    "rata_rata_upah": (2000000.0, 5000000.0),
+    "inflasi_tahunan": (1.0, 7.0),
+    "indeks_harga_konsumen": (100.0, 125.0),
+    "angkatan_kerja": (90.0, 97.0),
+}
+
+
+def _set_path(doc: Dict[str, Any], field_path: str, value: float) -> None:
+    """Set a dot-notation field, creating intermediate documents."""
+    keys = field_path.split(".")
+    target = doc
+    for key in keys[:-1]:
+        target = target.setdefault(key, {})
+    target[keys[-1]] = value
+
+
+def indicator_fields() -> Dict[str, List[Tuple[str, float, float]]]:
+    """Fields to generate per collection, covering configs and mapping."""
+    fields: Dict[str, List[Tuple[str, float, float]]] = {}
+    for name, config in COLLECTION_CONFIGS.items():
+        low, high = VALUE_RANGES.get(name, (0.0, 100.0))
+        fields.setdefault(name, []).append((config["field"], low, high))
+    for name in COLLECTION_MAPPING.values():
+        fields.setdefault(name, [])
+    for name, extra in EXTRA_FIELDS.items():
+        fields.setdefault(name, []).extend(extra)
+    return fields
+
+
+def load_province_features() -> List[Dict[str, Any]]:
+    """Load the 38 province features with ``properties.id`` filled in."""
+    with open(GEOJSON_PATH, encoding="utf-8") as f:
+        features = json.load(f)["features"]
+
+    for feature in features:
+        properties = feature["properties"]
+        properties.setdefault("id", str(feature.get("id") or properties["KODE_PROV"]))
+    return features
+
+
+async def seed_database(
+    db: AsyncIOMotorDatabase,
+    years: List[int],
+    seed: int = 42,
+) -> Dict[str, int]:
+    """
+    Drop and refill the benchmark database.
+
+    Args:
+        db: Benchmark database (never the application database)
+        years: Years to generate for every indicator
+        seed: Random seed
+
+    Returns:
+        Documents inserted per collection
+    """
+    rng = np.random.default_rng(seed)
+    features = load_province_features()
+    province_ids = [feature["properties"]["id"] for feature in features]
+
+    counts = {}
+    await db.drop_collection("provinces")
+    await db.provinces.insert_many(features)
+    counts["provinces"] = len(features)
+
+    for name, fields in sorted(indicator_fields().items()):
+        await db.drop_collection(name)
+        docs = []
+        for year in years:
+            for province_id in province_ids:
+                doc = {"province_id": province_id, "tahun": year, "indikator": name}
+                for field_path, low, high in fields:
+                    _set_path(doc, field_path, round(float(rng.uniform(low, high)), 3))
+                docs.append(doc)
+        await db[name].insert_many(docs)
+        counts[name] = len(docs)
+
+    for name in ("year_scores", "year_score_status"):
+        await db.drop_collection(name)
+
+    return counts
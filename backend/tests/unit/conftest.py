@@ -0,0 +1,11 @@
+"""
+Shared configuration for unit tests.
+"""
+
+import os
+
+# Unit tests never connect to MongoDB, settings only need to validate
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGO_DB", "regional_gap_test")
+# Keep numeric work in-process so tests do not spawn worker processes
+os.environ.setdefault("EXECUTOR_CPU_MODE", "thread")
@@ -0,0 +1,154 @@
+"""
+Unit tests for multi-file batch imports.
+"""
+
+import zipfile
+
+import pytest
+
+from app.common import ValidationError
+from app.pipelines import batch_import
+
+REGION_INDEX = {"ACEH": "11", "SUMATERA UTARA": "12"}
+
+
+def bps_csv(year, aceh, sumut):
+    return f"38 Provinsi,,\n,{year},\nACEH,{aceh},\nSUMATERA UTARA,{sumut},\nINDONESIA,1,\n"
+
+
+def write(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class FakeBulkResult:
+    def __init__(self, count):
+        self.upserted_count = count
+        self.modified_count = 0
+
+
+class FakeCollection:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    async def bulk_write(self, operations, ordered=True):
+        self.db.bulk_writes.append((self.name, operations, ordered))
+        return FakeBulkResult(len(operations))
+
+    async def insert_many(self, docs):
+        self.db.logs.extend(docs)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.bulk_writes = []
+        self.logs = []
+
+    def __getitem__(self, name):
+        return FakeCollection(self, name)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeDatabase()
+    refreshed = []
+
+    async def get_database():
+        return fake
+
+    async def get_index():
+        return REGION_INDEX
+
+    async def refresh_year(year):
+        refreshed.append(year)
+        return 0
+
+    monkeypatch.setattr(batch_import, "get_database", get_database)
+    monkeypatch.setattr(batch_import.province_resolver, "get_index", get_index)
+    monkeypatch.setattr(batch_import.year_based_scoring_service, "refresh_year", refresh_year)
+    fake.refreshed = refreshed
+    return fake
+
+
+class TestDiscoverRawFiles:
+    """Test cases for mapping a data/raw layout to import files."""
+
+    def test_maps_folders_and_years(self, tmp_path):
+        """Test indicator folders, the PDRB subfolder rule and file years."""
+        write(tmp_path / "gini-ratio" / "Gini Ratio 2023.csv")
+        write(tmp_path / "pdrb" / "adhb" / "PDRB 2022.csv")
+        write(tmp_path / "pdrb" / "adhk" / "PDRB 2022.csv")
+        write(tmp_path / "gini-ratio" / "notes.txt")
+
+        files, skipped = batch_import.discover_raw_files(tmp_path)
+
+        assert [(f.indicator_code, f.year) for f in files] == [
+            ("gini_ratio", 2023),
+            ("pdrb_per_kapita", 2022),
+        ]
+        assert skipped == []
+
+    def test_reports_unmapped_files(self, tmp_path):
+        """Test files without a known folder or year are reported, not imported."""
+        write(tmp_path / "unknown" / "Data 2023.csv")
+        write(tmp_path / "gini-ratio" / "Gini Ratio.csv")
+
+        files, skipped = batch_import.discover_raw_files(tmp_path)
+
+        assert files == []
+        assert len(skipped) == 2
+
+
+class TestExtractArchive:
+    """Test cases for unpacking uploaded archives."""
+
+    def test_rejects_paths_outside_destination(self, tmp_path):
+        """Test members escaping the destination are refused."""
+        archive = tmp_path / "raw.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("../evil.csv", "x")
+
+        with pytest.raises(ValidationError):
+            batch_import.extract_archive(str(archive), str(tmp_path / "out"))
+        assert not (tmp_path / "evil.csv").exists()
+
+
+class TestRunBatchImport:
+    """Test cases for merged bulk writes."""
+
+    @pytest.mark.asyncio
+    async def test_one_bulk_write_per_collection(self, tmp_path, db):
+        """Test files of one indicator are merged, later files winning per key."""
+        write(tmp_path / "gini-ratio" / "Gini 2022.csv", bps_csv(2022, "0.3", "0.31"))
+        write(tmp_path / "gini-ratio" / "Gini 2023.csv", bps_csv(2023, "0.32", "0.33"))
+        write(tmp_path / "gini-ratio" / "Gini 2023_rev.csv", bps_csv(2023, "0.4", "-"))
+        files, _ = batch_import.discover_raw_files(tmp_path)
+
+        report = await batch_import.run_batch_import(files)
+
+        assert len(db.bulk_writes) == 1
+        name, operations, ordered = db.bulk_writes[0]
+        assert name == "gini_ratio" and ordered is False
+        values = {
+            (op._filter["province_id"], op._filter["tahun"]): op._doc["$set"]["value"]
+            for op in operations
+        }
+        assert values == {("11", 2022): 0.3, ("12", 2022): 0.31, ("11", 2023): 0.4, ("12", 2023): 0.33}
+        assert report["records_processed"] == 5
+        assert report["years_refreshed"] == [2022, 2023]
+        assert db.refreshed == [2022, 2023]
+        assert len(db.logs) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_file_does_not_stop_the_batch(self, tmp_path, db):
+        """Test a file that cannot be parsed is reported while others import."""
+        write(tmp_path / "gini-ratio" / "Gini 2022.csv", bps_csv(2022, "0.3", "0.31"))
+        files, _ = batch_import.discover_raw_files(tmp_path)
+        files.append(batch_import.BatchFile(str(tmp_path / "missing.csv"), "ipm", 2022, "missing.csv"))
+
+        report = await batch_import.run_batch_import(files)
+
+        assert report["success"] is False
+        assert report["files_failed"] == 1
+        assert report["collections"]["gini_ratio"]["records"] == 2
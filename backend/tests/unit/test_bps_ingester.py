@@ -0,0 +1,30 @@
+"""
+Unit tests for the streaming BPS CSV parser.
+"""
+
+from app.pipelines.ingest.bps import BPSIngester
+
+REGION_INDEX = {"ACEH": "11", "SUMATERA UTARA": "12", "KEPULAUAN RIAU": "21"}
+
+BPS_CSV = (
+    "﻿38 Provinsi,,\n"
+    ",Gini Ratio Menurut Provinsi,\n"
+    ",2023,\n"
+    "ACEH,0.318,-\n"
+    "SUMATERA UTARA,-,\n"
+    "KEP. RIAU,0.339,-\n"
+    "INDONESIA,0.388,-\n"
+)
+
+
+class TestIterCsvRecords:
+    """Test cases for single-pass BPS CSV parsing."""
+
+    def test_skips_headers_and_aggregates(self, tmp_path):
+        """Test header, aggregate and empty rows are left out."""
+        path = tmp_path / "gini.csv"
+        path.write_text(BPS_CSV, encoding="utf-8")
+        records = list(BPSIngester().iter_csv_records(path, "GINI", 2023, REGION_INDEX))
+
+        assert [(r["province_id"], r["value"]) for r in records] == [("11", 0.318), ("21", 0.339)]
+        assert all(r["tahun"] == 2023 for r in records)
@@ -0,0 +1,73 @@
+"""
+Unit tests for the shared CSV import bulk upsert.
+"""
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from app.services.csv_import.base_service import BaseCSVImportService
+
+
+class FakeCollection:
+    """Collection stub recording bulk writes and optionally raising."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.operations = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.operations = operations
+        if self.error is not None:
+            raise self.error
+
+
+def upsert(name, province_id, value):
+    query = {"province_id": province_id, "tahun": 2024}
+    return (name, query, {**query, "data": value})
+
+
+class TestBulkUpsert:
+    """Test cases for per-row accounting of a bulk upsert."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_rows_are_skipped_not_counted(self):
+        collection = FakeCollection()
+        upserts = [upsert("ACEH", "11", 1.0), upsert("BALI", "51", 2.0), upsert("Aceh", "11", 3.0)]
+
+        success, failed, skipped = await BaseCSVImportService.bulk_upsert(collection, upserts)
+
+        assert success == 2
+        assert failed == []
+        assert [row.province_name for row in skipped] == ["ACEH"]
+        assert not skipped[0].success
+        assert [op._doc["$set"]["data"] for op in collection.operations] == [2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_write_errors_map_to_kept_rows(self):
+        error = BulkWriteError({"writeErrors": [{"index": 1, "errmsg": "boom"}], "writeConcernErrors": []})
+        collection = FakeCollection(error)
+        upserts = [upsert("ACEH", "11", 1.0), upsert("ACEH", "11", 1.5), upsert("BALI", "51", 2.0)]
+
+        success, failed, skipped = await BaseCSVImportService.bulk_upsert(collection, upserts)
+
+        assert success == 1
+        assert [(row.province_name, row.message) for row in failed] == [("BALI", "boom")]
+        assert len(skipped) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_concern_errors_fail_all_rows(self):
+        error = BulkWriteError({
+            "writeErrors": [{"index": 0, "errmsg": "boom"}],
+            "writeConcernErrors": [{"errmsg": "waiting for replication timed out"}],
+        })
+        collection = FakeCollection(error)
+        upserts = [upsert("ACEH", "11", 1.0), upsert("BALI", "51", 2.0)]
+
+        success, failed, skipped = await BaseCSVImportService.bulk_upsert(collection, upserts)
+
+        assert success == 0
+        assert [(row.province_name, row.message) for row in failed] == [
+            ("ACEH", "boom"),
+            ("BALI", "waiting for replication timed out"),
+        ]
+        assert skipped == []
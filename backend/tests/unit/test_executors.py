@@ -0,0 +1,60 @@
+"""
+Unit tests for the blocking-work executors.
+"""
+
+import threading
+
+import pytest
+
+from app.common import executors
+from app.settings import get_settings
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestRunInProcess:
+    """Test cases for CPU mode selection."""
+
+    @pytest.mark.asyncio
+    async def test_thread_mode_leaves_event_loop_thread(self, monkeypatch):
+        """Test numeric work runs in the pool, not on the loop thread."""
+        monkeypatch.setattr(get_settings(), "executor_cpu_mode", "thread")
+
+        name = await executors.run_in_process(_thread_name)
+
+        assert name.startswith("blocking")
+
+    @pytest.mark.asyncio
+    async def test_inline_mode_runs_on_caller(self, monkeypatch):
+        """Test inline mode calls the function directly."""
+        monkeypatch.setattr(get_settings(), "executor_cpu_mode", "inline")
+
+        assert await executors.run_in_process(_thread_name) == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode_is_rejected(self, monkeypatch):
+        """Test a misconfigured mode fails loudly."""
+        monkeypatch.setattr(get_settings(), "executor_cpu_mode", "gpu")
+
+        with pytest.raises(ValueError):
+            await executors.run_in_process(_thread_name)
+
+
+class TestRunScoring:
+    """Test cases for the scoring executor."""
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_inline(self):
+        """Test scoring skips the pools unless configured otherwise."""
+        assert get_settings().executor_scoring_mode == "inline"
+        assert await executors.run_scoring(_thread_name) == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_own_mode(self, monkeypatch):
+        """Test scoring follows executor_scoring_mode, not executor_cpu_mode."""
+        monkeypatch.setattr(get_settings(), "executor_cpu_mode", "inline")
+        monkeypatch.setattr(get_settings(), "executor_scoring_mode", "thread")
+
+        assert (await executors.run_scoring(_thread_name)).startswith("blocking")
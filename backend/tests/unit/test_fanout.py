@@ -0,0 +1,41 @@
+"""
+Unit tests for the bounded fan-out utility.
+"""
+
+import asyncio
+
+import pytest
+
+from app.db import fanout
+
+
+class TestFanOut:
+    """Test cases for concurrent bounded reads."""
+
+    @pytest.mark.asyncio
+    async def test_results_keyed_by_label(self):
+        """Test each result is returned under its label."""
+        async def query(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await fanout.fan_out({"a": query(1), "b": query(2)})
+        assert results == {"a": 1, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        """Test no more than the configured number of queries run at once."""
+        monkeypatch.setattr(fanout, "get_fanout_limit", lambda: 2)
+        fanout._semaphores.clear()
+        running = 0
+        peak = 0
+
+        async def query():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await fanout.fan_out({str(i): query() for i in range(6)})
+        assert peak == 2
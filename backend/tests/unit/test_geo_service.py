@@ -0,0 +1,160 @@
+"""
+Unit tests for choropleth data and score overlays.
+"""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from app.common import ValidationError
+from app.services.geo_service import GeoService
+from app.services.year_scoring_engine import compute_year_snapshot
+
+# app.services re-exports the geo_service singleton under the module name
+geo_module = sys.modules[GeoService.__module__]
+
+FEATURES = [
+    {
+        "type": "Feature",
+        "id": code,
+        "properties": {"KODE_PROV": code, "PROVINSI": f"Province {code}"},
+        "geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+    }
+    for code in ("11", "12")
+]
+
+
+class FakeScoresRepository:
+    RANKINGS = {
+        2023: [{"region_code": "11", "composite_score": 60.0, "rank": 1}],
+        2024: [{"region_code": "12", "composite_score": 70.0, "rank": 1}],
+    }
+
+    async def get_latest_year(self):
+        return 2024
+
+    async def find_rankings(self, year):
+        await asyncio.sleep(0)
+        return self.RANKINGS[year]
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    source = tmp_path / "provinces.json"
+    source.write_text(json.dumps({"type": "FeatureCollection", "features": FEATURES}))
+
+    async def get_scores_repository():
+        return FakeScoresRepository()
+
+    monkeypatch.setattr(geo_module, "get_scores_repository", get_scores_repository)
+    return GeoService(str(source))
+
+
+class TestChoropleth:
+    """Test cases for joining scores onto boundaries."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_years_do_not_leak(self, service):
+        """Test each response only carries its own year and cached features stay clean."""
+        first, second = await asyncio.gather(
+            service.get_choropleth_data(year=2023),
+            service.get_choropleth_data(year=2024),
+        )
+
+        assert [f["properties"]["rank"] for f in first["features"]] == [1, None]
+        assert [f["properties"]["rank"] for f in second["features"]] == [None, 1]
+        base = await service.get_geojson()
+        assert "rank" not in base["features"][0]["properties"]
+        assert first["features"][0]["geometry"] is base["features"][0]["geometry"]
+
+
+class TestScoreOverlay:
+    """Test cases for the geometry-free overlay."""
+
+    @pytest.mark.asyncio
+    async def test_overlay_from_snapshot_cache(self, service, monkeypatch):
+        """Test the overlay is keyed by province code with deltas from the previous year."""
+        snapshots = {
+            2023: compute_year_snapshot(2023, ["ipm"], [False], {"ipm": {"11": 80.0, "12": 60.0}}),
+            2024: compute_year_snapshot(2024, ["ipm"], [False], {"ipm": {"11": 60.0, "12": 80.0}}),
+        }
+
+        async def get_year_snapshot(year):
+            return snapshots.get(year)
+
+        async def get_available_years():
+            return sorted(snapshots)
+
+        scoring = geo_module.year_based_scoring_service
+        monkeypatch.setattr(scoring, "get_year_snapshot", get_year_snapshot)
+        monkeypatch.setattr(scoring, "get_available_years", get_available_years)
+        monkeypatch.setattr(scoring, "COLLECTION_CONFIGS", {"ipm": {}})
+
+        overlay = await service.get_score_overlay(metric="ipm")
+
+        assert overlay["year"] == 2024
+        assert overlay["regions"]["12"] == {"score": 100.0, "rank": 1, "delta": 1, "metric": 100.0}
+        assert overlay["regions"]["11"]["delta"] == -1
+
+    @pytest.mark.asyncio
+    async def test_unknown_metric(self, service):
+        """Test metrics outside the scored collections are rejected."""
+        with pytest.raises(ValidationError):
+            await service.get_score_overlay(year=2024, metric="unknown")
+
+
+class TestProvinceCodes:
+    """Test cases for BPS codes on the shipped boundaries."""
+
+    @pytest.mark.asyncio
+    async def test_codes_match_registry(self):
+        """Test every feature carries a distinct code known to the provinces registry."""
+        from app.common.provinces import PROVINCE_NAMES
+
+        service = GeoService()
+        features = (await service.get_geojson("low"))["features"]
+
+        codes = [f["properties"]["code"] for f in features]
+        assert sorted(codes) == sorted(PROVINCE_NAMES)
+        papua = [f for f in features if f["properties"]["code"].startswith("9")]
+        for feature in papua:
+            assert feature["properties"]["name"] == PROVINCE_NAMES[feature["properties"]["code"]]
+
+    @pytest.mark.asyncio
+    async def test_split_papua_lookup(self):
+        """Test codes of the split Papua provinces resolve to their own feature."""
+        service = GeoService()
+
+        papua_barat = await service.get_region_boundary("91", "low")
+        papua = await service.get_region_boundary("94", "low")
+
+        assert papua_barat["id"] == "92-A"
+        assert papua["id"] == "91-A"
+        assert (await service.get_region_boundary("91-A", "low"))["id"] == "91-A"
+
+
+class TestOverlayJoin:
+    """Test cases for joining the overlay onto the shipped boundaries."""
+
+    @pytest.mark.asyncio
+    async def test_every_key_matches_a_feature_code(self, monkeypatch):
+        """Test overlay keys from registry province IDs all hit a feature."""
+        from app.common.provinces import PROVINCE_NAMES
+
+        values = {"ipm": {pid: float(idx) for idx, pid in enumerate(PROVINCE_NAMES)}}
+        snapshot = compute_year_snapshot(2024, ["ipm"], [False], values)
+
+        async def get_year_snapshot(year):
+            return snapshot if year == 2024 else None
+
+        scoring = geo_module.year_based_scoring_service
+        monkeypatch.setattr(scoring, "get_year_snapshot", get_year_snapshot)
+        monkeypatch.setattr(scoring, "COLLECTION_CONFIGS", {"ipm": {}})
+        service = GeoService()
+
+        overlay = await service.get_score_overlay(year=2024)
+        features = (await service.get_geojson("low"))["features"]
+
+        assert set(overlay["regions"]) == {f["properties"]["code"] for f in features}
@@ -0,0 +1,117 @@
+"""
+Unit tests for province boundary simplification.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from app.common import ValidationError
+from app.pipelines.geo import simplify
+from app.pipelines.geo.topology import build_topology
+from app.services.geo_service import GeoService
+
+
+def wiggly_line(x0, x1, n=51):
+    """Points along y=0 with tiny zig-zags."""
+    xs = np.linspace(x0, x1, n)
+    return [[float(x), 0.0001 * (i % 2)] for i, x in enumerate(xs)]
+
+
+def square(x0, x1, y0, y1, border=None):
+    """Closed square ring, optionally with a detailed bottom edge."""
+    bottom = border or [[x0, y0], [x1, y0]]
+    return bottom + [[x1, y1], [x0, y1], bottom[0]]
+
+
+def feature(fid, *polygons):
+    return {
+        "type": "Feature",
+        "id": fid,
+        "properties": {"KODE_PROV": fid, "PROVINSI": f"Province {fid}"},
+        "geometry": {"type": "MultiPolygon", "coordinates": [[ring] for ring in polygons]},
+    }
+
+
+@pytest.fixture
+def neighbours():
+    """Two provinces sharing a detailed border along y=0."""
+    border = wiggly_line(0, 1)
+    north = square(0, 1, 0, 1, border=border)
+    # The southern neighbour walks the same border in the other direction
+    south = border[::-1] + [[0, -1], [1, -1], border[-1]]
+    return [feature("A", north), feature("B", south)]
+
+
+class TestDouglasPeucker:
+    """Test cases for line simplification."""
+
+    def test_keeps_end_points_and_drops_noise(self):
+        """Test zig-zags within the tolerance collapse to the end points."""
+        points = np.array(wiggly_line(0, 1))
+
+        result = simplify.douglas_peucker(points, 0.001)
+
+        assert result.tolist() == [points[0].tolist(), points[-1].tolist()]
+
+    def test_keeps_corners_above_tolerance(self):
+        """Test vertices farther than the tolerance are kept."""
+        points = np.array([[0, 0], [1, 0.5], [2, 0]], dtype=float)
+
+        assert len(simplify.douglas_peucker(points, 0.1)) == 3
+
+
+class TestSimplifyTopology:
+    """Test cases for topology-preserving simplification."""
+
+    def test_shared_border_is_stored_once(self, neighbours):
+        """Test a border walked by two provinces becomes one arc."""
+        topology = build_topology(neighbours)
+
+        shared = [arc for arc in topology.arcs if len(arc) == 51]
+        assert len(shared) == 1
+
+    def test_neighbours_keep_identical_borders(self, neighbours):
+        """Test both sides of a border simplify to the same vertices."""
+        features = simplify.simplify_topology(build_topology(neighbours), 0.001, 4)
+
+        north = {tuple(p) for p in features[0]["geometry"]["coordinates"][0][0]}
+        south = {tuple(p) for p in features[1]["geometry"]["coordinates"][0][0]}
+        assert north & south == {(0.0, 0.0), (1.0, 0.0)}
+
+    def test_small_islands_dropped_but_province_kept(self):
+        """Test islets vanish unless they are the whole province."""
+        islet = square(5, 5.001, 5, 5.001)
+        features = [feature("A", square(0, 1, 0, 1), islet), feature("B", islet)]
+
+        result = simplify.simplify_topology(build_topology(features), 0.01, 3)
+
+        assert len(result[0]["geometry"]["coordinates"]) == 1
+        assert len(result[1]["geometry"]["coordinates"]) == 1
+
+
+class TestGeoServiceResolution:
+    """Test cases for serving boundary variants."""
+
+    @pytest.mark.asyncio
+    async def test_missing_variant_is_simplified_on_demand(self, tmp_path, neighbours):
+        """Test variants absent on disk are computed from the source."""
+        source = tmp_path / "provinces.json"
+        source.write_text(json.dumps({"type": "FeatureCollection", "features": neighbours}))
+        service = GeoService(str(source))
+
+        low = await service.get_geojson("low")
+        full = await service.get_geojson("full")
+
+        assert len(low["features"]) == 2
+        assert low["features"][0]["properties"]["code"] == "A"
+        low_points = sum(len(ring) for poly in low["features"][0]["geometry"]["coordinates"] for ring in poly)
+        full_points = sum(len(ring) for poly in full["features"][0]["geometry"]["coordinates"] for ring in poly)
+        assert low_points < full_points
+
+    @pytest.mark.asyncio
+    async def test_unknown_resolution(self, tmp_path):
+        """Test unsupported resolutions are rejected."""
+        with pytest.raises(ValidationError):
+            await GeoService(str(tmp_path / "missing.json")).get_geojson("tiny")
@@ -0,0 +1,137 @@
+"""
+Unit tests for the background import job queue.
+"""
+
+import asyncio
+import itertools
+
+import pytest
+
+from app.pipelines.run_pipeline import PipelineResult
+from app.services import import_jobs
+from app.services.import_jobs import ImportJobQueue
+
+
+class FakeImportBatchesRepository:
+    def __init__(self):
+        self.jobs = {}
+        self.updates = []
+        self._ids = itertools.count(1)
+
+    async def create(self, job):
+        job_id = str(next(self._ids))
+        self.jobs[job_id] = {"_id": job_id, **job}
+        return job_id
+
+    async def update(self, job_id, fields):
+        self.updates.append((job_id, dict(fields)))
+        self.jobs[job_id].update(fields)
+
+    async def find_by_id(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def fail_unfinished(self, statuses, message):
+        return 0
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    fake = FakeImportBatchesRepository()
+
+    async def get_repo():
+        return fake
+
+    monkeypatch.setattr(import_jobs, "get_import_batches_repository", get_repo)
+    return fake
+
+
+class TestImportJobQueue:
+    """Test cases for queued imports."""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_in_background_and_reports_outcome(self, repo, monkeypatch, tmp_path):
+        """Test enqueue returns at once and the worker records the result."""
+        release = asyncio.Event()
+
+        async def fake_pipeline(progress, **kwargs):
+            await progress("ingestion", 0)
+            await release.wait()
+            return PipelineResult(
+                success=True, stage="pipeline", message="done",
+                records_processed=38, records_imported=38,
+            )
+
+        monkeypatch.setattr(import_jobs, "run_full_pipeline", fake_pipeline)
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a,b\n")
+        queue = ImportJobQueue()
+
+        job_id = await queue.enqueue(str(upload), "gini_ratio", 2023)
+        assert (await queue.get_job(job_id))["status"] == "queued"
+
+        await asyncio.sleep(0)
+        job = await queue.get_job(job_id)
+        assert job["status"] == "running"
+        assert job["stage"] == "ingestion"
+
+        release.set()
+        await queue._queue.join()
+        job = await queue.get_job(job_id)
+        await queue.stop()
+
+        assert job["id"] == job_id
+        assert job["status"] == "completed"
+        assert job["records_imported"] == 38
+        assert job["rows_per_sec"] > 0
+        assert not upload.exists()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_error_marks_job_failed(self, repo, monkeypatch, tmp_path):
+        """Test an exception fails the job without stopping the worker."""
+        async def broken_pipeline(**kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(import_jobs, "run_full_pipeline", broken_pipeline)
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a,b\n")
+        queue = ImportJobQueue()
+
+        job_id = await queue.enqueue(str(upload), "gini_ratio", 2023)
+        await queue._queue.join()
+        job = await queue.get_job(job_id)
+        running = queue.running
+        await queue.stop()
+
+        assert job["status"] == "failed"
+        assert job["errors"] == ["boom"]
+        assert running
+
+    @pytest.mark.asyncio
+    async def test_final_status_write_is_retried(self, repo, monkeypatch, tmp_path):
+        """Test a failed final status write is retried instead of stranding the job."""
+        async def fake_pipeline(**kwargs):
+            return PipelineResult(success=True, stage="pipeline", message="done")
+
+        update = repo.update
+        failures = []
+
+        async def flaky_update(job_id, fields):
+            if "finished_at" in fields and not failures:
+                failures.append(job_id)
+                raise RuntimeError("not primary")
+            await update(job_id, fields)
+
+        monkeypatch.setattr(import_jobs, "run_full_pipeline", fake_pipeline)
+        monkeypatch.setattr(import_jobs, "FINISH_RETRY_DELAY_SECONDS", 0)
+        monkeypatch.setattr(repo, "update", flaky_update)
+        upload = tmp_path / "upload.csv"
+        upload.write_text("a,b\n")
+        queue = ImportJobQueue()
+
+        job_id = await queue.enqueue(str(upload), "gini_ratio", 2023)
+        await queue._queue.join()
+        job = await queue.get_job(job_id)
+        await queue.stop()
+
+        assert failures == [job_id]
+        assert job["status"] == "completed"
@@ -0,0 +1,66 @@
+"""
+Unit tests for the startup index bootstrap.
+"""
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from app.db import indexes
+
+
+class FakeCollection:
+    """Collection stub that rejects indexes on one field."""
+
+    def __init__(self, name: str, reject: str = None):
+        self.name = name
+        self.reject = reject
+        self.created = []
+
+    async def create_index(self, keys, **options):
+        if keys == self.reject:
+            raise OperationFailure("Index build failed: duplicate key")
+        self.created.append(keys)
+
+    async def index_information(self):
+        return {}
+
+
+class FakeDatabase:
+    """Database stub returning one FakeCollection per name."""
+
+    def __init__(self, reject: dict = None):
+        self.reject = reject or {}
+        self.collections = {}
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(name, self.reject.get(name))
+        return self.collections[name]
+
+    __getattr__ = __getitem__
+
+
+class TestCreateIndexes:
+    """Test cases for idempotent index provisioning."""
+
+    @pytest.mark.asyncio
+    async def test_covers_indicator_collections(self):
+        """Test every indicator collection gets the year indexes."""
+        db = FakeDatabase()
+        await indexes.create_indexes(db)
+
+        for name in indexes.INDICATOR_COLLECTIONS:
+            assert "tahun" in db[name].created
+        assert "properties.id" in db["provinces"].created
+        assert indexes.get_index_status()["state"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_failed_index_is_reported(self):
+        """Test one failing index does not stop the remaining ones."""
+        db = FakeDatabase(reject={"configs": "key"})
+        await indexes.create_indexes(db)
+
+        status = indexes.get_index_status()
+        assert status["state"] == "degraded"
+        assert [f["collection"] for f in status["failed"]] == ["configs"]
+        assert db["import_batches"].created
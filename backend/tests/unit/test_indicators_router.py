@@ -0,0 +1,61 @@
+"""
+Unit tests for the generic indicator write endpoints.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.routers import indicators
+
+
+class FakeCollection:
+    def __init__(self, matched):
+        self.matched = matched
+
+    async def update_one(self, query, update):
+        return SimpleNamespace(matched_count=self.matched)
+
+    async def delete_one(self, query):
+        return SimpleNamespace(deleted_count=self.matched)
+
+
+@pytest.fixture
+def refreshed(monkeypatch):
+    """Patch the database and record refreshed years."""
+    years = []
+    state = {"matched": 1}
+
+    async def get_database():
+        return {"indeks_pembangunan_manusia": FakeCollection(state["matched"])}
+
+    async def refresh_year(year):
+        years.append(year)
+
+    monkeypatch.setattr(indicators, "get_database", get_database)
+    monkeypatch.setattr(indicators.year_based_scoring_service, "refresh_year", refresh_year)
+    return years, state
+
+
+class TestIndicatorWrites:
+    """Test cases for score refreshes after indicator edits."""
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_refresh_year(self, refreshed):
+        """Test successful writes rebuild the affected year's scores."""
+        years, _ = refreshed
+
+        await indicators.update_indicator_data("ipm", "31", 2024, {"value": 75.1})
+        await indicators.delete_indicator_data("ipm", "31", 2023)
+
+        assert years == [2024, 2023]
+
+    @pytest.mark.asyncio
+    async def test_missing_row_does_not_refresh(self, refreshed):
+        """Test a 404 leaves the scores alone."""
+        years, state = refreshed
+        state["matched"] = 0
+
+        with pytest.raises(indicators.HTTPException):
+            await indicators.delete_indicator_data("ipm", "31", 2024)
+        assert years == []
@@ -0,0 +1,134 @@
+"""
+Unit tests for pre-encoded, pre-compressed responses.
+"""
+
+import gzip
+import json
+
+import pytest
+from starlette.requests import Request
+
+from app.common import precompressed
+from app.common.precompressed import build_json_payload, precompressed_response
+from app.services.geo_service import GeoService
+
+CONTENT = {"type": "FeatureCollection", "features": [{"id": "11", "name": "Aceh"}] * 50}
+
+
+def make_request(**headers):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+class TestPrecompressedResponse:
+    """Test cases for encoding negotiation and revalidation."""
+
+    def test_gzip_when_accepted(self, monkeypatch):
+        """Test gzip is served when brotli is unavailable."""
+        monkeypatch.setattr(precompressed, "brotli", None)
+        payload = build_json_payload(CONTENT)
+
+        response = precompressed_response(make_request(accept_encoding="gzip, deflate"), payload, "public")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.body)) == CONTENT
+        assert response.headers["etag"] == f'"{payload.etag}-gzip"'
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_brotli_preferred(self):
+        """Test br wins over gzip when both are accepted."""
+        brotli = pytest.importorskip("brotli")
+        payload = build_json_payload(CONTENT)
+
+        response = precompressed_response(make_request(accept_encoding="gzip, br"), payload, "public")
+
+        assert response.headers["content-encoding"] == "br"
+        assert json.loads(brotli.decompress(response.body)) == CONTENT
+
+    def test_identity_fallback(self):
+        """Test clients without (or refusing) compression get the plain body."""
+        payload = build_json_payload(CONTENT)
+
+        for request in (make_request(), make_request(accept_encoding="gzip;q=0, br;q=0")):
+            response = precompressed_response(request, payload, "public, max-age=60")
+            assert "content-encoding" not in response.headers
+            assert response.body == payload.body
+            assert response.headers["cache-control"] == "public, max-age=60"
+
+    def test_not_modified(self):
+        """Test a matching If-None-Match gets an empty 304."""
+        payload = build_json_payload(CONTENT)
+
+        response = precompressed_response(
+            make_request(accept_encoding="gzip", if_none_match=f'W/"{payload.etag}-gzip"'),
+            payload,
+            "public",
+        )
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == f'"{payload.etag}-gzip"'
+
+    def test_stale_etag(self):
+        """Test a different ETag gets the full body."""
+        payload = build_json_payload(CONTENT)
+
+        response = precompressed_response(make_request(if_none_match='"stale"'), payload, "public")
+
+        assert response.status_code == 200
+        assert response.body == payload.body
+
+
+class TestGeoServicePayloads:
+    """Test cases for cached boundary payloads."""
+
+    @pytest.mark.asyncio
+    async def test_province_lookup(self, tmp_path):
+        """Test provinces resolve by feature ID or code to their encoded feature."""
+        features = [
+            {"type": "Feature", "id": fid, "properties": {"KODE_PROV": code}, "geometry": None}
+            for fid, code in (("91", "91"), ("91-A", "91"))
+        ]
+        source = tmp_path / "provinces.json"
+        source.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+        service = GeoService(str(source))
+
+        by_code = await service.get_region_payload("91", "full")
+        by_id = await service.get_region_payload("91-A", "full")
+
+        assert json.loads(by_code.body)["id"] == "91"
+        assert json.loads(by_id.body)["id"] == "91-A"
+        assert await service.get_region_payload("99", "full") is None
+        assert await service.get_geojson_payload("full") is await service.get_geojson_payload("full")
+
+    @pytest.mark.asyncio
+    async def test_builds_do_not_wait_on_each_other(self, tmp_path, monkeypatch):
+        """Test a slow TopoJSON build does not hold up province payloads."""
+        import asyncio
+        import sys
+
+        source = tmp_path / "provinces.json"
+        feature = {"type": "Feature", "id": "11", "properties": {"KODE_PROV": "11"}, "geometry": None}
+        source.write_text(json.dumps({"type": "FeatureCollection", "features": [feature]}))
+        service = GeoService(str(source))
+        release = asyncio.Event()
+        geo_module = sys.modules[GeoService.__module__]
+
+        async def slow_run(func, *args):
+            if func is geo_module.build_topojson_payload:
+                await release.wait()
+            return func(*args)
+
+        monkeypatch.setattr(geo_module, "run_in_process", slow_run)
+        topojson = asyncio.create_task(service.get_topojson_payload("full"))
+        await asyncio.sleep(0)
+
+        province = await asyncio.wait_for(service.get_region_payload("11", "full"), timeout=1)
+
+        assert json.loads(province.body)["id"] == "11"
+        assert not topojson.done()
+        release.set()
+        await topojson
@@ -0,0 +1,29 @@
+"""
+Unit tests for batched province name enrichment.
+"""
+
+import pytest
+
+from app.services import province_names
+
+
+class TestEnrichWithProvinceNames:
+    """Test cases for page-level province name enrichment."""
+
+    @pytest.mark.asyncio
+    async def test_single_lookup_per_page(self, monkeypatch):
+        """Test all records of a page are resolved with one lookup."""
+        lookups = []
+
+        async def fake_get_province_names(province_ids):
+            ids = sorted(set(province_ids))
+            lookups.append(ids)
+            return {"11": "ACEH"}
+
+        monkeypatch.setattr(province_names, "get_province_names", fake_get_province_names)
+        records = [{"province_id": "11"}, {"province_id": "11"}, {"province_id": "99"}]
+
+        result = await province_names.enrich_with_province_names(records)
+
+        assert lookups == [["11", "99"]]
+        assert [r["province_name"] for r in result] == ["ACEH", "ACEH", None]
@@ -0,0 +1,105 @@
+"""
+Unit tests for province name normalization and resolution.
+"""
+
+import pandas as pd
+import pytest
+
+from app.services.province_resolver import (
+    ProvinceResolver,
+    normalize_province_name,
+    normalize_province_names,
+)
+
+
+class TestNormalizeProvinceName:
+    """Test cases for province name normalization."""
+
+    def test_prefixes_are_expanded(self):
+        """Test BPS prefixes map onto the canonical names."""
+        assert normalize_province_name("Prov. Aceh") == "ACEH"
+        assert normalize_province_name("KEP. RIAU") == "KEPULAUAN RIAU"
+        assert normalize_province_name("DI Yogyakarta") == "DAERAH ISTIMEWA YOGYAKARTA"
+
+    def test_dki_is_untouched(self):
+        """Test DKI is not mistaken for the DI prefix."""
+        assert normalize_province_name("  dki   jakarta ") == "DKI JAKARTA"
+
+    def test_vectorized_matches_scalar(self):
+        """Test the column version agrees with the scalar one row by row."""
+        names = pd.Series(["Prov. Aceh", "KEP. RIAU", None, "Prov. Aceh", "  dki   jakarta "], index=[5, 6, 7, 8, 9])
+
+        result = normalize_province_names(names)
+
+        assert list(result.index) == [5, 6, 7, 8, 9]
+        assert result.tolist() == [normalize_province_name(name) for name in names]
+
+
+class TestProvinceResolver:
+    """Test cases for index lookups and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_and_invalidate(self, monkeypatch):
+        """Test lookups hit the cached index until it is invalidated."""
+        resolver = ProvinceResolver()
+        loads = []
+
+        async def fake_load():
+            loads.append(1)
+            return {"KEPULAUAN RIAU": "21"}, {"21": "KEPULAUAN RIAU"}
+
+        monkeypatch.setattr(resolver, "_load", fake_load)
+        assert await resolver.resolve("Kep. Riau") == "21"
+        assert await resolver.resolve("Atlantis") is None
+        assert await resolver.get_name("21") == "KEPULAUAN RIAU"
+        assert len(loads) == 1
+
+        resolver.invalidate()
+        await resolver.resolve("Kep. Riau")
+        assert len(loads) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_registry_reloads(self, monkeypatch):
+        """Test the registry is reloaded once the TTL has passed."""
+        resolver = ProvinceResolver()
+        loads = []
+
+        async def fake_load():
+            loads.append(1)
+            return {"ACEH": "11"}, {"11": "ACEH"}
+
+        monkeypatch.setattr(resolver, "_load", fake_load)
+        await resolver.get_names(["11"])
+        resolver._loaded_at -= resolver.TTL_SECONDS
+        assert await resolver.get_names(["11", "99"]) == {"11": "ACEH"}
+        assert len(loads) == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_collection_falls_back_to_bps_codes(self, monkeypatch):
+        """Test an empty provinces collection still resolves names and is cached."""
+        from app.services import province_resolver as resolver_module
+
+        queries = []
+
+        class EmptyCursor:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                raise StopAsyncIteration
+
+        class Provinces:
+            def find(self, *args):
+                queries.append(args)
+                return EmptyCursor()
+
+        async def get_database():
+            return {"provinces": Provinces()}
+
+        monkeypatch.setattr(resolver_module, "get_database", get_database)
+        resolver = ProvinceResolver()
+
+        assert await resolver.resolve("Prov. Aceh") == "11"
+        assert await resolver.resolve("Papua Barat Daya") == "96"
+        assert await resolver.get_name("31") == "DKI Jakarta"
+        assert len(queries) == 1
@@ -0,0 +1,83 @@
+"""
+Unit tests for score recomputation.
+"""
+
+import pytest
+
+from app.tasks import recompute
+
+
+class FakeIndicatorsRepository:
+    """Indicators for two regions, the first leading in 2020 only."""
+
+    async def find_by_year(self, year):
+        if year not in (2020, 2021):
+            return []
+        values = {"31": 80.0, "11": 60.0} if year == 2020 else {"31": 60.0, "11": 80.0}
+        return [
+            {"indicator_code": "HDI", "region_code": code, "value": value}
+            for code, value in values.items()
+        ]
+
+
+class FakeScoresRepository:
+    def __init__(self):
+        self.bulk_calls = []
+        self.ranking_reads = []
+
+    async def bulk_upsert(self, year, scores):
+        self.bulk_calls.append((year, [dict(s) for s in scores]))
+        return len(scores)
+
+    async def find_rankings(self, year):
+        self.ranking_reads.append(year)
+        return []
+
+
+class FakeConfigsRepository:
+    async def find_by_key(self, key):
+        return None
+
+
+@pytest.fixture
+def scores_repo(monkeypatch):
+    repo = FakeScoresRepository()
+
+    async def get_indicators():
+        return FakeIndicatorsRepository()
+
+    async def get_scores():
+        return repo
+
+    async def get_configs():
+        return FakeConfigsRepository()
+
+    monkeypatch.setattr(recompute, "get_indicators_repository", get_indicators)
+    monkeypatch.setattr(recompute, "get_scores_repository", get_scores)
+    monkeypatch.setattr(recompute, "get_configs_repository", get_configs)
+    return repo
+
+
+class TestRecomputeAllScores:
+    """Test cases for multi-year recomputation."""
+
+    @pytest.mark.asyncio
+    async def test_one_bulk_write_per_year(self, scores_repo):
+        """Test every year with data is saved with a single bulk write."""
+        result = await recompute.recompute_all_scores(2019, 2021, max_workers=2)
+
+        assert sorted(year for year, _ in scores_repo.bulk_calls) == [2020, 2021]
+        assert result["years_processed"] == 2
+        assert result["total_regions"] == 4
+        assert set(result["timings"]) == {2019, 2020, 2021}
+
+    @pytest.mark.asyncio
+    async def test_rank_delta_uses_computed_previous_year(self, scores_repo):
+        """Test rank deltas come from the same run, not stored scores."""
+        await recompute.recompute_all_scores(2020, 2021)
+
+        saved = dict(scores_repo.bulk_calls)
+        ranks_2021 = {s["region_code"]: s for s in saved[2021]}
+        assert ranks_2021["11"]["rank"] == 1
+        assert ranks_2021["11"]["previous_rank"] == 2
+        assert scores_repo.ranking_reads == [2019]
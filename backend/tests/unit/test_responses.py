@@ -0,0 +1,91 @@
+"""
+Unit tests for orjson rendering and trusted-row shaping.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+from app.common.responses import FastJSONResponse, shape_trusted
+from app.routers.regions import RegionResponse
+from app.routers.year_based_scoring import ProvinceScoreDetailed
+
+
+class TestFastJSONResponse:
+    """Test cases for orjson rendering."""
+
+    def test_database_and_numpy_types(self):
+        """Test ObjectId, datetime and numpy values render like the stdlib path."""
+        object_id = ObjectId()
+        response = FastJSONResponse({
+            "_id": object_id,
+            "updated_at": datetime(2025, 1, 1, 12, 30),
+            "count": np.int64(3),
+            "values": np.array([1.5, 2.5]),
+            1: "non-string key",
+        })
+
+        assert json.loads(response.body) == {
+            "_id": str(object_id),
+            "updated_at": "2025-01-01T12:30:00",
+            "count": 3,
+            "values": [1.5, 2.5],
+            "1": "non-string key",
+        }
+
+    def test_datetimes_match_pydantic(self):
+        """Test calculated_at-style values keep the pydantic wire format."""
+        values = [
+            datetime(2025, 1, 1, 12, 30, 0, 123456, tzinfo=timezone.utc),
+            datetime(2025, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=7))),
+            datetime(2025, 1, 1, 12, 30),
+        ]
+        adapter = TypeAdapter(dict)
+        for value in values:
+            expected = adapter.dump_json({"calculated_at": value})
+            assert FastJSONResponse({"calculated_at": value}).body == expected
+
+    def test_nan_becomes_null(self):
+        """Test non-finite floats do not fail the response."""
+        response = FastJSONResponse({"sample": [{"value": float("nan")}, {"value": np.inf}]})
+
+        assert json.loads(response.body) == {"sample": [{"value": None}, {"value": None}]}
+
+
+class TestShapeTrusted:
+    """Test cases for shaping rows without validation."""
+
+    def test_matches_model_dump(self):
+        """Test a region row shapes like the validated model, nested extras included."""
+        row = {
+            "id": "31",
+            "type": "Feature",
+            "properties": {"KODE_PROV": "31", "PROVINSI": "DKI Jakarta", "luas": 664.0},
+            "geometry": {"type": "Polygon", "coordinates": [[[106.7, -6.1], [106.9, -6.1]]], "bbox": [0]},
+            "created_at": datetime(2025, 1, 1),
+            "source": "seed",
+        }
+
+        shaped = shape_trusted(RegionResponse, row)
+
+        assert shaped == RegionResponse(**row).model_dump()
+        assert list(shaped) == list(RegionResponse.model_fields)
+
+    def test_drops_unknown_fields(self):
+        """Test score rows lose fields the response model does not declare."""
+        row = {
+            "_id": ObjectId(),
+            "province_id": "31",
+            "province_name": "DKI Jakarta",
+            "year": 2024,
+            "composite_score": 71.5,
+            "collection_scores": {"IPM": 80.0},
+            "collections_scored": 1,
+            "rank": 1,
+            "calculated_at": datetime(2025, 1, 1),
+        }
+
+        assert shape_trusted(ProvinceScoreDetailed, row) == ProvinceScoreDetailed(**row).model_dump()
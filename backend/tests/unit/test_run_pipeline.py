@@ -0,0 +1,66 @@
+"""
+Unit tests for the full pipeline import stage.
+"""
+
+import pytest
+from pymongo.results import BulkWriteResult
+
+import app.db
+from app.pipelines import run_pipeline
+
+
+class FakeCollection:
+    """Collection stub recording bulk writes and inserts."""
+
+    def __init__(self):
+        self.bulk_writes = []
+        self.inserted = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append((operations, ordered))
+        return BulkWriteResult({"nUpserted": len(operations), "nModified": 0, "upserted": []}, True)
+
+    async def insert_one(self, document):
+        self.inserted.append(document)
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+class TestRunFullPipeline:
+    """Test cases for writing ingested records."""
+
+    @pytest.mark.asyncio
+    async def test_records_are_written_with_one_bulk_write(self, monkeypatch):
+        db = FakeDatabase()
+        refreshed = []
+
+        async def get_database():
+            return db
+
+        async def ingest_from_file(file_path, indicator_code, year, **kwargs):
+            return [
+                {"province_id": "11", "tahun": 2024, "data": 1.0},
+                {"province_id": "12", "tahun": 2024, "data": 2.0},
+                {"province_id": "11", "tahun": 2024, "data": 3.0},
+            ]
+
+        async def refresh_year(year):
+            refreshed.append(year)
+
+        monkeypatch.setattr(app.db, "get_database", get_database)
+        monkeypatch.setattr(run_pipeline.bps_ingester, "ingest_from_file", ingest_from_file)
+        monkeypatch.setattr(run_pipeline.year_based_scoring_service, "refresh_year", refresh_year)
+
+        result = await run_pipeline.run_full_pipeline("ipm.csv", "ipm", 2024)
+
+        assert result.success
+        assert result.records_imported == 2
+        (operations, ordered), = db["indeks_pembangunan_manusia"].bulk_writes
+        assert ordered is False
+        assert [op._doc["$set"]["data"] for op in operations] == [3.0, 2.0]
+        assert refreshed == [2024]
+        assert db["import_logs"].inserted[0]["collection"] == "indeks_pembangunan_manusia"
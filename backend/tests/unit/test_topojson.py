@@ -0,0 +1,101 @@
+"""
+Unit tests for the TopoJSON encoder.
+"""
+
+import json
+import sys
+
+import pytest
+
+from app.pipelines.geo.topojson import OBJECT_NAME, encode_topojson, encode_topojson_bytes
+from app.services.geo_service import GeoService
+
+NORTH = [[0, 0], [0.5, 0.01], [1, 0], [1, 1], [0, 1], [0, 0]]
+SOUTH = [[0, 0], [0, -1], [1, -1], [1, 0], [0.5, 0.01], [0, 0]]
+
+
+def feature(fid, ring):
+    return {
+        "type": "Feature",
+        "id": fid,
+        "properties": {"KODE_PROV": fid},
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+    }
+
+
+def decode_arc(topology, ref):
+    """Absolute coordinates of an arc reference."""
+    scale, translate = topology["transform"]["scale"], topology["transform"]["translate"]
+    arc = topology["arcs"][ref if ref >= 0 else ~ref]
+    x = y = 0
+    points = []
+    for dx, dy in arc:
+        x, y = x + dx, y + dy
+        points.append([x * scale[0] + translate[0], y * scale[1] + translate[1]])
+    return points if ref >= 0 else points[::-1]
+
+
+def decode_ring(topology, refs):
+    points = []
+    for i, ref in enumerate(refs):
+        arc = decode_arc(topology, ref)
+        points.extend(arc if i == 0 else arc[1:])
+    return points
+
+
+class TestEncodeTopojson:
+    """Test cases for TopoJSON encoding."""
+
+    def test_shared_border_encoded_once(self):
+        """Test the common border is one arc used by both provinces."""
+        topology = encode_topojson([feature("A", NORTH), feature("B", SOUTH)])
+
+        geometries = topology["objects"][OBJECT_NAME]["geometries"]
+        north_refs, south_refs = geometries[0]["arcs"][0], geometries[1]["arcs"][0]
+        shared = {r if r >= 0 else ~r for r in north_refs} & {r if r >= 0 else ~r for r in south_refs}
+        assert len(topology["arcs"]) == 3
+        assert len(shared) == 1
+
+    def test_round_trip_within_quantization(self):
+        """Test decoded rings match the input up to the grid size."""
+        topology = encode_topojson([feature("A", NORTH), feature("B", SOUTH)], quantization=1000)
+
+        geometry = topology["objects"][OBJECT_NAME]["geometries"][1]
+        decoded = decode_ring(topology, geometry["arcs"][0])
+        assert geometry["id"] == "B"
+        flat = [v for point in sorted(decoded[:-1]) for v in point]
+        expected = [v for point in sorted(SOUTH[:-1]) for v in point]
+        assert flat == pytest.approx(expected, abs=2e-3)
+        assert decoded[0] == decoded[-1]
+
+    def test_coordinates_are_integer_deltas(self):
+        """Test arcs carry integers only."""
+        topology = encode_topojson([feature("A", NORTH)], quantization=100)
+
+        values = [v for arc in topology["arcs"] for point in arc for v in point]
+        assert all(isinstance(v, int) for v in values)
+
+
+class TestGeoServiceTopojson:
+    """Test cases for cached TopoJSON output."""
+
+    @pytest.mark.asyncio
+    async def test_bytes_built_once(self, tmp_path, monkeypatch):
+        """Test repeat requests reuse the encoded bytes."""
+        source = tmp_path / "provinces.json"
+        source.write_text(json.dumps({"type": "FeatureCollection", "features": [feature("A", NORTH)]}))
+        service = GeoService(str(source))
+        calls = []
+
+        def encode(features, quantization):
+            calls.append(quantization)
+            return encode_topojson_bytes(features, quantization)
+
+        monkeypatch.setattr(sys.modules[GeoService.__module__], "encode_topojson_bytes", encode)
+
+        first = await service.get_topojson("full")
+        second = await service.get_topojson("full")
+
+        assert first is second
+        assert len(calls) == 1
+        assert json.loads(first)["type"] == "Topology"
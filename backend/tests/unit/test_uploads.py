@@ -0,0 +1,59 @@
+"""
+Unit tests for streamed upload handling.
+"""
+
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from app.common.errors import PayloadTooLargeError
+from app.common.uploads import UPLOAD_CHUNK_SIZE, spooled_upload, upload_to_temp_path
+
+
+def make_upload(content: bytes) -> UploadFile:
+    # size is left unset so the limit is enforced while chunks are read
+    return UploadFile(file=io.BytesIO(content), filename="data.csv")
+
+
+class TestSpooledUpload:
+    """Test cases for chunked upload spooling."""
+
+    @pytest.mark.asyncio
+    async def test_size_and_hash_match_content(self):
+        """Test size and SHA-256 are computed across chunks."""
+        content = b"a,b\n" * (UPLOAD_CHUNK_SIZE // 2)
+
+        async with spooled_upload(make_upload(content)) as upload:
+            assert upload.size == len(content)
+            assert upload.sha256 == hashlib.sha256(content).hexdigest()
+            assert upload.file.read() == content
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_upload(self):
+        """Test the limit stops the copy instead of reading everything."""
+        upload = make_upload(b"x" * (3 * UPLOAD_CHUNK_SIZE))
+
+        with pytest.raises(PayloadTooLargeError):
+            async with spooled_upload(upload, max_bytes=UPLOAD_CHUNK_SIZE):
+                pass
+
+        # Only the chunks up to the limit were consumed
+        assert upload.file.tell() == 2 * UPLOAD_CHUNK_SIZE
+
+
+class TestUploadToTempPath:
+    """Test cases for path-based upload handling."""
+
+    @pytest.mark.asyncio
+    async def test_temp_file_is_removed(self):
+        """Test the temp file exists inside the block and is deleted after."""
+        async with upload_to_temp_path(make_upload(b"a,b\n1,2\n"), suffix=".csv") as upload:
+            path = upload.path
+            assert path.endswith(".csv")
+            with open(path, "rb") as f:
+                assert f.read() == b"a,b\n1,2\n"
+
+        assert not os.path.exists(path)
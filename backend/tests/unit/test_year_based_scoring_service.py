@@ -0,0 +1,293 @@
+"""
+Unit tests for the year-based scoring service snapshot cache.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.services import year_based_scoring_service as scoring_module
+from app.services.year_based_scoring_service import YearBasedScoringService
+from app.services.year_scoring_engine import compute_year_snapshot
+
+
+def _make_service(monkeypatch) -> tuple[YearBasedScoringService, list]:
+    """Create a service whose computation is stubbed and counted."""
+    service = YearBasedScoringService()
+    calls = []
+
+    async def fake_compute(year):
+        calls.append(year)
+        return compute_year_snapshot(
+            year,
+            ["indeks_pembangunan_manusia"],
+            [False],
+            {"indeks_pembangunan_manusia": {"11": 70.0, "12": 80.0}},
+        )
+
+    monkeypatch.setattr(service, "compute_year_snapshot", fake_compute)
+    return service, calls
+
+
+class TestYearSnapshotCache:
+    """Test cases for per-year snapshot caching and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_cached(self, monkeypatch):
+        """Test repeated reads compute the year only once."""
+        service, calls = _make_service(monkeypatch)
+        await service.calculate_all_scores_for_year(2024)
+        rows = await service.calculate_all_scores_for_year(2024)
+        assert calls == [2024]
+        assert rows[0]["province_id"] == "12"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_year(self, monkeypatch):
+        """Test invalidating one year only recomputes that year."""
+        service, calls = _make_service(monkeypatch)
+        await service.get_year_snapshot(2023)
+        await service.get_year_snapshot(2024)
+        service.invalidate(2024)
+        await service.get_year_snapshot(2023)
+        await service.get_year_snapshot(2024)
+        assert calls == [2023, 2024, 2024]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_compute_is_not_cached(self, monkeypatch):
+        """Test a computation overlapping a write does not populate the cache."""
+        service = YearBasedScoringService()
+
+        async def racing_compute(year):
+            service.invalidate(year)
+            return compute_year_snapshot(year, ["ipm"], [False], {"ipm": {"11": 1.0}})
+
+        monkeypatch.setattr(service, "compute_year_snapshot", racing_compute)
+        assert await service.get_year_snapshot(2024) is not None
+        assert 2024 not in service._snapshot_cache
+
+    @pytest.mark.asyncio
+    async def test_year_without_data_is_cached(self, monkeypatch):
+        """Test a missing year is not recomputed until a write invalidates it."""
+        service = YearBasedScoringService()
+        calls = []
+
+        async def empty_compute(year):
+            calls.append(year)
+            return None
+
+        monkeypatch.setattr(service, "compute_year_snapshot", empty_compute)
+        assert await service.get_year_snapshot(1999) is None
+        assert await service.get_year_snapshot(1999) is None
+        service.invalidate(1999)
+        assert await service.get_year_snapshot(1999) is None
+        assert calls == [1999, 1999]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_reads_share_one_compute(self, monkeypatch):
+        """Test concurrent reads of an uncached year compute it once."""
+        service = YearBasedScoringService()
+        calls = []
+        release = asyncio.Event()
+
+        async def slow_compute(year):
+            calls.append(year)
+            await release.wait()
+            return compute_year_snapshot(year, ["ipm"], [False], {"ipm": {"11": 1.0}})
+
+        monkeypatch.setattr(service, "compute_year_snapshot", slow_compute)
+        readers = [asyncio.create_task(service.get_year_snapshot(2024)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        snapshots = await asyncio.gather(*readers)
+
+        assert calls == [2024]
+        assert snapshots[0] is snapshots[1] is snapshots[2]
+        assert service._in_flight == {}
+
+
+class TestWatermark:
+    """Test cases for the materialized scores staleness watermark."""
+
+    def test_never_computed_is_stale(self):
+        """Test a year without a status document is stale."""
+        assert YearBasedScoringService._build_watermark(None)["stale"] is True
+
+    def test_data_written_after_compute_is_stale(self):
+        """Test data newer than the last computation marks the year stale."""
+        status = {
+            "computed_at": datetime(2024, 1, 1),
+            "data_updated_at": datetime(2024, 1, 2),
+        }
+        assert YearBasedScoringService._build_watermark(status)["stale"] is True
+
+    def test_fresh_computation(self):
+        """Test a computation after the last write is fresh."""
+        status = {
+            "computed_at": datetime(2024, 1, 2),
+            "data_updated_at": datetime(2024, 1, 1),
+        }
+        assert YearBasedScoringService._build_watermark(status)["stale"] is False
+
+
+class FakeDistinctDatabase:
+    """Database stub answering distinct("tahun") per collection."""
+
+    def __init__(self, years_by_collection):
+        self.years_by_collection = years_by_collection
+        self.calls = []
+
+    def __getitem__(self, name):
+        database = self
+
+        class Collection:
+            async def distinct(self, field):
+                database.calls.append(name)
+                return database.years_by_collection.get(name, [])
+
+        return Collection()
+
+
+class TestYearsIndex:
+    """Test cases for the cached available-years index."""
+
+    @pytest.mark.asyncio
+    async def test_coverage_and_invalidation(self, monkeypatch):
+        """Test years are cached per collection until a write invalidates them."""
+        names = list(YearBasedScoringService.COLLECTION_CONFIGS)
+        years = {name: [2023, 2024] for name in names}
+        years[names[0]] = [2022, 2023, "2024", None]
+        db = FakeDistinctDatabase(years)
+
+        async def fake_get_database():
+            return db
+
+        monkeypatch.setattr(scoring_module, "get_database", fake_get_database)
+        service = YearBasedScoringService()
+
+        coverage = await service.get_year_coverage()
+        assert coverage["years"] == [2022, 2023, 2024]
+        assert coverage["complete_years"] == [2023, 2024]
+        assert coverage["coverage"][names[0]] == [2022, 2023, 2024]
+
+        await service.get_available_years()
+        assert len(db.calls) == len(names)
+
+        service.invalidate(2024)
+        await service.get_available_years()
+        assert len(db.calls) == 2 * len(names)
+
+
+class FakeYearScoresRepository:
+    """Repository stub serving one materialized row per province."""
+
+    def __init__(self, rows, status):
+        self.rows = {row["province_id"]: row for row in rows}
+        self.status = status
+        self.year_reads = 0
+
+    async def find_by_province_and_year(self, province_id, year):
+        return self.rows.get(province_id)
+
+    async def find_by_year(self, year):
+        self.year_reads += 1
+        return list(self.rows.values())
+
+    async def get_status(self, year):
+        return self.status
+
+
+class TestProvinceRankedScore:
+    """Test cases for single-province reads of materialized scores."""
+
+    @pytest.mark.asyncio
+    async def test_reads_single_row(self, monkeypatch):
+        """Test one province is read by key, not by scanning the year."""
+        repo = FakeYearScoresRepository(
+            [{"province_id": "11", "rank": 2}, {"province_id": "12", "rank": 1}],
+            {"computed_at": datetime(2024, 1, 2)},
+        )
+
+        async def get_repo():
+            return repo
+
+        monkeypatch.setattr(scoring_module, "get_year_scores_repository", get_repo)
+        service = YearBasedScoringService()
+
+        row, watermark = await service.get_province_ranked_score("11", 2024)
+        missing, _ = await service.get_province_ranked_score("99", 2024)
+
+        assert row["rank"] == 2
+        assert missing is None
+        assert watermark["stale"] is False
+        assert repo.year_reads == 0
+
+
+class TestScoringDomain:
+    """Test cases for which rows take part in min-max normalization."""
+
+    @pytest.mark.asyncio
+    async def test_aggregate_rows_do_not_stretch_min_max(self, monkeypatch):
+        """Test national and malformed rows are excluded before min/max."""
+        service = YearBasedScoringService()
+        monkeypatch.setattr(service, "COLLECTION_CONFIGS", {
+            "indeks_pembangunan_manusia": {"lower_is_better": False, "display_name": "IPM"},
+        })
+
+        async def get_year_values(year):
+            return {"indeks_pembangunan_manusia": [
+                {"province_id": "11", "value": 70.0},
+                {"province_id": "12", "value": 80.0},
+                {"province_id": "31", "value": 75.0},
+                {"province_id": "00", "value": 100.0},
+                {"province_id": "Indonesia", "value": 0.0},
+            ]}
+
+        async def get_province_names(province_ids):
+            return {}
+
+        monkeypatch.setattr(service, "get_year_values", get_year_values)
+        monkeypatch.setattr(service, "_get_province_names", get_province_names)
+
+        snapshot = await service.compute_year_snapshot(2024)
+
+        assert snapshot.province_ids == ["12", "31", "11"]
+        assert snapshot.min_values.tolist() == [70.0]
+        assert snapshot.max_values.tolist() == [80.0]
+        assert snapshot.composite.tolist() == [100.0, 50.0, 0.0]
+
+
+class TestMongomockBackend:
+    """Test cases for running the scoring reads against mongomock-motor."""
+
+    @pytest.mark.asyncio
+    async def test_compute_year_snapshot_runs_on_mongomock(self, monkeypatch):
+        """Test the value pipeline only uses operators mongomock supports."""
+        mongomock_motor = pytest.importorskip("mongomock_motor")
+        db = mongomock_motor.AsyncMongoMockClient()["regional_gap_test"]
+        await db["indeks_pembangunan_manusia"].insert_many([
+            {"province_id": "11", "tahun": 2024, "data": 70},
+            {"province_id": "12", "tahun": 2024, "data": "80.5"},
+            {"province_id": "31", "tahun": 2024, "data": "-"},
+            {"province_id": "51", "tahun": 2023, "data": 90.0},
+        ])
+        await db["gini_ratio"].insert_many([
+            {"province_id": "11", "tahun": 2024, "data_semester_2": {"total": 0.3}},
+            {"province_id": "12", "tahun": 2024, "data_semester_2": {"total": None}},
+        ])
+
+        async def get_database():
+            return db
+
+        async def get_province_names(province_ids):
+            return {}
+
+        service = YearBasedScoringService()
+        monkeypatch.setattr(scoring_module, "get_database", get_database)
+        monkeypatch.setattr(service, "_get_province_names", get_province_names)
+
+        snapshot = await service.compute_year_snapshot(2024)
+
+        assert sorted(snapshot.province_ids) == ["11", "12"]
+        values = await service.get_collection_data_for_year("indeks_pembangunan_manusia", 2024)
+        assert sorted((row["province_id"], row["value"]) for row in values) == [("11", 70.0), ("12", 80.5)]
@@ -0,0 +1,61 @@
+"""
+Unit tests for the materialized year scores repository.
+"""
+
+import pytest
+from pymongo import ReplaceOne
+
+from app.repositories.year_scores_repo import YearScoresRepository
+
+
+class FakeCollection:
+    """Collection stub recording write calls in order."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.calls.append(("bulk_write", operations, ordered))
+
+    async def delete_many(self, query):
+        self.calls.append(("delete_many", query))
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+def rows(*province_ids):
+    return [
+        {"province_id": pid, "year": 2024, "rank": rank}
+        for rank, pid in enumerate(province_ids, start=1)
+    ]
+
+
+class TestReplaceYear:
+    """Test cases for rewriting a year in place."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_before_dropping_missing_provinces(self):
+        """Test rows are replaced per province, then stale provinces removed."""
+        repo = YearScoresRepository(FakeDatabase())
+
+        written = await repo.replace_year(2024, rows("13", "11"))
+
+        (_, operations, ordered), delete = repo.collection.calls
+        assert written == 2
+        assert not ordered
+        assert operations[0] == ReplaceOne(
+            {"year": 2024, "province_id": "13"}, rows("13")[0], upsert=True
+        )
+        assert delete == ("delete_many", {"year": 2024, "province_id": {"$nin": ["13", "11"]}})
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_clear_year(self):
+        """Test a year without data is cleared without an empty bulk_write."""
+        repo = YearScoresRepository(FakeDatabase())
+
+        assert await repo.replace_year(2024, []) == 0
+        assert repo.collection.calls == [("delete_many", {"year": 2024, "province_id": {"$nin": []}})]
@@ -0,0 +1,136 @@
+"""
+Unit tests for the vectorized year scoring engine.
+"""
+
+import numpy as np
+import pytest
+
+from app.services.year_scoring_engine import (
+    NEUTRAL_SCORE,
+    compute_year_snapshot,
+    min_max_scores,
+)
+
+
+DISPLAY_NAMES = {"gini": "Gini", "ipm": "IPM"}
+
+
+class TestMinMaxScores:
+    """Test cases for column-wise min-max scoring."""
+
+    def test_higher_is_better(self):
+        """Test higher raw values get higher scores."""
+        raw = np.array([[0.0], [50.0], [100.0]])
+        scores, min_values, max_values = min_max_scores(raw, np.array([False]))
+        assert scores[:, 0].tolist() == [0.0, 50.0, 100.0]
+        assert min_values[0] == 0.0
+        assert max_values[0] == 100.0
+
+    def test_lower_is_better(self):
+        """Test lower raw values get higher scores."""
+        raw = np.array([[0.0], [50.0], [100.0]])
+        scores, _, _ = min_max_scores(raw, np.array([True]))
+        assert scores[:, 0].tolist() == [100.0, 50.0, 0.0]
+
+    def test_constant_column_is_neutral(self):
+        """Test identical values all receive the neutral score."""
+        raw = np.array([[7.0], [7.0], [np.nan]])
+        scores, _, _ = min_max_scores(raw, np.array([False]))
+        assert scores[0, 0] == NEUTRAL_SCORE
+        assert scores[1, 0] == NEUTRAL_SCORE
+        assert np.isnan(scores[2, 0])
+
+    def test_empty_column_stays_missing(self):
+        """Test a collection without data produces no scores."""
+        raw = np.array([[1.0, np.nan], [2.0, np.nan]])
+        scores, min_values, _ = min_max_scores(raw, np.array([False, False]))
+        assert np.isnan(scores[:, 1]).all()
+        assert np.isnan(min_values[1])
+
+
+class TestComputeYearSnapshot:
+    """Test cases for ranking and composite scores."""
+
+    def test_no_data_returns_none(self):
+        """Test a year without values yields no snapshot."""
+        result = compute_year_snapshot(2024, ["gini", "ipm"], [True, False], {})
+        assert result is None
+
+    def test_composite_and_rank(self):
+        """Test composites average available scores and rows are ranked."""
+        snapshot = compute_year_snapshot(
+            2024,
+            ["gini", "ipm"],
+            [True, False],
+            {
+                "gini": {"11": 0.30, "12": 0.40, "13": 0.32},
+                "ipm": {"11": 70.0, "12": 80.0},
+            },
+        )
+
+        rows = snapshot.to_rows(DISPLAY_NAMES)
+        assert [row["province_id"] for row in rows] == ["13", "11", "12"]
+        assert [row["rank"] for row in rows] == [1, 2, 3]
+
+        # 13: gini 80 only; 11: gini 100, ipm 0; 12: gini 0, ipm 100
+        assert rows[0]["composite_score"] == 80.0
+        assert rows[0]["collections_scored"] == 1
+        assert rows[0]["collection_scores"] == {"Gini": 80.0}
+        assert rows[1]["composite_score"] == 50.0
+        assert rows[2]["composite_score"] == 50.0
+
+    def test_position_of(self):
+        """Test province lookup by ID."""
+        snapshot = compute_year_snapshot(
+            2024, ["ipm"], [False], {"ipm": {"11": 60.0, "12": 80.0}}
+        )
+        assert snapshot.position_of("12") == 0
+        assert snapshot.position_of("99") is None
+        assert snapshot.to_row(1, DISPLAY_NAMES)["province_name"] == "Unknown"
+
+    def test_breakdown_matches_row(self):
+        """Test a breakdown carries the same composite and rank as the row."""
+        snapshot = compute_year_snapshot(
+            2024,
+            ["gini", "ipm"],
+            [True, False],
+            {"gini": {"11": 0.30, "12": 0.40}, "ipm": {"11": 70.0}},
+        )
+        position = snapshot.position_of("12")
+        breakdown = snapshot.to_breakdown(position, DISPLAY_NAMES)
+        row = snapshot.to_row(position, DISPLAY_NAMES)
+
+        assert breakdown["rank"] == row["rank"] == 2
+        assert breakdown["composite_score"] == row["composite_score"]
+        assert breakdown["collections"] == [{
+            "collection": "gini",
+            "display_name": "Gini",
+            "raw_value": 0.40,
+            "score": 0.0,
+            "min_value": 0.30,
+            "max_value": 0.40,
+            "lower_is_better": True,
+        }]
+
+    def test_overlay_with_rank_delta(self):
+        """Test overlay entries carry rank, delta and the requested metric."""
+        collections = ["gini", "ipm"]
+        previous = compute_year_snapshot(
+            2023, collections, [True, False], {"ipm": {"11": 80.0, "12": 60.0}}
+        )
+        snapshot = compute_year_snapshot(
+            2024,
+            collections,
+            [True, False],
+            {"gini": {"11": 0.40, "12": 0.30}, "ipm": {"11": 70.0, "12": 75.0, "13": 80.0}},
+        )
+
+        overlay = snapshot.to_overlay("gini", previous)
+
+        # Composites: 13 -> 100, 12 -> 75, 11 -> 0; 2023 ranked 11 above 12
+        assert overlay["12"] == {"score": 75.0, "rank": 2, "delta": 0, "metric": 100.0}
+        assert overlay["11"]["delta"] == -2
+        assert overlay["13"]["delta"] is None
+        assert overlay["13"]["metric"] is None
+        with pytest.raises(KeyError):
+            snapshot.to_overlay("unknown")
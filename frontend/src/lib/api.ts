@@ -131,6 +131,12 @@ export interface CSVImportResponse {
     success: boolean;
     message: string;
   }>;
+  skipped_count: number;
+  skipped_rows: Array<{
+    province_name: string;
+    success: boolean;
+    message: string;
+  }>;
   message: string;
 }
 